@@ -1,11 +1,41 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
+from src.config.settings import BaseConfig
 from src.utils.exceptions import SeaceScraperError
 
+from .routers.cronograma import router as cronograma_router
+from .routers.datasets import router as datasets_router
 from .routers.health import router as health_router
 from .routers.jobs import router as jobs_router
+from .routers.nomenclatura import router as nomenclatura_router
+from .routers.options import router as options_router
+from .routers.procesos import router as procesos_router
 from .routers.scrape import router as scrape_router
+from .services.scraper_service import mantener_opciones_actualizadas
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Opciones del buscador cargadas de entrada para validar /scrape/regional
+    tarea_opciones = (
+        asyncio.create_task(mantener_opciones_actualizadas(), name="options:refresh")
+        if BaseConfig.OPTIONS_AUTO_REFRESH
+        else None
+    )
+    try:
+        yield
+    finally:
+        if tarea_opciones is not None:
+            tarea_opciones.cancel()
+            try:
+                await tarea_opciones
+            except asyncio.CancelledError:
+                pass
 
 
 def create_app() -> FastAPI:
@@ -13,6 +43,7 @@ def create_app() -> FastAPI:
         title="SEACE Scraper API",
         version="0.1.0",
         description="API para ejecutar scrapers de SEACE (Playwright) y exponer resultados.",
+        lifespan=lifespan,
     )
 
     @app.exception_handler(SeaceScraperError)
@@ -22,6 +53,11 @@ def create_app() -> FastAPI:
     app.include_router(health_router)
     app.include_router(jobs_router)
     app.include_router(scrape_router)
+    app.include_router(datasets_router)
+    app.include_router(procesos_router)
+    app.include_router(options_router)
+    app.include_router(nomenclatura_router)
+    app.include_router(cronograma_router)
     return app
 
 
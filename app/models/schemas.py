@@ -4,7 +4,8 @@ Schemas (Pydantic) para requests/responses de la API.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -13,6 +14,30 @@ class HealthResponse(BaseModel):
     status: str = Field(default="ok")
 
 
+class LimitadorResponse(BaseModel):
+    tasa: float = Field(..., description="Solicitudes por segundo por host (0 = sin límite)")
+    rafaga: float
+    hosts: Dict[str, Dict[str, float]] = Field(
+        ..., description="Por host: solicitudes, esperas, espera_total_s, espera_max_s"
+    )
+
+
+class ConcurrenciaResponse(BaseModel):
+    limite: int = Field(..., description="Jobs de scraping que pueden correr a la vez ahora")
+    minimo: int
+    maximo: int
+    en_curso: int
+    en_espera: int
+    latencia_objetivo_s: float
+    latencia_media_s: Optional[float] = None
+    respuestas: int
+    lentas: int
+    timeouts: int
+    errores_http: int
+    aumentos: int
+    reducciones: int
+
+
 class JobCreateResponse(BaseModel):
     job_id: str
     status: str
@@ -39,6 +64,28 @@ class RegionalScrapeRequest(BaseModel):
     anio: str = Field(..., min_length=4, max_length=4, description="Ej: 2025")
     output_csv: Optional[str] = Field(default=None, description="Nombre del CSV (opcional)")
     debug: bool = Field(default=False, description="Habilita modo debug (más artefactos/logs)")
+    concurrencia_shards: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=8,
+        description="Contextos paginando en paralelo (opcional, usa SEACE_SHARD_CONCURRENCY)",
+    )
+    modo: Literal["full", "count"] = Field(
+        default="full",
+        description="'full' extrae todas las filas; 'count' solo lee el total del paginador",
+    )
+    incremental: bool = Field(
+        default=False,
+        description="Solo pagina hasta los procesos ya presentes en el CSV existente y los combina",
+    )
+    since: Optional[datetime] = Field(
+        default=None,
+        description="Refresca solo procesos publicados desde esta fecha (implica scraping incremental)",
+    )
+    output_format: Literal["csv", "parquet", "both"] = Field(
+        default="csv",
+        description="Formato del dataset generado: CSV, Parquet tipado o ambos",
+    )
 
 
 class RegionalScrapeResponse(BaseModel):
@@ -46,17 +93,120 @@ class RegionalScrapeResponse(BaseModel):
     anio: str
     total_registros: int
     csv_path: Optional[str] = None
+    parquet_path: Optional[str] = None
+
+
+class RegionalCountResponse(BaseModel):
+    departamento: str
+    anio: str
+    modo: str = "count"
+    total_registros: int
+    total_paginas: int
+    registros_por_pagina: int
+    consultado_en: str
+    desde_cache: bool
+
+
+class DatasetChangesResponse(BaseModel):
+    departamento: str
+    anio: str
+    since: Optional[str] = None
+    total_cambios: int
+    inserts: int
+    updates: int
+    deletes: int
+    next_cursor: Optional[str] = None
+    cambios: List[Dict[str, Any]]
+
+
+class DatasetCatalogEntry(BaseModel):
+    departamento: str
+    anio: str
+    version: str
+    formato: str
+    path: str
+    filas: int
+    paginas: int
+    iniciado_en: str
+    finalizado_en: str
+    bytes: int
+    sha256: str
+
+
+class DatasetCatalogResponse(BaseModel):
+    total: int
+    datasets: List[DatasetCatalogEntry]
+
+
+class ProcesosResponse(BaseModel):
+    total: int = Field(..., description="Filas en esta página")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor para la página siguiente (None si es la última)")
+    items: List[Dict[str, Any]]
+
+
+class ProcesosSearchResponse(BaseModel):
+    q: str
+    total: int
+    items: List[Dict[str, Any]]
+
+
+class CronogramaProximosResponse(BaseModel):
+    desde: str = Field(..., description="Inicio de la ventana (hora de SEACE)")
+    hasta: str = Field(..., description="Fin de la ventana (hora de SEACE)")
+    total: int
+    items: List[Dict[str, Any]]
+
+
+class OptionsResponse(BaseModel):
+    departamentos: List[str]
+    anios: List[str]
+    actualizado_en: str
 
 
 class NomenclaturaScrapeRequest(BaseModel):
     nomenclatura: str = Field(..., min_length=3, description="Ej: SIE-SIE-1-2026-SEDAPAR-1")
     debug: bool = Field(default=False)
+    resolver_links: bool = Field(
+        default=False,
+        description="Resolver todos los links de descarga en el job (si no, usar /nomenclatura/{nomenclatura}/documentos/{uuid}/link)",
+    )
+    usar_cache: bool = Field(
+        default=True,
+        description="Devolver la ficha cacheada si sigue vigente (o si su firma de documentos no cambió)",
+    )
+    archivar: bool = Field(
+        default=False,
+        description="Descargar los documentos al archivo por contenido (SHA-256); implica resolver_links",
+    )
 
 
 class NomenclaturaScrapeResponse(BaseModel):
     nomenclatura: str
     cronograma: List[Dict[str, str]]
     documentos: Dict[str, Any]
+    desde_cache: Optional[str] = None
+    archivo: Optional[List[Dict[str, Any]]] = None
+
+
+class NomenclaturaBatchRequest(BaseModel):
+    nomenclaturas: List[str] = Field(..., min_length=1, max_length=500)
+    concurrencia: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=8,
+        description="Contextos del navegador buscando a la vez (por defecto SEACE_NOMENCLATURA_BATCH_CONCURRENCY)",
+    )
+    resolver_links: bool = Field(default=False)
+    usar_cache: bool = Field(default=True)
+    archivar: bool = Field(default=False)
+    debug: bool = Field(default=False)
+
+
+class DocumentoLinkResponse(BaseModel):
+    nomenclatura: str
+    uuid: str
+    link_descarga: str
+    desde_cache: bool
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,44 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Query
+
+from src.scrapers.ficha import ZONA_SEACE
+from src.storage.sqlite_store import FORMATO_FECHA_ISO
+
+from ..models.schemas import CronogramaProximosResponse
+from ..services.storage import proceso_store
+
+router = APIRouter(prefix="/cronograma", tags=["cronograma"])
+
+
+@router.get("/proximos", response_model=CronogramaProximosResponse)
+async def proximos_cierres(
+    horas: int = Query(default=72, ge=1, le=24 * 90, description="Ventana desde ahora, en horas"),
+    departamento: Optional[str] = Query(default=None, description="Ej: AREQUIPA"),
+    etapa: Optional[str] = Query(default=None, description='Texto de la etapa (ej: "propuesta")'),
+    limit: int = Query(default=500, ge=1, le=5000),
+) -> CronogramaProximosResponse:
+    """
+    Etapas del cronograma que terminan en las próximas `horas`, de la más próxima a la más lejana.
+
+    Responde desde el índice de cronogramas que llenan los jobs de nomenclatura
+    (sin abrir el navegador); solo aparecen las fichas extraídas alguna vez.
+    """
+    desde = datetime.now(ZONA_SEACE).replace(microsecond=0)
+    hasta = desde + timedelta(hours=horas)
+    items = await asyncio.to_thread(
+        proceso_store.proximos_cierres,
+        desde,
+        hasta,
+        departamento=departamento,
+        etapa=etapa,
+        limit=limit,
+    )
+    return CronogramaProximosResponse(
+        desde=desde.strftime(FORMATO_FECHA_ISO),
+        hasta=hasta.strftime(FORMATO_FECHA_ISO),
+        total=len(items),
+        items=items,
+    )
@@ -0,0 +1,116 @@
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from src.storage.arrow_export import (
+    MEDIA_TYPE_ARROW_STREAM,
+    lotes_desde_parquet,
+    lotes_desde_store,
+    stream_ipc,
+)
+
+from ..models.schemas import DatasetCatalogEntry, DatasetCatalogResponse, DatasetChangesResponse
+from ..services.storage import proceso_store, publicador_datasets, registro_cambios
+
+router = APIRouter(prefix="/datasets", tags=["datasets"])
+
+
+@router.get("", response_model=DatasetCatalogResponse)
+async def list_datasets(
+    departamento: Optional[str] = Query(default=None, description="Ej: AREQUIPA"),
+    anio: Optional[str] = Query(default=None, min_length=4, max_length=4, description="Ej: 2026"),
+    todas_las_versiones: bool = Query(default=False, description="Incluye versiones anteriores a LATEST"),
+) -> DatasetCatalogResponse:
+    """
+    Lista los datasets publicados desde el catálogo (filas, páginas, tiempos,
+    tamaño, sha256 y formato de cada archivo), sin leer el directorio de datos.
+    """
+    datasets = await asyncio.to_thread(
+        proceso_store.listar_datasets,
+        departamento=departamento,
+        anio=anio,
+        todas_las_versiones=todas_las_versiones,
+    )
+    return DatasetCatalogResponse(
+        total=len(datasets), datasets=[DatasetCatalogEntry(**dataset) for dataset in datasets]
+    )
+
+
+@router.get("/{departamento}/{anio}/changes", response_model=DatasetChangesResponse)
+async def get_dataset_changes(
+    departamento: str,
+    anio: str,
+    since: Optional[datetime] = Query(default=None, description="Solo cambios posteriores a esta fecha (ISO)"),
+    limit: int = Query(default=1000, ge=1, le=10000),
+    cursor: Optional[str] = Query(default=None, description="`next_cursor` de la página anterior"),
+) -> DatasetChangesResponse:
+    """
+    Devuelve altas, cambios y bajas de procesos entre snapshots de un departamento/año.
+
+    Sin `since` devuelve el log completo (el primer snapshot aparece como inserts),
+    de a `limit` eventos: para la siguiente página se envía el `next_cursor` de la
+    respuesta anterior con el mismo `since`.
+    """
+    if not registro_cambios.existe(departamento, anio):
+        raise HTTPException(
+            status_code=404,
+            detail=f"No hay snapshots registrados para {departamento.upper()}/{anio}",
+        )
+
+    try:
+        eventos, next_cursor = await asyncio.to_thread(
+            registro_cambios.pagina_cambios,
+            departamento,
+            anio,
+            since=since,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return DatasetChangesResponse(
+        departamento=departamento.upper(),
+        anio=anio,
+        since=since.isoformat() if since else None,
+        total_cambios=len(eventos),
+        inserts=sum(1 for evento in eventos if evento["op"] == "insert"),
+        updates=sum(1 for evento in eventos if evento["op"] == "update"),
+        deletes=sum(1 for evento in eventos if evento["op"] == "delete"),
+        next_cursor=next_cursor,
+        cambios=eventos,
+    )
+
+
+@router.get("/{departamento}/{anio}.arrow")
+async def get_dataset_arrow(departamento: str, anio: str) -> StreamingResponse:
+    """
+    Exporta el dataset de un departamento/año como stream Arrow IPC.
+
+    Se arma desde el almacén SQLite (siempre al día con el último scraping) o, si
+    no tiene filas para ese departamento/año, desde el Parquet de la última
+    versión publicada del dataset. Se envía de a record batch.
+    """
+    departamento = departamento.upper()
+    filename = f"procesos_{departamento}_{anio}.arrow"
+
+    if await asyncio.to_thread(proceso_store.contar, departamento, anio):
+        lotes = lotes_desde_store(proceso_store, departamento, anio)
+    else:
+        dir_latest = publicador_datasets.dir_latest(departamento, anio)
+        parquets = sorted(dir_latest.glob("*.parquet")) if dir_latest else []
+        if not parquets:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No hay datos almacenados ni Parquet para {departamento}/{anio}",
+            )
+        lotes = lotes_desde_parquet(parquets[0])
+
+    return StreamingResponse(
+        stream_ipc(lotes),
+        media_type=MEDIA_TYPE_ARROW_STREAM,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,6 +1,9 @@
 from fastapi import APIRouter
 
-from ..models.schemas import HealthResponse
+from src.utils.concurrencia import controlador_seace
+from src.utils.rate_limit import limitador_hosts
+
+from ..models.schemas import ConcurrenciaResponse, HealthResponse, LimitadorResponse
 
 router = APIRouter(tags=["health"])
 
@@ -9,3 +12,14 @@ router = APIRouter(tags=["health"])
 async def health() -> HealthResponse:
     return HealthResponse(status="ok")
 
+
+@router.get("/health/limitador", response_model=LimitadorResponse)
+async def limitador() -> LimitadorResponse:
+    """Tiempo que las solicitudes esperaron en el limitador de hosts desde que arrancó el proceso."""
+    return LimitadorResponse(**limitador_hosts.metricas())
+
+
+@router.get("/health/concurrencia", response_model=ConcurrenciaResponse)
+async def concurrencia() -> ConcurrenciaResponse:
+    """Estado del control AIMD: límite actual de jobs simultáneos y las señales de SEACE que lo movieron."""
+    return ConcurrenciaResponse(**controlador_seace.metricas())
@@ -1,7 +1,11 @@
+import hashlib
 from pathlib import Path
+from typing import Literal, Optional
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import FileResponse, Response
+
+from src.storage.comprimidos import elegir_variante
 
 from ..models.schemas import JobResultResponse, JobStatusResponse
 from ..services.job_manager import job_manager
@@ -32,12 +36,42 @@ async def get_job_result(job_id: str) -> JobResultResponse:
     return JobResultResponse(job_id=rec.id, status=rec.status, result=rec.result, error=rec.error)
 
 
+# Formato -> (clave en el resultado del job, media type)
+_FORMATOS_DESCARGA = {
+    "csv": ("csv_path", "text/csv"),
+    "parquet": ("parquet_path", "application/vnd.apache.parquet"),
+}
+
+
+def _etag(path: Path) -> str:
+    """ETag de un archivo a partir de su tamaño y fecha de modificación."""
+    stat = path.stat()
+    return '"' + hashlib.md5(f"{stat.st_mtime_ns}-{stat.st_size}".encode()).hexdigest() + '"'
+
+
+def _etag_coincide(if_none_match: str, etag: str) -> bool:
+    etiquetas = {etiqueta.strip().removeprefix("W/") for etiqueta in if_none_match.split(",")}
+    return "*" in etiquetas or etag in etiquetas
+
+
 @router.get("/{job_id}/download")
-async def download_job_csv(job_id: str) -> FileResponse:
+async def download_job_csv(
+    job_id: str,
+    formato: Optional[Literal["csv", "parquet"]] = Query(
+        default=None,
+        description="Archivo a descargar (por defecto CSV si el job lo generó, si no Parquet)",
+    ),
+    accept_encoding: Optional[str] = Header(default=None),
+    if_none_match: Optional[str] = Header(default=None),
+) -> Response:
     """
-    Descarga el archivo CSV generado por un job de tipo 'regional'.
+    Descarga el dataset generado por un job de tipo 'regional' (CSV o Parquet).
     
     El job debe estar completado (status: 'succeeded') y ser de tipo 'regional'.
+    
+    El CSV se sirve precomprimido (zstd o gzip) si el cliente lo acepta y la
+    variante existe. Soporta `Range` para reanudar descargas y `If-None-Match`
+    (304 si el archivo no cambió).
     """
     rec = await job_manager.get(job_id)
     if not rec:
@@ -55,27 +89,49 @@ async def download_job_csv(job_id: str) -> FileResponse:
             detail=f"El job aún no está completado. Estado actual: {rec.status}"
         )
     
-    if not rec.result or "csv_path" not in rec.result:
+    result = rec.result or {}
+    if formato is None:
+        formato = "parquet" if "parquet_path" in result and "csv_path" not in result else "csv"
+    clave, media_type = _FORMATOS_DESCARGA[formato]
+    
+    if clave not in result:
         raise HTTPException(
             status_code=404,
-            detail="No se encontró el archivo CSV en el resultado del job"
+            detail=f"No se encontró el archivo {formato.upper()} en el resultado del job"
         )
     
-    csv_path = Path(rec.result["csv_path"])
-    if not csv_path.exists():
+    path = Path(result[clave])
+    if not path.exists():
         raise HTTPException(
             status_code=404,
-            detail=f"El archivo CSV no existe en la ruta: {csv_path}"
+            detail=f"El archivo {formato.upper()} no existe en la ruta: {path}"
         )
     
     # Obtener el nombre del archivo para el header Content-Disposition
-    filename = csv_path.name
+    filename = path.name
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    
+    if formato == "csv":
+        path, content_encoding = elegir_variante(path, accept_encoding)
+        headers["Vary"] = "Accept-Encoding"
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
+    
+    # Cada variante tiene su propio ETag (los bytes servidos son distintos)
+    etag = _etag(path)
+    headers["ETag"] = etag
+    if if_none_match and _etag_coincide(if_none_match, etag):
+        return Response(
+            status_code=304,
+            headers={clave: valor for clave, valor in headers.items() if clave in ("ETag", "Vary")},
+        )
     
+    # FileResponse atiende `Range` / `If-Range` (206) usando el mismo ETag
     return FileResponse(
-        path=str(csv_path),
+        path=str(path),
         filename=filename,
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        media_type=media_type,
+        headers=headers,
     )
 
 
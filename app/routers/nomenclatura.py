@@ -0,0 +1,32 @@
+from fastapi import APIRouter, HTTPException, Path, Query
+
+from src.utils.exceptions import ElementNotFoundError
+
+from ..models.schemas import DocumentoLinkResponse
+from ..services.scraper_service import run_documento_link
+
+router = APIRouter(prefix="/nomenclatura", tags=["nomenclatura"])
+
+
+@router.get("/{nomenclatura}/documentos/{uuid}/link", response_model=DocumentoLinkResponse)
+async def get_documento_link(
+    nomenclatura: str,
+    # Se usa dentro de un selector CSS: solo caracteres de un uuid
+    uuid: str = Path(..., pattern=r"^[A-Za-z0-9_-]+$"),
+    debug: bool = Query(default=False),
+) -> DocumentoLinkResponse:
+    """
+    Link de descarga de un documento de la ficha, resuelto bajo demanda y cacheado.
+
+    El `uuid` es el que devuelve el job de `/scrape/nomenclatura` en cada documento.
+    """
+    try:
+        link, desde_cache = await run_documento_link(nomenclatura=nomenclatura, uuid=uuid, debug=debug)
+    except ElementNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return DocumentoLinkResponse(
+        nomenclatura=nomenclatura,
+        uuid=uuid,
+        link_descarga=link,
+        desde_cache=desde_cache,
+    )
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException, Query
+
+from ..models.schemas import JobCreateResponse, OptionsResponse
+from ..services.job_manager import job_manager
+from ..services.scraper_service import obtener_opciones_cacheadas, run_options_refresh
+
+router = APIRouter(prefix="/options", tags=["options"])
+
+
+@router.get("", response_model=OptionsResponse)
+async def get_options() -> OptionsResponse:
+    """
+    Departamentos y años de convocatoria válidos del buscador (desde cache).
+
+    Se leen al iniciar la API y se refrescan en segundo plano; si aún no se
+    cargaron, lanzar `POST /options/refresh`.
+    """
+    opciones = obtener_opciones_cacheadas()
+    if opciones is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Opciones no disponibles; ejecute POST /options/refresh",
+        )
+    return OptionsResponse(**opciones)
+
+
+@router.post("/refresh", response_model=JobCreateResponse)
+async def refresh_options(debug: bool = Query(default=False)) -> JobCreateResponse:
+    """Lanza un job que vuelve a leer las opciones del buscador y actualiza la cache."""
+    async def fn():
+        return await run_options_refresh(debug=debug)
+
+    job = await job_manager.create_job(job_type="options", fn=fn)
+    return JobCreateResponse(job_id=job.id, status=job.status)
@@ -0,0 +1,72 @@
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from ..models.schemas import ProcesosResponse, ProcesosSearchResponse
+from ..services.storage import proceso_store
+
+router = APIRouter(prefix="/procesos", tags=["procesos"])
+
+
+@router.get("", response_model=ProcesosResponse)
+async def list_procesos(
+    departamento: Optional[str] = Query(default=None, description="Ej: AREQUIPA"),
+    anio: Optional[str] = Query(default=None, min_length=4, max_length=4, description="Ej: 2026"),
+    entidad: Optional[str] = Query(default=None, description="Prefijo del nombre de la entidad"),
+    objeto: Optional[str] = Query(default=None, description="Objeto de contratación (ej: Obra)"),
+    moneda: Optional[str] = Query(default=None, description="Ej: Soles"),
+    fecha_desde: Optional[datetime] = Query(default=None, description="Publicados desde (ISO)"),
+    fecha_hasta: Optional[datetime] = Query(default=None, description="Publicados hasta (ISO)"),
+    fields: Optional[str] = Query(default=None, description="Columnas separadas por coma (ej: nomenclatura,entidad)"),
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[str] = Query(default=None, description="`next_cursor` de la página anterior"),
+) -> ProcesosResponse:
+    """
+    Consulta los procesos almacenados, del más reciente al más antiguo.
+
+    Pagina por cursor (keyset sobre fecha de publicación e id): para la siguiente
+    página se envía el `next_cursor` de la respuesta anterior con los mismos filtros.
+    """
+    campos = [campo.strip() for campo in fields.split(",") if campo.strip()] if fields else None
+    try:
+        items, next_cursor = await asyncio.to_thread(
+            proceso_store.consultar,
+            departamento=departamento,
+            anio=anio,
+            entidad=entidad,
+            objeto_contratacion=objeto,
+            moneda=moneda,
+            fecha_desde=fecha_desde,
+            fecha_hasta=fecha_hasta,
+            campos=campos,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return ProcesosResponse(total=len(items), next_cursor=next_cursor, items=items)
+
+
+@router.get("/search", response_model=ProcesosSearchResponse)
+async def search_procesos(
+    q: str = Query(..., min_length=1, description='Ej: "agua potable" o "mantenim*"'),
+    departamento: Optional[str] = Query(default=None, description="Ej: AREQUIPA"),
+    anio: Optional[str] = Query(default=None, min_length=4, max_length=4, description="Ej: 2026"),
+    limit: int = Query(default=50, ge=1, le=500),
+) -> ProcesosSearchResponse:
+    """
+    Búsqueda de texto completo en la descripción del objeto y la entidad.
+
+    Ignora tildes y mayúsculas, ordena por relevancia y resalta las coincidencias con <mark>.
+    """
+    try:
+        items = await asyncio.to_thread(
+            proceso_store.buscar, q, departamento=departamento, anio=anio, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return ProcesosSearchResponse(q=q, total=len(items), items=items)
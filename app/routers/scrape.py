@@ -1,36 +1,73 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+
+from src.storage.parquet import ruta_parquet
 
 from ..models.schemas import (
     JobCreateResponse,
+    NomenclaturaBatchRequest,
     NomenclaturaScrapeRequest,
     RegionalScrapeRequest,
 )
 from ..services.job_manager import job_manager
-from ..services.scraper_service import run_nomenclatura_scrape, run_regional_scrape
+from ..services.scraper_service import (
+    run_nomenclatura_batch,
+    run_nomenclatura_scrape,
+    run_regional_count,
+    run_regional_scrape,
+    validar_parametros_regionales,
+)
 
 router = APIRouter(prefix="/scrape", tags=["scrape"])
 
 
 @router.post("/regional", response_model=JobCreateResponse)
 async def scrape_regional(payload: RegionalScrapeRequest) -> JobCreateResponse:
+    # Falla antes de ocupar un worker/navegador si el departamento o año no existen
+    try:
+        validar_parametros_regionales(payload.departamento, payload.anio)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    async def fn_count():
+        conteo = await run_regional_count(
+            departamento=payload.departamento,
+            anio=payload.anio,
+            debug=payload.debug,
+        )
+        return {
+            "departamento": payload.departamento,
+            "anio": payload.anio,
+            "modo": "count",
+            **conteo,
+        }
+
     async def fn():
         total, csv_path = await run_regional_scrape(
             departamento=payload.departamento,
             anio=payload.anio,
             output_csv=payload.output_csv,
             debug=payload.debug,
+            concurrencia_shards=payload.concurrencia_shards,
+            incremental=payload.incremental,
+            since=payload.since,
+            output_format=payload.output_format,
         )
-        return {
+        result = {
             "departamento": payload.departamento,
             "anio": payload.anio,
             "total_registros": total,
-            "csv_path": csv_path,
+            "output_format": payload.output_format,
         }
+        if payload.output_format in ("csv", "both"):
+            result["csv_path"] = csv_path
+        if payload.output_format in ("parquet", "both") and csv_path:
+            result["parquet_path"] = str(ruta_parquet(csv_path))
+        return result
 
     job = await job_manager.create_job(
         job_type="regional",
-        fn=fn,
-        meta={"departamento": payload.departamento, "anio": payload.anio},
+        fn=fn_count if payload.modo == "count" else fn,
+        meta={"departamento": payload.departamento, "anio": payload.anio, "modo": payload.modo},
     )
     return JobCreateResponse(job_id=job.id, status=job.status)
 
@@ -38,11 +75,19 @@ async def scrape_regional(payload: RegionalScrapeRequest) -> JobCreateResponse:
 @router.post("/nomenclatura", response_model=JobCreateResponse)
 async def scrape_nomenclatura(payload: NomenclaturaScrapeRequest) -> JobCreateResponse:
     async def fn():
-        result = await run_nomenclatura_scrape(nomenclatura=payload.nomenclatura, debug=payload.debug)
+        result = await run_nomenclatura_scrape(
+            nomenclatura=payload.nomenclatura,
+            debug=payload.debug,
+            resolver_links=payload.resolver_links,
+            usar_cache=payload.usar_cache,
+            archivar=payload.archivar,
+        )
         return {
             "nomenclatura": payload.nomenclatura,
             "cronograma": result["cronograma"],
             "documentos": result["documentos"],
+            "desde_cache": result["desde_cache"],
+            "archivo": result["archivo"],
         }
 
     job = await job_manager.create_job(
@@ -52,3 +97,35 @@ async def scrape_nomenclatura(payload: NomenclaturaScrapeRequest) -> JobCreateRe
     )
     return JobCreateResponse(job_id=job.id, status=job.status)
 
+
+
+@router.post("/nomenclatura/batch", response_model=JobCreateResponse)
+async def scrape_nomenclatura_batch(payload: NomenclaturaBatchRequest) -> JobCreateResponse:
+    # Sin repetidas y en el orden recibido
+    nomenclaturas = list(dict.fromkeys(n.strip() for n in payload.nomenclaturas if n.strip()))
+    if not nomenclaturas:
+        raise HTTPException(status_code=422, detail="Debe indicar al menos una nomenclatura")
+
+    async def fn():
+        resultados = await run_nomenclatura_batch(
+            nomenclaturas=nomenclaturas,
+            debug=payload.debug,
+            concurrencia=payload.concurrencia,
+            resolver_links=payload.resolver_links,
+            usar_cache=payload.usar_cache,
+            archivar=payload.archivar,
+        )
+        exitosos = sum(1 for resultado in resultados if resultado["status"] == "succeeded")
+        return {
+            "total": len(resultados),
+            "exitosos": exitosos,
+            "fallidos": len(resultados) - exitosos,
+            "resultados": resultados,
+        }
+
+    job = await job_manager.create_job(
+        job_type="nomenclatura_batch",
+        fn=fn,
+        meta={"total": len(nomenclaturas)},
+    )
+    return JobCreateResponse(job_id=job.id, status=job.status)
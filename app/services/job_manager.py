@@ -15,6 +15,8 @@ from datetime import datetime, timezone
 from typing import Any, Awaitable, Callable, Dict, Optional
 from uuid import uuid4
 
+from src.utils.concurrencia import ControladorAIMD, controlador_seace
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -37,9 +39,11 @@ class JobRecord:
 
 
 class JobManager:
-    def __init__(self) -> None:
+    def __init__(self, controlador: Optional[ControladorAIMD] = None) -> None:
         self._jobs: Dict[str, JobRecord] = {}
         self._lock = asyncio.Lock()
+        # Si hay controlador, los jobs quedan "queued" hasta que les toque turno
+        self._controlador = controlador
 
     async def create_job(self, *, job_type: str, fn: JobFn, meta: Optional[Dict[str, Any]] = None) -> JobRecord:
         job_id = str(uuid4())
@@ -57,8 +61,14 @@ class JobManager:
             self._jobs[job_id] = record
 
         async def runner() -> None:
-            await self._set_status(job_id, "running")
+            if self._controlador is not None:
+                try:
+                    await self._controlador.adquirir()
+                except asyncio.CancelledError:
+                    await self._set_status(job_id, "cancelled")
+                    raise
             try:
+                await self._set_status(job_id, "running")
                 result = await fn()
                 await self._set_result(job_id, result=result)
             except asyncio.CancelledError:
@@ -66,6 +76,9 @@ class JobManager:
                 raise
             except Exception as e:  # pragma: no cover (varía según runtime)
                 await self._set_error(job_id, error=str(e))
+            finally:
+                if self._controlador is not None:
+                    self._controlador.liberar()
 
         task = asyncio.create_task(runner(), name=f"job:{job_type}:{job_id}")
         async with self._lock:
@@ -110,5 +123,5 @@ class JobManager:
             rec.updated_at = _now_iso()
 
 
-job_manager = JobManager()
+job_manager = JobManager(controlador=controlador_seace)
 
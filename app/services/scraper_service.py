@@ -4,11 +4,49 @@ Servicios de aplicación: orquestación de scrapers (src/) para la API.
 
 from __future__ import annotations
 
+import asyncio
+import math
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.scrapers.nomenclatura import NomenclaturaScraper
+from src.config.settings import BaseConfig
+from src.scrapers.ficha import clave_nomenclatura, firma_documentos, parsear_fecha_cronograma, ttl_ficha
+from src.scrapers.nomenclatura import NomenclaturaScraper, ResolvedorLinksDocumento
 from src.scrapers.regional import RegionalScraper
+from src.selectors.regional import REGISTROS_POR_PAGINA
+from src.storage.comprimidos import precomprimir
+from src.storage.documentos import archivar_documentos
+from src.storage.parquet import escribir_parquet, ruta_parquet
+from src.storage.catalogo import describir_version
+from src.storage.sinks import MetricasSink, PageSink, SqliteSink
+from src.utils.cache import TTLCache
+from src.utils.concurrencia import controlador_seace
+from src.utils.rate_limit import limitador_hosts
+
+from .job_manager import job_manager
+from .storage import archivo_documentos, proceso_store, publicador_datasets, registro_cambios
+
+# Conteos por (departamento, anio): cambian poco y cuestan una búsqueda completa
+_conteos_cache = TTLCache(ttl=BaseConfig.COUNT_CACHE_TTL)
+
+# Opciones válidas del buscador (departamentos y años). No vencen: las últimas leídas
+# se siguen usando hasta que `mantener_opciones_actualizadas` las reemplace
+_opciones_cache = TTLCache(ttl=math.inf)
+_CLAVE_OPCIONES = "regional"
+
+# Links de descarga ya resueltos, por (nomenclatura, uuid); SEACE los firma, así que vencen
+_links_documentos_cache = TTLCache(ttl=BaseConfig.DOCUMENT_LINK_CACHE_TTL, max_entradas=10_000)
+# (uuid, tipo, nombre) de los documentos vistos, por (nomenclatura, uuid)
+_descargas_documentos_cache = TTLCache(ttl=BaseConfig.DOCUMENT_LINK_CACHE_TTL, max_entradas=10_000)
+# Plantilla de links aprendida una vez y compartida por todos los scrapers de nomenclatura
+_resolvedor_links = ResolvedorLinksDocumento()
+
+# Fichas extraídas por clave de nomenclatura. Cada entrada lleva su propia vigencia
+# (`vigente_hasta`, según la etapa del cronograma); vencida se conserva hasta
+# FICHA_CACHE_MAX_AGE para revalidarla con la firma de documentos.
+_fichas_cache = TTLCache(ttl=BaseConfig.FICHA_CACHE_MAX_AGE, max_entradas=5_000)
 
 
 async def run_regional_scrape(
@@ -17,10 +55,28 @@ async def run_regional_scrape(
     anio: str,
     output_csv: str | None,
     debug: bool,
+    concurrencia_shards: int | None = None,
+    incremental: bool = False,
+    since: datetime | None = None,
+    output_format: str = "csv",
 ) -> Tuple[int, str | None]:
     """
     Ejecuta scraping regional completo.
 
+    Si `concurrencia_shards` (o SEACE_SHARD_CONCURRENCY) es mayor a 1, las páginas
+    se reparten entre varios contextos del mismo navegador.
+
+    Con `incremental` (o `since`) solo se paginan los procesos nuevos respecto al
+    CSV existente del departamento/año y se combinan con él. Si todavía no hay
+    un dataset previo, se hace un scraping completo.
+
+    El CSV es siempre el archivo de trabajo (lo usa el modo incremental). Con
+    `output_format` "parquet" o "both" además se escribe `ruta_parquet(csv_path)`.
+
+    Todo se escribe en un staging propio del job y al final se publica de forma
+    atómica como nueva versión del dataset (ver PublicadorDatasets); el
+    `csv_path` devuelto apunta a esa versión, que ya no cambia.
+
     Returns:
         (total_registros, csv_path)
     
@@ -33,28 +89,51 @@ async def run_regional_scrape(
     
     csv_name = output_csv or f"procesos_{departamento}_{anio}.csv"
     
+    metricas = MetricasSink()
+    sinks: List[PageSink] = [metricas]
+    if BaseConfig.STORE_ENABLED:
+        sinks.append(SqliteSink(proceso_store, departamento, anio))
+    
+    staging = publicador_datasets.preparar_staging()
+    config = BaseConfig()
+    config.DATA_OUTPUT_DIR = str(staging)
+    
     try:
-        async with RegionalScraper(departamento=departamento, anio=anio, debug=debug) as scraper:
+        async with RegionalScraper(
+            departamento=departamento, anio=anio, sinks=sinks, config=config, debug=debug
+        ) as scraper:
             logger.info(f"Iniciando scraping regional: departamento={departamento}, anio={anio}")
             
-            await scraper.navigate_to_seace()
-            await scraper.select_search_type()
-            await scraper.click_busqueda_avanzada()
-            
-            # Orden actual: primero departamento, luego año
-            await scraper.desplegar_boton_para_seleccionar_departamento()
-            await scraper.seleccionar_departamento(departamento)
-            await scraper.desplegar_boton_para_seleccionar_anio_de_convocatoria()
-            await scraper.seleccionar_anio_de_convocatoria(anio)
-
-            # Importante: la UI de SEACE no carga resultados hasta presionar "Buscar"
-            await scraper.click_boton_de_buscar()
+            await scraper.preparar_busqueda(departamento, anio)
             
             logger.info("Parámetros seleccionados, iniciando búsqueda...")
-            df = await scraper.obtener_todas_las_paginas_de_procesos(nombre_archivo_csv=csv_name)
+            csv_path = staging / csv_name
+            existente: Optional[Path] = None
+            if incremental or since is not None:
+                # Base del incremental: la última versión publicada (o el CSV suelto
+                # de antes de versionar). Con `since` también se combina con ella: el
+                # resultado se publica como dataset completo
+                existente = publicador_datasets.ruta_latest(departamento, anio, csv_name)
+                if existente is None:
+                    existente = Path(BaseConfig.DATA_OUTPUT_DIR) / csv_name
+                if not existente.exists():
+                    # Sin base, solo la ventana nueva se publicaría como dataset completo
+                    # (y el CDC marcaría como bajas a todos los demás procesos)
+                    logger.warning(f"No hay dataset previo para {csv_name}: se hará un scraping completo")
+                    existente = None
+            if existente is not None:
+                df = await scraper.obtener_paginas_nuevas_de_procesos(
+                    nombre_archivo_csv=csv_name,
+                    dataset_existente=existente,
+                    since=since,
+                )
+            else:
+                df = await scraper.obtener_todas_las_paginas_por_shards(
+                    nombre_archivo_csv=csv_name,
+                    concurrencia=concurrencia_shards,
+                )
 
             total_registros = int(len(df))
-            csv_path = Path(scraper.config.DATA_OUTPUT_DIR) / csv_name
             
             if total_registros == 0:
                 logger.warning(f"No se encontraron registros para departamento={departamento}, anio={anio}")
@@ -62,33 +141,451 @@ async def run_regional_scrape(
                 # Esto permite que el job se complete exitosamente pero con 0 registros
             else:
                 logger.info(f"Scraping completado: {total_registros} registros encontrados")
+                # El dataset siempre es completo (el incremental se combina con el previo).
+                # Un resultado vacío no se registra: marcaría como bajas a todos los procesos.
+                await asyncio.to_thread(registro_cambios.registrar_snapshot, departamento, anio, df)
+            
+            codificaciones = [c.strip() for c in BaseConfig.DOWNLOAD_ENCODINGS.split(",") if c.strip()]
+            if codificaciones and csv_path.exists():
+                # Una sola vez por dataset; las descargas sirven estos archivos tal cual
+                await asyncio.to_thread(precomprimir, csv_path, codificaciones)
+            
+            if output_format in ("parquet", "both"):
+                parquet_path = await asyncio.to_thread(
+                    escribir_parquet,
+                    df,
+                    ruta_parquet(csv_path),
+                    BaseConfig.PARQUET_PAGES_PER_ROW_GROUP * REGISTROS_POR_PAGINA,
+                )
+                logger.info(f"Parquet guardado en: {parquet_path}")
             
-            return total_registros, str(csv_path)
+            version_dir = await asyncio.to_thread(publicador_datasets.publicar, departamento, anio, staging)
+            await asyncio.to_thread(
+                _registrar_en_catalogo, version_dir, departamento, anio, total_registros, metricas
+            )
+            return total_registros, str(version_dir / csv_name)
             
     except Exception as e:
         logger.error(f"Error en scraping regional: {e}")
         import traceback
         logger.error(traceback.format_exc())
         raise
+    finally:
+        for sink in sinks:
+            sink.cerrar()
+        # Si no se publicó (error o cancelación) el staging sigue ahí
+        publicador_datasets.descartar_staging(staging)
+
+
+def _registrar_en_catalogo(
+    version_dir: Path,
+    departamento: str,
+    anio: str,
+    total_registros: int,
+    metricas: MetricasSink,
+) -> None:
+    """Registra los archivos de la versión publicada y quita las versiones podadas."""
+    entradas = describir_version(
+        version_dir,
+        departamento=departamento,
+        anio=anio,
+        filas=total_registros,
+        paginas=metricas.paginas,
+        iniciado_en=metricas.iniciado_en,
+        finalizado_en=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+    )
+    proceso_store.registrar_archivos_dataset(entradas)
+    proceso_store.podar_catalogo(departamento, anio, publicador_datasets.versiones(departamento, anio))
+
+
+async def run_regional_count(
+    *,
+    departamento: str,
+    anio: str,
+    debug: bool,
+) -> Dict[str, Any]:
+    """
+    Cuenta procesos de un departamento/año leyendo el paginador (sin extraer filas).
+
+    Los conteos se cachean por (departamento, anio) durante SEACE_COUNT_CACHE_TTL segundos.
+
+    Returns:
+        {"total_registros", "total_paginas", "registros_por_pagina", "consultado_en", "desde_cache"}
+    """
+    clave = (departamento.upper(), anio)
+    conteo = _conteos_cache.get(clave)
+    if conteo is not None:
+        return {**conteo, "desde_cache": True}
+
+    async with RegionalScraper(departamento=departamento, anio=anio, debug=debug) as scraper:
+        conteo = await scraper.contar_procesos()
+
+    conteo = {**conteo, "consultado_en": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")}
+    _conteos_cache.set(clave, conteo)
+    return {**conteo, "desde_cache": False}
+
+
+async def run_options_refresh(*, debug: bool) -> Dict[str, Any]:
+    """
+    Lee del buscador los departamentos y años válidos y los guarda en cache.
+
+    Returns:
+        {"departamentos", "anios", "actualizado_en"}
+    """
+    async with RegionalScraper(debug=debug) as scraper:
+        opciones = await scraper.obtener_opciones()
+
+    opciones = {**opciones, "actualizado_en": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")}
+    _opciones_cache.set(_CLAVE_OPCIONES, opciones)
+    return opciones
+
+
+async def mantener_opciones_actualizadas() -> None:
+    """
+    Lee las opciones del buscador al iniciar la API y las vuelve a leer cada
+    SEACE_OPTIONS_CACHE_TTL segundos (SEACE_OPTIONS_REFRESH_RETRY si la lectura falló).
+
+    Cada lectura es un job `options`, que espera turno en el controlador de SEACE
+    como cualquier scraping. Corre hasta que se cancela.
+    """
+    from src.utils.logging import get_logger
+    logger = get_logger(__name__)
+
+    async def fn():
+        return await run_options_refresh(debug=False)
+
+    while True:
+        job = await job_manager.create_job(job_type="options", fn=fn)
+        if job.task is not None:
+            await job.task
+        if job.status == "succeeded":
+            espera = BaseConfig.OPTIONS_CACHE_TTL
+        else:
+            espera = BaseConfig.OPTIONS_REFRESH_RETRY
+            logger.warning(f"No se pudieron leer las opciones del buscador ({job.error}); reintento en {espera}s")
+        await asyncio.sleep(espera)
+
+
+def obtener_opciones_cacheadas() -> Dict[str, Any] | None:
+    """Últimas opciones leídas, o None si todavía no se cargaron."""
+    opciones: Optional[Dict[str, Any]] = _opciones_cache.get(_CLAVE_OPCIONES)
+    return opciones
+
+
+def validar_parametros_regionales(departamento: str, anio: str) -> None:
+    """
+    Valida departamento y año contra las opciones en cache, sin abrir el navegador.
+
+    Usa las últimas opciones leídas aunque tengan más de SEACE_OPTIONS_CACHE_TTL.
+    Solo antes de la primera lectura (al iniciar la API) no se valida: el scraper
+    fallará igual que antes si el valor no existe.
+
+    Raises:
+        ValueError: Si el departamento o el año no están entre las opciones
+    """
+    opciones = obtener_opciones_cacheadas()
+    if opciones is None:
+        return
+    if departamento not in opciones["departamentos"]:
+        sugerencia = ""
+        if departamento.upper() in opciones["departamentos"]:
+            sugerencia = f" ¿Quiso decir '{departamento.upper()}'?"
+        raise ValueError(f"Departamento no válido: '{departamento}'.{sugerencia}")
+    if anio not in opciones["anios"]:
+        raise ValueError(
+            f"Año de convocatoria no válido: '{anio}'. Disponibles: {min(opciones['anios'])}-{max(opciones['anios'])}"
+        )
+
+
+async def _fichas_conocidas(nomenclaturas: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Accesos directos guardados para las nomenclaturas (por clave canónica)."""
+    if not BaseConfig.STORE_ENABLED:
+        return {}
+    fichas = {}
+    for nomenclatura in nomenclaturas:
+        clave = clave_nomenclatura(nomenclatura)
+        acceso = await asyncio.to_thread(proceso_store.obtener_ficha, clave)
+        if acceso:
+            fichas[clave] = acceso
+    return fichas
+
+
+async def _guardar_fichas(fichas: Dict[str, Dict[str, Any]]) -> None:
+    if BaseConfig.STORE_ENABLED and fichas:
+        await asyncio.to_thread(proceso_store.registrar_fichas, fichas)
+
+
+async def _abrir_ficha(scraper: NomenclaturaScraper, nomenclatura: str) -> None:
+    """
+    Abre la ficha de una nomenclatura: directo si hay acceso guardado y sigue
+    sirviendo; si no, por el buscador, guardando el acceso para la próxima vez.
+    """
+    clave = clave_nomenclatura(nomenclatura)
+    acceso = (await _fichas_conocidas([nomenclatura])).get(clave)
+    if acceso:
+        if await scraper.abrir_ficha_directa(acceso):
+            return
+        await asyncio.to_thread(proceso_store.olvidar_ficha, clave)
+
+    await scraper.preparar_buscador()
+    await scraper.ingresar_nomenclatura(nomenclatura)
+    await scraper.click_boton_de_buscar()
+    await scraper.clickear_ficha_seleccion()
+    if scraper.ficha_actual:
+        await _guardar_fichas({clave: scraper.ficha_actual})
+
+
+def _registrar_documentos(nomenclatura: str, documentos: Dict[str, Any]) -> None:
+    for documento in documentos["documentos"]:
+        uuid = documento.get("uuid")
+        if not uuid:
+            continue
+        _descargas_documentos_cache.set(
+            (nomenclatura, uuid), (uuid, documento["tipo"], documento["nombre_archivo"])
+        )
+        if documento.get("link_descarga"):
+            _links_documentos_cache.set((nomenclatura, uuid), documento["link_descarga"])
+
+
+async def _indexar_cronograma(nomenclatura: str, cronograma: List[Dict[str, str]]) -> None:
+    """Guarda las etapas con fechas tipadas para consultar próximos cierres sin scrapear."""
+    if not BaseConfig.STORE_ENABLED:
+        return
+    etapas = [
+        {
+            "etapa": etapa.get("etapa"),
+            "fecha_inicio": parsear_fecha_cronograma(etapa.get("fecha_inicio", "")),
+            "fecha_fin": parsear_fecha_cronograma(etapa.get("fecha_fin", ""), fin_del_dia=True),
+        }
+        for etapa in cronograma
+    ]
+    await asyncio.to_thread(proceso_store.registrar_cronograma, clave_nomenclatura(nomenclatura), etapas)
+
+
+async def _archivar_documentos(nomenclatura: str, documentos: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Descarga los documentos (links ya resueltos) al archivo por contenido y
+    actualiza el manifiesto; lo ya archivado no se vuelve a descargar.
+    """
+    clave = clave_nomenclatura(nomenclatura)
+    ya_archivados = (
+        await asyncio.to_thread(proceso_store.documentos_archivados, clave) if BaseConfig.STORE_ENABLED else {}
+    )
+    entradas = await archivar_documentos(
+        documentos["documentos"],
+        archivo_documentos,
+        concurrencia=BaseConfig.DOCUMENT_FETCH_CONCURRENCY,
+        timeout=BaseConfig.DOCUMENT_FETCH_TIMEOUT,
+        ya_archivados=ya_archivados,
+        limitador=limitador_hosts,
+    )
+    if BaseConfig.STORE_ENABLED:
+        await asyncio.to_thread(proceso_store.registrar_documentos_archivados, clave, entradas)
+    return entradas
+
+
+def _cachear_ficha(nomenclatura: str, datos: Dict[str, Any], resolver_links: bool) -> None:
+    # Los links vencen mucho antes que la ficha: se guardan sin ellos y al servir
+    # se toman de _links_documentos_cache (DOCUMENT_LINK_CACHE_TTL)
+    documentos = [{**documento, "link_descarga": None} for documento in datos["documentos"]["documentos"]]
+    vigencia = ttl_ficha(datos["cronograma"], BaseConfig.FICHA_CACHE_TTL_ACTIVE, BaseConfig.FICHA_CACHE_TTL_IDLE)
+    _fichas_cache.set(
+        clave_nomenclatura(nomenclatura),
+        {
+            "datos": {**datos, "documentos": {**datos["documentos"], "documentos": documentos}},
+            "firma": firma_documentos(documento.get("fecha_publicacion", "") for documento in documentos),
+            "con_links": resolver_links,
+            "vigente_hasta": time.monotonic() + vigencia,
+        },
+    )
+
+
+def _ficha_cacheada(nomenclatura: str, resolver_links: bool) -> Optional[Dict[str, Any]]:
+    """
+    Entrada de cache utilizable para el pedido (vigente o no), o None.
+
+    Los documentos salen con los links que siguen en `_links_documentos_cache`;
+    si se piden links y alguno ya venció, la entrada no sirve.
+    """
+    entrada: Optional[Dict[str, Any]] = _fichas_cache.get(clave_nomenclatura(nomenclatura))
+    if entrada is None or (resolver_links and not entrada["con_links"]):
+        return None
+    documentos = []
+    for documento in entrada["datos"]["documentos"]["documentos"]:
+        link = _links_documentos_cache.get((nomenclatura, documento["uuid"])) if documento.get("uuid") else None
+        if resolver_links and link is None:
+            return None
+        documentos.append({**documento, "link_descarga": link})
+    datos = entrada["datos"]
+    return {**entrada, "datos": {**datos, "documentos": {**datos["documentos"], "documentos": documentos}}}
 
 
 async def run_nomenclatura_scrape(
     *,
     nomenclatura: str,
     debug: bool,
+    resolver_links: bool = False,
+    usar_cache: bool = True,
+    archivar: bool = False,
 ) -> Dict[str, Any]:
     """
     Ejecuta scraping por nomenclatura: cronograma + documentos.
+
+    Por defecto los documentos salen con uuid, tipo y nombre sin resolver los
+    links (no se hace click en ninguno); el link de cada uno se pide aparte con
+    `run_documento_link`. Con `resolver_links` se resuelven todos en el mismo job.
+
+    Con `usar_cache`, una ficha extraída hace poco se devuelve sin abrir el
+    navegador. Vencida (ver `ttl_ficha`), se abre la ficha y solo se compara la
+    firma de documentos (cantidad y última publicación); si no cambió, se
+    renueva la vigencia sin re-extraer.
+
+    Con `archivar`, los links se resuelven y cada documento se descarga al
+    archivo por contenido (ver `archivar_documentos`).
+
+    Returns:
+        cronograma, documentos, `desde_cache` ("vigente", "revalidada" o None) y
+        `archivo` (manifiesto de los documentos archivados, o None)
     """
-    async with NomenclaturaScraper(nomenclatura=nomenclatura, debug=debug) as scraper:
-        await scraper.navigate_to_seace()
-        await scraper.select_search_type()
-        await scraper.click_busqueda_avanzada()
-        await scraper.ingresar_nomenclatura(nomenclatura)
-        await scraper.click_boton_de_buscar()
-        await scraper.clickear_ficha_seleccion()
+    resultado = await _scrapear_ficha(
+        nomenclatura=nomenclatura,
+        debug=debug,
+        resolver_links=resolver_links or archivar,
+        usar_cache=usar_cache,
+    )
+    resultado["archivo"] = await _archivar_documentos(nomenclatura, resultado["documentos"]) if archivar else None
+    return resultado
+
+
+async def _scrapear_ficha(
+    *, nomenclatura: str, debug: bool, resolver_links: bool, usar_cache: bool
+) -> Dict[str, Any]:
+    entrada = _ficha_cacheada(nomenclatura, resolver_links) if usar_cache else None
+    if entrada is not None and time.monotonic() < entrada["vigente_hasta"]:
+        return {**entrada["datos"], "desde_cache": "vigente"}
+
+    async with NomenclaturaScraper(
+        nomenclatura=nomenclatura, debug=debug, resolvedor_links=_resolvedor_links
+    ) as scraper:
+        await _abrir_ficha(scraper, nomenclatura)
+        if entrada is not None:
+            firma = await scraper.obtener_firma_documentos()
+            if firma == entrada["firma"]:
+                _cachear_ficha(nomenclatura, entrada["datos"], entrada["con_links"])
+                return {**entrada["datos"], "desde_cache": "revalidada"}
         cronograma = await scraper.obtener_cronograma()
-        documentos = await scraper.scrapear_documentos_con_links()
+        documentos = await scraper.scrapear_documentos_con_links(resolver_links=resolver_links)
+
+    datos = {"cronograma": cronograma, "documentos": documentos}
+    _registrar_documentos(nomenclatura, documentos)
+    await _indexar_cronograma(nomenclatura, cronograma)
+    _cachear_ficha(nomenclatura, datos, resolver_links)
+    return {**datos, "desde_cache": None}
+
+
+async def run_nomenclatura_batch(
+    *,
+    nomenclaturas: List[str],
+    debug: bool,
+    concurrencia: int | None = None,
+    resolver_links: bool = False,
+    usar_cache: bool = True,
+    archivar: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Extrae muchas nomenclaturas con un solo navegador, reutilizando sesiones
+    (ver NomenclaturaScraper.scrapear_lote).
+
+    Con `usar_cache`, las fichas vigentes en cache no se vuelven a extraer.
+    Con `archivar`, los documentos de cada ficha extraída se archivan al final.
+
+    Returns:
+        Un resultado por nomenclatura, en el mismo orden
+    """
+    resolver_links = resolver_links or archivar
+    resultados: Dict[str, Dict[str, Any]] = {}
+    pendientes = []
+    for nomenclatura in nomenclaturas:
+        entrada = _ficha_cacheada(nomenclatura, resolver_links) if usar_cache else None
+        if entrada is not None and time.monotonic() < entrada["vigente_hasta"]:
+            resultados[nomenclatura] = {
+                "nomenclatura": nomenclatura,
+                "status": "succeeded",
+                **entrada["datos"],
+                "error": None,
+                "desde_cache": "vigente",
+            }
+        else:
+            pendientes.append(nomenclatura)
+
+    if pendientes:
+        async with NomenclaturaScraper(debug=debug, resolvedor_links=_resolvedor_links) as scraper:
+            extraidos = await scraper.scrapear_lote(
+                pendientes,
+                concurrencia=concurrencia,
+                resolver_links=resolver_links,
+                fichas=await _fichas_conocidas(pendientes),
+            )
+            await _guardar_fichas(scraper.fichas_resueltas)
+
+        for resultado in extraidos:
+            resultados[resultado["nomenclatura"]] = {**resultado, "desde_cache": None}
+            if resultado["status"] == "succeeded":
+                _registrar_documentos(resultado["nomenclatura"], resultado["documentos"])
+                await _indexar_cronograma(resultado["nomenclatura"], resultado["cronograma"])
+                _cachear_ficha(
+                    resultado["nomenclatura"],
+                    {"cronograma": resultado["cronograma"], "documentos": resultado["documentos"]},
+                    resolver_links,
+                )
+
+    for resultado in resultados.values():
+        exitoso = archivar and resultado["status"] == "succeeded"
+        resultado["archivo"] = (
+            await _archivar_documentos(resultado["nomenclatura"], resultado["documentos"]) if exitoso else None
+        )
+
+    return [resultados[nomenclatura] for nomenclatura in nomenclaturas]
+
+
+async def run_documento_link(
+    *,
+    nomenclatura: str,
+    uuid: str,
+    debug: bool = False,
+) -> Tuple[str, bool]:
+    """
+    Resuelve (y cachea) el link de descarga de un documento de una ficha.
+
+    Sin navegador si el link está en cache, o si se conoce la tupla del documento
+    y la plantilla de links ya está verificada; si no, abre la ficha y resuelve
+    solo ese documento, con un turno del controlador de SEACE como los jobs.
+
+    Returns:
+        (link_descarga, desde_cache)
+
+    Raises:
+        ElementNotFoundError: Si la ficha no tiene ese documento
+        ScrapingError: Si no se pudo resolver el link
+    """
+    clave = (nomenclatura, uuid)
+    link = _links_documentos_cache.get(clave)
+    if link is not None:
+        return link, True
 
-        return {"cronograma": cronograma, "documentos": documentos}
+    descarga = _descargas_documentos_cache.get(clave)
+    if descarga is not None and _resolvedor_links.lista:
+        link = _resolvedor_links.construir(*descarga)
+    else:
+        await controlador_seace.adquirir()
+        try:
+            async with NomenclaturaScraper(
+                nomenclatura=nomenclatura, debug=debug, resolvedor_links=_resolvedor_links
+            ) as scraper:
+                await _abrir_ficha(scraper, nomenclatura)
+                link = await scraper.obtener_link_documento(uuid)
+        finally:
+            controlador_seace.liberar()
 
+    _links_documentos_cache.set(clave, link)
+    return link, False
@@ -0,0 +1,18 @@
+"""
+Instancias compartidas de persistencia (datasets, cambios) para la API.
+"""
+
+from __future__ import annotations
+
+from src.config.settings import BaseConfig
+from src.storage.cdc import RegistroCambios
+from src.storage.documentos import ArchivoDocumentos
+from src.storage.publicacion import PublicadorDatasets
+from src.storage.sqlite_store import ProcesoStore
+
+registro_cambios = RegistroCambios(BaseConfig.DATA_OUTPUT_DIR)
+proceso_store = ProcesoStore(BaseConfig.SQLITE_DB_PATH)
+publicador_datasets = PublicadorDatasets(
+    BaseConfig.DATA_OUTPUT_DIR, versiones_a_conservar=BaseConfig.DATASET_VERSIONS_TO_KEEP
+)
+archivo_documentos = ArchivoDocumentos(BaseConfig.DOCUMENT_ARCHIVE_DIR)
@@ -26,10 +26,45 @@ class BaseConfig:
     BROWSER_VIEWPORT_WIDTH: int = int(os.getenv('SEACE_VIEWPORT_WIDTH', '1920'))
     BROWSER_VIEWPORT_HEIGHT: int = int(os.getenv('SEACE_VIEWPORT_HEIGHT', '1080'))
     
-    # Delays entre acciones (en segundos)
-    DELAY_BETWEEN_PAGES: float = float(os.getenv('SEACE_DELAY_BETWEEN_PAGES', '2.0'))
-    DELAY_BETWEEN_DOCUMENTS: float = float(os.getenv('SEACE_DELAY_BETWEEN_DOCUMENTS', '0.5'))
-    
+    # Límite de solicitudes por host (navegaciones, AJAX y descargas de todos los jobs)
+    # Solicitudes por segundo (0 = sin límite) y solicitudes seguidas sin espera
+    HOST_RATE_LIMIT: float = float(os.getenv('SEACE_HOST_RATE_LIMIT', '2.0'))
+    HOST_RATE_BURST: float = float(os.getenv('SEACE_HOST_RATE_BURST', '5'))
+
+    # Paginación en paralelo (scraper regional)
+    # Número de contextos que paginan a la vez; 1 = paginación secuencial clásica
+    SHARD_CONCURRENCY: int = int(os.getenv('SEACE_SHARD_CONCURRENCY', '1'))
+    PAGES_PER_SHARD: int = int(os.getenv('SEACE_PAGES_PER_SHARD', '20'))
+    # Páginas capturadas pendientes de parsear antes de frenar la paginación (backpressure)
+    PIPELINE_QUEUE_SIZE: int = int(os.getenv('SEACE_PIPELINE_QUEUE_SIZE', '2'))
+
+    # Jobs de scraping a la vez, ajustado en vivo (AIMD) según latencia y errores de SEACE
+    AIMD_MIN_CONCURRENCY: int = int(os.getenv('SEACE_AIMD_MIN_CONCURRENCY', '1'))
+    AIMD_MAX_CONCURRENCY: int = int(os.getenv('SEACE_AIMD_MAX_CONCURRENCY', '8'))
+    AIMD_INITIAL_CONCURRENCY: int = int(os.getenv('SEACE_AIMD_INITIAL_CONCURRENCY', '2'))
+    # Latencia AJAX (segundos) por encima de la cual se reduce la concurrencia
+    AIMD_LATENCY_TARGET: float = float(os.getenv('SEACE_AIMD_LATENCY_TARGET', '8.0'))
+    AIMD_DECREASE_FACTOR: float = float(os.getenv('SEACE_AIMD_DECREASE_FACTOR', '0.5'))
+    AIMD_COOLDOWN: float = float(os.getenv('SEACE_AIMD_COOLDOWN', '10.0'))
+
+    # Lotes de nomenclaturas: contextos buscando fichas a la vez
+    NOMENCLATURA_BATCH_CONCURRENCY: int = int(os.getenv('SEACE_NOMENCLATURA_BATCH_CONCURRENCY', '2'))
+
+    # Caches (en segundos)
+    COUNT_CACHE_TTL: int = int(os.getenv('SEACE_COUNT_CACHE_TTL', '3600'))
+    # Departamentos/años válidos del buscador (cambian muy rara vez): se leen al iniciar
+    # la API y se vuelven a leer cada OPTIONS_CACHE_TTL, o a los OPTIONS_REFRESH_RETRY si falló
+    OPTIONS_CACHE_TTL: int = int(os.getenv('SEACE_OPTIONS_CACHE_TTL', '86400'))
+    OPTIONS_REFRESH_RETRY: int = int(os.getenv('SEACE_OPTIONS_REFRESH_RETRY', '300'))
+    OPTIONS_AUTO_REFRESH: bool = os.getenv('SEACE_OPTIONS_AUTO_REFRESH', 'true').lower() == 'true'
+    # Links de descarga de documentos resueltos bajo demanda
+    DOCUMENT_LINK_CACHE_TTL: int = int(os.getenv('SEACE_DOCUMENT_LINK_CACHE_TTL', '3600'))
+    # Fichas extraídas por nomenclatura: vigencia con una etapa del cronograma en curso / sin etapa en curso
+    FICHA_CACHE_TTL_ACTIVE: int = int(os.getenv('SEACE_FICHA_CACHE_TTL_ACTIVE', '900'))
+    FICHA_CACHE_TTL_IDLE: int = int(os.getenv('SEACE_FICHA_CACHE_TTL_IDLE', '86400'))
+    # Una ficha vencida se conserva este tiempo para revalidarla sin re-extraer
+    FICHA_CACHE_MAX_AGE: int = int(os.getenv('SEACE_FICHA_CACHE_MAX_AGE', '604800'))
+
     # Logging
     LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
     LOG_DIR: str = os.getenv('LOG_DIR', 'logs')
@@ -38,6 +73,24 @@ class BaseConfig:
     DATA_OUTPUT_DIR: str = os.getenv('DATA_OUTPUT_DIR', 'data')
     DEBUG_DIR: str = os.getenv('DEBUG_DIR', 'debug')
     
+    # Almacén SQLite de procesos (upsert por Nomenclatura)
+    STORE_ENABLED: bool = os.getenv('SEACE_STORE_ENABLED', 'true').lower() == 'true'
+    SQLITE_DB_PATH: str = os.getenv('SEACE_DB_PATH', os.path.join(DATA_OUTPUT_DIR, 'seace.db'))
+    
+    # Archivo por contenido (SHA-256) de los documentos de cada ficha
+    DOCUMENT_ARCHIVE_DIR: str = os.getenv('SEACE_DOCUMENT_ARCHIVE_DIR', os.path.join(DATA_OUTPUT_DIR, 'documentos'))
+    DOCUMENT_FETCH_CONCURRENCY: int = int(os.getenv('SEACE_DOCUMENT_FETCH_CONCURRENCY', '4'))
+    DOCUMENT_FETCH_TIMEOUT: float = float(os.getenv('SEACE_DOCUMENT_FETCH_TIMEOUT', '60'))
+    
+    # Versiones publicadas que se conservan por departamento/año
+    DATASET_VERSIONS_TO_KEEP: int = int(os.getenv('SEACE_DATASET_VERSIONS_TO_KEEP', '5'))
+    
+    # Variantes precomprimidas del CSV para descargas (vacío = no generar)
+    DOWNLOAD_ENCODINGS: str = os.getenv('SEACE_DOWNLOAD_ENCODINGS', 'zstd,gzip')
+    
+    # Parquet: páginas de resultados por row group
+    PARQUET_PAGES_PER_ROW_GROUP: int = int(os.getenv('SEACE_PARQUET_PAGES_PER_ROW_GROUP', '100'))
+    
     @property
     def browser_viewport(self) -> Dict[str, int]:
         """Viewport del navegador."""
@@ -5,16 +5,41 @@ Proporciona funcionalidad común y manejo de recursos.
 
 import asyncio
 import inspect
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from pathlib import Path
+from urllib.parse import urlparse
 
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Playwright
 
 from ..config.settings import BaseConfig
 from ..utils.exceptions import SeaceScraperError, ScrapingError
 from ..utils.logging import setup_logging, get_logger
+from ..utils.rate_limit import limitador_hosts
 from ..utils.wait_strategies import WaitStrategy, ProductionWaitStrategy
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+# Solicitudes que pasan por el limitador de hosts: navegaciones (goto, submits) y
+# AJAX (clicks de PrimeFaces, paginación). Scripts, estilos e imágenes no.
+TIPOS_SOLICITUD_LIMITADOS = frozenset({"document", "xhr", "fetch"})
+
+# Recursos estáticos de JSF/PrimeFaces (scripts, estilos): también terminan en .xhtml
+RUTA_RECURSOS_JSF = "/javax.faces.resource/"
+
+
+def es_endpoint_limitado(url: str) -> bool:
+    """
+    True si la URL se intercepta para el limitador: páginas JSF (`*.xhtml`, que
+    reciben las navegaciones y los POST AJAX de PrimeFaces) y el servlet de
+    descarga de documentos. Los recursos estáticos ni siquiera se enrutan.
+    """
+    ruta = urlparse(url).path
+    if RUTA_RECURSOS_JSF in ruta:
+        return False
+    return ruta.endswith(".xhtml") or "descarga" in ruta.lower()
+
 
 class BaseScraper:
     """
@@ -64,6 +89,8 @@ class BaseScraper:
         
         # Estado del scraper
         self._started = False
+        # False en sesiones adicionales: el navegador pertenece al scraper que las creó
+        self._owns_browser = True
         
         # Configurar logging
         log_file = f"scraper_{self.__class__.__name__.lower()}.log" if not debug else None
@@ -105,26 +132,12 @@ class BaseScraper:
             self.logger.info("Iniciando navegador...")
             self.playwright = await async_playwright().start()
             
-            viewport = self.config.browser_viewport
-            timeouts = self.config.timeouts
-            
             self.browser = await self.playwright.chromium.launch(
                 headless=self.config.BROWSER_HEADLESS
             )
+            self._owns_browser = True
             
-            self.context = await self.browser.new_context(
-                viewport={
-                    'width': viewport['width'],
-                    'height': viewport['height']
-                },
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            self.page = await self.context.new_page()
-            
-            # Configurar timeouts
-            self.page.set_default_timeout(timeouts['element_wait'])
-            self.page.set_default_navigation_timeout(timeouts['page_load'])
+            await self._crear_contexto()
             
             self._started = True
             self.logger.info("Navegador iniciado correctamente")
@@ -133,6 +146,68 @@ class BaseScraper:
             self.logger.error(f"Error al iniciar el navegador: {e}")
             raise ScrapingError(f"Error al iniciar el navegador: {e}") from e
     
+    async def _crear_contexto(self):
+        """Crea un contexto aislado (cookies/sesión JSF propias) y su página en self.browser."""
+        viewport = self.config.browser_viewport
+        timeouts = self.config.timeouts
+        
+        self.context = await self.browser.new_context(
+            viewport={
+                'width': viewport['width'],
+                'height': viewport['height']
+            },
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        )
+        
+        # Toda navegación o AJAX a SEACE de cualquier scraper pide turno al limitador por host
+        await self.context.route(es_endpoint_limitado, self._limitar_solicitud)
+        
+        self.page = await self.context.new_page()
+        
+        # Configurar timeouts
+        self.page.set_default_timeout(timeouts['element_wait'])
+        self.page.set_default_navigation_timeout(timeouts['page_load'])
+    
+    async def _limitar_solicitud(self, route):
+        """Handler de route: espera el turno del host antes de dejar salir la solicitud."""
+        request = route.request
+        if request.resource_type in TIPOS_SOLICITUD_LIMITADOS:
+            espera = await limitador_hosts.adquirir(urlparse(request.url).hostname)
+            if espera > 0:
+                self.logger.debug(f"Limitador: {espera:.2f}s de espera para {request.url}")
+        await route.continue_()
+    
+    async def abrir_sesion_adicional(self, **kwargs) -> "Self":
+        """
+        Crea un scraper del mismo tipo que comparte el navegador pero usa su propio contexto.
+        
+        Útil para paralelizar trabajo sin lanzar otro Chromium: cada contexto mantiene
+        su propia sesión JSF, por lo que puede hacer su propia búsqueda y paginar
+        independientemente. Al cerrarlo solo se cierra su contexto.
+        
+        Args:
+            **kwargs: Argumentos adicionales para el constructor de la subclase
+        
+        Returns:
+            Scraper iniciado sobre un contexto nuevo
+        
+        Raises:
+            ScrapingError: Si hay un error al crear el contexto
+        """
+        self._ensure_started()
+        
+        sesion = self.__class__(config=self.config, debug=self.debug, **kwargs)
+        try:
+            sesion.browser = self.browser
+            sesion._owns_browser = False
+            await sesion._crear_contexto()
+            sesion._started = True
+        except Exception as e:
+            self.logger.error(f"Error al crear sesión adicional: {e}")
+            raise ScrapingError(f"Error al crear sesión adicional: {e}") from e
+        
+        return sesion
+    
     async def navigate_to_seace(self):
         """
         Navega a la página principal de SEACE.
@@ -236,6 +311,16 @@ class BaseScraper:
     async def close(self):
         """Cierra el navegador y libera recursos."""
         try:
+            if not self._owns_browser:
+                # Sesión adicional: solo liberar su contexto, el navegador es compartido
+                if self.context:
+                    await self.context.close()
+                    self.context = None
+                self.browser = None
+                self._started = False
+                self.logger.info("Sesión adicional cerrada correctamente")
+                return
+            
             if self.browser:
                 self.logger.info("Cerrando navegador...")
                 await self.browser.close()
@@ -0,0 +1,172 @@
+"""
+Ficha de selección: acceso directo sin pasar por el buscador y vigencia de lo extraído.
+
+El enlace `fichaSeleccion.gif` de cada resultado no es un link navegable: es un
+submit JSF (`PrimeFaces.addSubmitParam(form, {...}).submit(form)`) con los
+identificadores del proceso (nidConvocatoria, nidProceso, nidSistema, ...).
+Esos parámetros, y la URL de la ficha cuando SEACE deja una navegable, se
+guardan por nomenclatura para abrir la ficha directamente en las consultas
+siguientes (sin búsqueda avanzada ni el "Buscar" protegido por reCAPTCHA).
+
+Cronograma y documentos solo cambian en los cambios de etapa: `ttl_ficha` da
+una vigencia corta mientras hay una etapa en curso y larga cuando no, y
+`firma_documentos` resume la tabla de documentos para revalidar barato.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+from ..selectors.regional import COLUMNAS_ESPERADAS, INDICES_COLUMNAS
+
+# PrimeFaces.addSubmitParam('form',{'clave':'valor',...}).submit('form')
+_PATRON_SUBMIT = re.compile(r"addSubmitParam\(\s*'([^']+)'\s*,\s*\{([^}]*)\}\s*\)")
+_PATRON_PARAMETRO = re.compile(r"'([^']*)'\s*:\s*'([^']*)'")
+
+# Sin este parámetro el submit no identifica a ningún proceso
+PARAMETRO_CONVOCATORIA = "nidConvocatoria"
+
+# Imagen del enlace a la ficha en la columna de acciones
+IMAGEN_FICHA = "fichaSeleccion.gif"
+
+# Reproduce el onclick del enlace a la ficha con los parámetros guardados
+JS_ENVIAR_FICHA = (
+    "({formulario, parametros}) => "
+    "PrimeFaces.addSubmitParam(formulario, parametros).submit(formulario)"
+)
+
+_COLUMNA_NOMENCLATURA = INDICES_COLUMNAS[COLUMNAS_ESPERADAS.index("Nomenclatura")]
+
+
+def clave_nomenclatura(nomenclatura: str) -> str:
+    """Forma canónica de una nomenclatura para indexar (mayúsculas, espacios simples)."""
+    return " ".join((nomenclatura or "").split()).upper()
+
+
+def parsear_accion_ficha(onclick: str) -> Optional[Dict[str, Any]]:
+    """
+    Extrae el formulario y los parámetros del submit JSF de un enlace a la ficha.
+
+    Returns:
+        {"formulario": ..., "parametros": {...}}, o None si no es un submit de ficha
+    """
+    match = _PATRON_SUBMIT.search(onclick or "")
+    if not match:
+        return None
+    parametros = dict(_PATRON_PARAMETRO.findall(match.group(2)))
+    if PARAMETRO_CONVOCATORIA not in parametros:
+        return None
+    return {"formulario": match.group(1), "parametros": parametros}
+
+
+def es_url_ficha(url: Optional[str]) -> bool:
+    """True si la URL abre la ficha por sí sola (GET con parámetros)."""
+    if not url:
+        return False
+    partes = urlparse(url)
+    return "fichaSeleccion" in partes.path and bool(partes.query)
+
+
+def parsear_fichas_resultados(html: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Extrae, del `<tbody>` de resultados del buscador, la acción de ficha de cada fila.
+
+    Args:
+        html: outerHTML del tbody de resultados
+
+    Returns:
+        Nomenclatura (clave canónica) -> {"accion": ..., "url": None}
+    """
+    soup = BeautifulSoup(f"<table>{html}</table>", "lxml")
+    tbody = soup.find("tbody")
+    if tbody is None:
+        return {}
+
+    fichas = {}
+    for fila in tbody.find_all("tr", recursive=False):
+        celdas = fila.find_all("td", recursive=False)
+        if len(celdas) <= _COLUMNA_NOMENCLATURA:
+            continue
+        nomenclatura = clave_nomenclatura(celdas[_COLUMNA_NOMENCLATURA].get_text(" ", strip=True))
+        imagen = fila.find("img", src=lambda src: src and IMAGEN_FICHA in src)
+        enlace = imagen.find_parent("a") if imagen else None
+        accion = parsear_accion_ficha(str(enlace.get("onclick") or "")) if enlace else None
+        if nomenclatura and accion:
+            fichas[nomenclatura] = {"accion": accion, "url": None}
+    return fichas
+
+
+# SEACE publica en hora de Lima (UTC-5, sin horario de verano)
+ZONA_SEACE = timezone(timedelta(hours=-5))
+
+# "28/01/2026 15:09" o "28/01/2026"
+_PATRON_FECHA_CRONOGRAMA = re.compile(r"(\d{2}/\d{2}/\d{4})(?:\s+(\d{1,2}:\d{2}))?")
+
+
+def parsear_fecha_cronograma(texto: str, fin_del_dia: bool = False) -> Optional[datetime]:
+    """
+    Convierte una fecha del cronograma o de documentos a datetime con zona de SEACE.
+
+    Args:
+        texto: Fecha tal como la muestra la ficha
+        fin_del_dia: Si la fecha no trae hora, usar 23:59 en vez de 00:00
+
+    Returns:
+        datetime con zona, o None si no se reconoce
+    """
+    match = _PATRON_FECHA_CRONOGRAMA.search(texto or "")
+    if not match:
+        return None
+    fecha, hora = match.groups()
+    hora = hora or ("23:59" if fin_del_dia else "00:00")
+    try:
+        return datetime.strptime(f"{fecha} {hora}", "%d/%m/%Y %H:%M").replace(tzinfo=ZONA_SEACE)
+    except ValueError:
+        return None
+
+
+def ttl_ficha(
+    cronograma: List[Dict[str, str]],
+    ttl_etapa_activa: float,
+    ttl_sin_etapa_activa: float,
+    ahora: Optional[datetime] = None,
+) -> float:
+    """
+    Vigencia (segundos) de una ficha extraída según su cronograma.
+
+    - Alguna etapa en curso: `ttl_etapa_activa`.
+    - Ninguna en curso: `ttl_sin_etapa_activa`, pero sin pasar del próximo
+      inicio o fin de etapa (ni bajar de `ttl_etapa_activa`).
+    """
+    ahora = ahora or datetime.now(ZONA_SEACE)
+    proximo_cambio: Optional[datetime] = None
+    for etapa in cronograma:
+        inicio = parsear_fecha_cronograma(etapa.get("fecha_inicio", ""))
+        fin = parsear_fecha_cronograma(etapa.get("fecha_fin", ""), fin_del_dia=True)
+        if inicio and fin and inicio <= ahora <= fin:
+            return ttl_etapa_activa
+        for limite in (inicio, fin):
+            if limite and limite > ahora and (proximo_cambio is None or limite < proximo_cambio):
+                proximo_cambio = limite
+
+    if proximo_cambio is None:
+        return ttl_sin_etapa_activa
+    hasta_el_cambio = (proximo_cambio - ahora).total_seconds()
+    return max(ttl_etapa_activa, min(ttl_sin_etapa_activa, hasta_el_cambio))
+
+
+def firma_documentos(fechas_publicacion: Iterable[str]) -> Dict[str, Any]:
+    """
+    Resumen barato de la tabla de documentos: cantidad y última publicación.
+
+    Si coincide con el de una extracción anterior, los documentos no cambiaron.
+    """
+    fechas = list(fechas_publicacion)
+    parseadas = [fecha for fecha in (parsear_fecha_cronograma(texto) for texto in fechas) if fecha]
+    return {
+        "total": len(fechas),
+        "ultima_publicacion": max(parseadas).isoformat() if parseadas else None,
+    }
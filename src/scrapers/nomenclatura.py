@@ -6,9 +6,11 @@ Busca un proceso específico por su nomenclatura y extrae cronograma y documento
 import asyncio
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote, urljoin
 
 from .base import BaseScraper
+from .ficha import JS_ENVIAR_FICHA, clave_nomenclatura, es_url_ficha, firma_documentos, parsear_accion_ficha
 from ..selectors.nomenclatura import (
     SELECTORS,
     CRONOGRAMA_COLUMNS,
@@ -22,6 +24,184 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Formato: javascript:descargaDocGeneral('uuid','tipo','nombre_archivo.ext');
+PATRON_DESCARGA_DOC = re.compile(r"descargaDocGeneral\('([^']+)','([^']+)','([^']+)'\)")
+
+CAMPOS_DESCARGA = ("uuid", "tipo", "nombre")
+
+# Variantes con las que un valor puede aparecer dentro de la URL, en orden de preferencia
+_CODIFICACIONES: Dict[str, Callable[[str], str]] = {
+    "url_componente": lambda valor: quote(valor, safe=""),
+    "url": quote,
+    "literal": lambda valor: valor,
+}
+
+# Un término de una concatenación JS: 'literal', "literal", encodeURIComponent(x) o x
+_TERMINO_JS = r"""(?:'[^']*'|"[^"]*"|encodeURI(?:Component)?\(\s*\w+\s*\)|\w+)"""
+_PATRON_CONCATENACION_JS = re.compile(rf"{_TERMINO_JS}(?:\s*\+\s*{_TERMINO_JS})+")
+
+
+# Extrae las filas de una tabla en un solo `evaluate`. Recibe los selectores y el
+# mapa de columnas (nombre -> índice); las filas con menos de `minimo` celdas
+# vuelven como null. Con `enlace` agrega el onclick y el tamaño del enlace de descarga.
+_JS_FILAS_TABLA = """
+(tabla, {filas, celdas, columnas, minimo, enlace}) => {
+    const texto = (el) => (el ? el.innerText || '' : '').trim();
+    return Array.from(tabla.querySelectorAll(filas)).map((tr) => {
+        const tds = tr.querySelectorAll(celdas);
+        if (tds.length < minimo) {
+            return null;
+        }
+        const fila = {};
+        for (const [nombre, indice] of Object.entries(columnas)) {
+            fila[nombre] = indice < tds.length ? texto(tds[indice]) : '';
+        }
+        if (enlace) {
+            const celda = tds[enlace.columna];
+            const a = celda.querySelector(enlace.selector);
+            fila.tiene_enlace = a !== null;
+            fila.onclick = a ? a.getAttribute('onclick') || '' : '';
+            fila['tamaño'] = texto(celda.querySelector(enlace['tamaño']));
+        }
+        return fila;
+    });
+}
+"""
+
+
+def parsear_descarga_doc(onclick: str) -> Optional[Tuple[str, str, str]]:
+    """Extrae (uuid, tipo, nombre) del onclick `descargaDocGeneral(...)`, o None."""
+    match = PATRON_DESCARGA_DOC.search(onclick or "")
+    if not match:
+        return None
+    uuid, tipo, nombre = match.groups()
+    return uuid, tipo, nombre
+
+
+class ResolvedorLinksDocumento:
+    """
+    Construye los links de descarga de documentos sin hacer click en cada uno.
+
+    La plantilla de URL se aprende una sola vez: del código de
+    `descargaDocGeneral` en la página (`aprender_de_js`) o de una descarga real
+    (`observar`). Solo se usa para construir links después de que una descarga
+    real la confirma; hasta entonces el scraper sigue haciendo click.
+    """
+
+    def __init__(self):
+        self.plantilla: Optional[str] = None
+        self.codificaciones: Dict[str, str] = {}
+        self.verificada = False
+
+    @property
+    def lista(self) -> bool:
+        """True si la plantilla fue confirmada por una descarga real."""
+        return self.plantilla is not None and self.verificada
+
+    def construir(self, uuid: str, tipo: str, nombre: str) -> Optional[str]:
+        """Link de descarga para la tupla del onclick, o None sin plantilla."""
+        if self.plantilla is None:
+            return None
+        valores = dict(zip(CAMPOS_DESCARGA, (uuid, tipo, nombre)))
+        return self.plantilla.format(**{
+            campo: _CODIFICACIONES[self.codificaciones.get(campo, "literal")](valores[campo])
+            for campo in CAMPOS_DESCARGA
+        })
+
+    def observar(self, url: str, uuid: str, tipo: str, nombre: str) -> bool:
+        """
+        Registra el link de una descarga real.
+
+        Si ya hay plantilla, la verifica contra `url` (y la descarta si no
+        coincide); si no la hay, intenta aprenderla de `url`.
+
+        Returns:
+            True si la plantilla quedó verificada
+        """
+        if self.plantilla is not None:
+            if self.construir(uuid, tipo, nombre) == url:
+                if not self.verificada:
+                    logger.info("Plantilla de links de documentos verificada; se omiten los clicks restantes")
+                self.verificada = True
+                return True
+            logger.warning(f"La plantilla de links no coincide con la descarga real ({url}); se descarta")
+            self.plantilla = None
+            self.codificaciones = {}
+            self.verificada = False
+        self._aprender_de_url(url, uuid, tipo, nombre)
+        return False
+
+    def _aprender_de_url(self, url: str, uuid: str, tipo: str, nombre: str) -> None:
+        plantilla = url.replace("{", "{{").replace("}", "}}")
+        codificaciones: Dict[str, str] = {}
+        # El valor más largo primero: evita reemplazar un valor corto dentro de otro
+        for campo, valor in sorted(
+            zip(CAMPOS_DESCARGA, (uuid, tipo, nombre)), key=lambda par: len(par[1]), reverse=True
+        ):
+            for codificacion, codificar in _CODIFICACIONES.items():
+                codificado = codificar(valor).replace("{", "{{").replace("}", "}}")
+                # Solo componentes completos: el tipo "2" no debe reemplazarse dentro de "prod2"
+                patron = re.compile(rf"(?<=[=/&?]){re.escape(codificado)}(?=[&/#;]|$)")
+                if codificado and patron.search(plantilla):
+                    plantilla = patron.sub("{" + campo + "}", plantilla)
+                    codificaciones[campo] = codificacion
+                    break
+        # Sin el uuid en la URL (ej: POST a un endpoint fijo) no hay plantilla posible
+        if "uuid" not in codificaciones:
+            logger.debug(f"No se pudo aprender plantilla de links desde {url}")
+            return
+        self.plantilla = plantilla
+        self.codificaciones = codificaciones
+        logger.debug(f"Plantilla de links aprendida de una descarga: {plantilla}")
+
+    def aprender_de_js(self, codigo: str, url_base: str) -> bool:
+        """
+        Intenta deducir la plantilla del código fuente de `descargaDocGeneral`
+        (una concatenación de literales y parámetros). Queda sin verificar.
+
+        Args:
+            codigo: Fuente de la función (`descargaDocGeneral.toString()`)
+            url_base: URL de la página, para resolver rutas relativas
+
+        Returns:
+            True si se obtuvo una plantilla candidata
+        """
+        firma = re.search(r"function\s*\w*\s*\(([^)]*)\)", codigo or "")
+        if not firma:
+            return False
+        parametros = [p.strip() for p in firma.group(1).split(",") if p.strip()]
+        campos = dict(zip(parametros, CAMPOS_DESCARGA))
+        if not campos:
+            return False
+
+        cuerpo = codigo[firma.end():]
+        for expresion in _PATRON_CONCATENACION_JS.finditer(cuerpo):
+            plantilla, codificaciones = "", {}
+            for termino in re.findall(_TERMINO_JS, expresion.group(0)):
+                if termino[0] in "'\"":
+                    plantilla += termino[1:-1].replace("{", "{{").replace("}", "}}")
+                    continue
+                argumento = re.search(r"\(\s*(\w+)\s*\)", termino)
+                nombre = argumento.group(1) if argumento else termino
+                if nombre not in campos:
+                    break
+                campo = campos[nombre]
+                plantilla += "{" + campo + "}"
+                if termino.startswith("encodeURIComponent"):
+                    codificaciones[campo] = "url_componente"
+                elif termino.startswith("encodeURI"):
+                    codificaciones[campo] = "url"
+                else:
+                    codificaciones[campo] = "literal"
+            else:
+                if "{uuid}" in plantilla and not plantilla.startswith("{"):
+                    self.plantilla = urljoin(url_base, plantilla)
+                    self.codificaciones = codificaciones
+                    self.verificada = False
+                    logger.debug(f"Plantilla de links candidata desde JS: {self.plantilla}")
+                    return True
+        return False
+
 
 class NomenclaturaScraper(BaseScraper):
     """
@@ -37,6 +217,7 @@ class NomenclaturaScraper(BaseScraper):
     def __init__(
         self,
         nomenclatura: Optional[str] = None,
+        resolvedor_links: Optional[ResolvedorLinksDocumento] = None,
         **kwargs
     ):
         """
@@ -44,10 +225,16 @@ class NomenclaturaScraper(BaseScraper):
         
         Args:
             nomenclatura: Nomenclatura a buscar (ej: "SIE-SIE-1-2026-SEDAPAR-1")
+            resolvedor_links: Plantilla de links compartida entre scrapers (opcional)
             **kwargs: Argumentos adicionales para BaseScraper (config, debug, wait_strategy)
         """
         super().__init__(**kwargs)
         self.nomenclatura = nomenclatura
+        self.resolvedor_links = resolvedor_links or ResolvedorLinksDocumento()
+        # Acceso directo ({"accion", "url"}) a la última ficha abierta
+        self.ficha_actual: Optional[Dict[str, Any]] = None
+        # Accesos directos obtenidos durante un lote, por clave de nomenclatura
+        self.fichas_resueltas: Dict[str, Dict[str, Any]] = {}
     
     async def ingresar_nomenclatura(self, nomenclatura: Optional[str] = None):
         """
@@ -154,6 +341,13 @@ class NomenclaturaScraper(BaseScraper):
             if not await ficha_seleccion.is_visible(timeout=timeout):
                 raise ElementNotFoundError("No se encontró la ficha de selección")
             
+            # Guardar el submit JSF del enlace para poder abrir la ficha directo la próxima vez
+            accion = None
+            try:
+                accion = parsear_accion_ficha(await ficha_seleccion.first.get_attribute("onclick") or "")
+            except Exception as e:
+                self.logger.debug(f"No se pudo leer la acción de la ficha: {e}")
+            
             await ficha_seleccion.click()
             self.logger.info("Ficha de selección clickeada, esperando carga...")
             
@@ -161,6 +355,8 @@ class NomenclaturaScraper(BaseScraper):
             await asyncio.sleep(2)  # Delay inicial
             await self.page.wait_for_load_state("networkidle")
             
+            url = self.page.url
+            self.ficha_actual = {"accion": accion, "url": url if es_url_ficha(url) else None}
             self.logger.info("Ficha de selección cargada correctamente")
             
         except ElementNotFoundError:
@@ -169,6 +365,224 @@ class NomenclaturaScraper(BaseScraper):
             self.logger.error(f"Error al clickear ficha de selección: {e}")
             raise ScrapingError(f"Error al clickear ficha de selección: {e}") from e
     
+    async def abrir_ficha_directa(self, ficha: Dict[str, Any]) -> bool:
+        """
+        Abre una ficha sin buscarla: por su URL si es navegable o, si no, repitiendo
+        el submit JSF del enlace desde el formulario del buscador.
+        
+        Args:
+            ficha: Acceso directo guardado ({"accion", "url"})
+        
+        Returns:
+            True si la ficha quedó abierta (se ve el cronograma); False si el
+            acceso ya no sirve y hay que buscar la nomenclatura
+        """
+        self._ensure_started()
+        
+        try:
+            if ficha.get("url"):
+                self.logger.info("Abriendo ficha por URL directa")
+                await self.page.goto(ficha["url"])
+            elif ficha.get("accion"):
+                self.logger.info("Abriendo ficha con la acción guardada (sin búsqueda)")
+                await self.navigate_to_seace()
+                await self.select_search_type()
+                await self.page.evaluate(JS_ENVIAR_FICHA, ficha["accion"])
+            else:
+                return False
+            await self.page.wait_for_load_state("networkidle")
+            
+            tabla_cronograma = self.page.locator(SELECTORS['cronograma_table'])
+            if await tabla_cronograma.is_visible(timeout=self.config.timeouts['element_wait']):
+                self.ficha_actual = {"accion": ficha.get("accion"), "url": ficha.get("url")}
+                return True
+        except Exception as e:
+            self.logger.debug(f"Acceso directo a la ficha falló: {e}")
+        
+        self.logger.info("El acceso directo a la ficha no funcionó; se buscará la nomenclatura")
+        return False
+    
+    async def preparar_buscador(self):
+        """Navega hasta el formulario de búsqueda avanzada (sin buscar)."""
+        await self.navigate_to_seace()
+        await self.select_search_type()
+        await self.click_busqueda_avanzada()
+    
+    async def volver_al_buscador(self):
+        """
+        Vuelve de la ficha al formulario de búsqueda sin repetir toda la navegación.
+        
+        Usa el historial del navegador; si el campo de nomenclatura no queda visible
+        reabre la búsqueda avanzada y, como último recurso, navega desde el inicio.
+        
+        Raises:
+            ScrapingError: Si tampoco se pudo navegar desde el inicio
+        """
+        self._ensure_started()
+        
+        timeout = self.config.timeouts['element_wait']
+        try:
+            await self.page.go_back(wait_until="networkidle")
+            input_nomenclatura = self.page.locator(SELECTORS['nomenclatura_input'])
+            if await input_nomenclatura.is_visible(timeout=timeout):
+                return
+            await self.click_busqueda_avanzada()
+            if await input_nomenclatura.is_visible(timeout=timeout):
+                return
+        except Exception as e:
+            self.logger.debug(f"No se pudo volver al buscador con el historial: {e}")
+        
+        self.logger.info("Volviendo al buscador desde el inicio")
+        await self.preparar_buscador()
+    
+    async def scrapear_ficha(self, nomenclatura: str, resolver_links: bool = False) -> Dict[str, Any]:
+        """
+        Busca una nomenclatura desde el formulario ya abierto y extrae su ficha.
+        
+        Args:
+            nomenclatura: Nomenclatura a buscar
+            resolver_links: Ver `scrapear_documentos_con_links`
+        
+        Returns:
+            Diccionario con cronograma y documentos
+        """
+        await self.ingresar_nomenclatura(nomenclatura)
+        await self.click_boton_de_buscar()
+        await self.clickear_ficha_seleccion()
+        return await self.extraer_ficha(resolver_links=resolver_links)
+    
+    async def extraer_ficha(self, resolver_links: bool = False) -> Dict[str, Any]:
+        """Extrae cronograma y documentos de la ficha abierta."""
+        cronograma = await self.obtener_cronograma()
+        documentos = await self.scrapear_documentos_con_links(resolver_links=resolver_links)
+        return {"cronograma": cronograma, "documentos": documentos}
+    
+    async def scrapear_lote(
+        self,
+        nomenclaturas: List[str],
+        concurrencia: Optional[int] = None,
+        resolver_links: bool = False,
+        fichas: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Extrae muchas fichas reutilizando sesiones ya abiertas.
+        
+        Cada worker (este scraper + sesiones adicionales sobre el mismo navegador)
+        navega una sola vez hasta el buscador y después, por cada nomenclatura,
+        busca, abre la ficha, extrae y vuelve al formulario. Las nomenclaturas con
+        acceso directo conocido (`fichas`) se abren sin buscar. Si un ítem falla,
+        la sesión se vuelve a preparar desde el inicio antes del siguiente.
+        
+        Los accesos directos obtenidos al buscar quedan en `fichas_resueltas`.
+        
+        Args:
+            nomenclaturas: Nomenclaturas a extraer
+            concurrencia: Contextos trabajando a la vez (opcional, usa NOMENCLATURA_BATCH_CONCURRENCY)
+            resolver_links: Ver `scrapear_documentos_con_links`
+            fichas: Accesos directos conocidos, por `clave_nomenclatura` (opcional)
+        
+        Returns:
+            Un resultado por nomenclatura, en el mismo orden (status "succeeded" o "failed")
+        """
+        self._ensure_started()
+        
+        concurrencia = concurrencia or self.config.NOMENCLATURA_BATCH_CONCURRENCY
+        num_workers = max(1, min(concurrencia, len(nomenclaturas)))
+        self.logger.info(f"Lote de {len(nomenclaturas)} nomenclaturas en {num_workers} contextos")
+        fichas = fichas or {}
+        
+        resultados: Dict[int, Dict[str, Any]] = {}
+        errores: List[Exception] = []
+        cola: asyncio.Queue = asyncio.Queue()
+        for indice, nomenclatura in enumerate(nomenclaturas):
+            cola.put_nowait((indice, nomenclatura))
+        
+        def fallido(nomenclatura: str, error: str) -> Dict[str, Any]:
+            return {
+                "nomenclatura": nomenclatura,
+                "status": "failed",
+                "cronograma": None,
+                "documentos": None,
+                "error": error,
+            }
+        
+        async def worker(scraper: "NomenclaturaScraper") -> None:
+            en_buscador = False
+            while True:
+                try:
+                    indice, nomenclatura = cola.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                
+                clave = clave_nomenclatura(nomenclatura)
+                acceso = fichas.get(clave)
+                if acceso:
+                    en_buscador = False
+                    try:
+                        if await scraper.abrir_ficha_directa(acceso):
+                            datos = await scraper.extraer_ficha(resolver_links=resolver_links)
+                            resultados[indice] = {"nomenclatura": nomenclatura, "status": "succeeded", **datos, "error": None}
+                            continue
+                    except Exception as e:
+                        self.logger.warning(f"Ficha directa de {nomenclatura} falló, se buscará: {e}")
+                
+                if not en_buscador:
+                    try:
+                        await scraper.preparar_buscador()
+                        en_buscador = True
+                    except Exception as e:
+                        # Devolver el ítem para que lo tome otro worker y retirar esta sesión
+                        self.logger.warning(f"No se pudo preparar el buscador: {e}")
+                        errores.append(e)
+                        cola.put_nowait((indice, nomenclatura))
+                        return
+                
+                try:
+                    datos = await scraper.scrapear_ficha(nomenclatura, resolver_links=resolver_links)
+                    resultados[indice] = {"nomenclatura": nomenclatura, "status": "succeeded", **datos, "error": None}
+                    if scraper.ficha_actual:
+                        self.fichas_resueltas[clave] = scraper.ficha_actual
+                except Exception as e:
+                    self.logger.warning(f"Nomenclatura {nomenclatura} falló: {e}")
+                    resultados[indice] = fallido(nomenclatura, str(e))
+                    en_buscador = False
+                    continue
+                
+                try:
+                    await scraper.volver_al_buscador()
+                except Exception as e:
+                    self.logger.warning(f"No se pudo volver al buscador: {e}")
+                    en_buscador = False
+        
+        async def worker_en_sesion_adicional() -> None:
+            try:
+                sesion = await self.abrir_sesion_adicional(resolvedor_links=self.resolvedor_links)
+            except Exception as e:
+                self.logger.warning(f"No se pudo abrir un contexto adicional: {e}")
+                errores.append(e)
+                return
+            try:
+                await worker(sesion)
+            finally:
+                await sesion.close()
+        
+        await asyncio.gather(
+            worker(self),
+            *(worker_en_sesion_adicional() for _ in range(num_workers - 1)),
+        )
+        
+        # Ítems devueltos a la cola cuando ya no quedaba ninguna sesión utilizable
+        while not cola.empty():
+            indice, nomenclatura = cola.get_nowait()
+            resultados[indice] = fallido(
+                nomenclatura,
+                "Sin sesiones disponibles" + (f" (último error: {errores[-1]})" if errores else ""),
+            )
+        
+        exitosos = sum(1 for resultado in resultados.values() if resultado["status"] == "succeeded")
+        self.logger.info(f"✓ Lote terminado: {exitosos}/{len(nomenclaturas)} nomenclaturas extraídas")
+        return [resultados[indice] for indice in range(len(nomenclaturas))]
+    
     async def obtener_cronograma(self) -> List[Dict[str, str]]:
         """
         Obtiene el cronograma de la ficha de selección.
@@ -196,38 +610,35 @@ class NomenclaturaScraper(BaseScraper):
                 debug_path.write_text(html, encoding="utf-8")
                 self.logger.debug(f"HTML guardado en {debug_path}")
             
-            # Extraer datos de las filas
-            filas = await tabla_cronograma.locator(SELECTORS['cronograma_rows']).all()
+            # Todas las filas en un solo round trip
+            filas = await tabla_cronograma.evaluate(
+                _JS_FILAS_TABLA,
+                {
+                    "filas": SELECTORS['cronograma_rows'],
+                    "celdas": SELECTORS['cronograma_cells'],
+                    "columnas": CRONOGRAMA_COLUMNS,
+                    "minimo": MIN_CRONOGRAMA_CELLS,
+                },
+            )
             datos_cronograma = []
             
             self.logger.debug(f"Encontradas {len(filas)} filas en el cronograma")
             
             for indice, fila in enumerate(filas):
-                try:
-                    celdas = await fila.locator(SELECTORS['cronograma_cells']).all()
-                    
-                    if len(celdas) < MIN_CRONOGRAMA_CELLS:
-                        self.logger.warning(f"Fila {indice + 1} del cronograma no tiene suficientes celdas, saltando...")
-                        continue
-                    
-                    etapa = (await celdas[CRONOGRAMA_COLUMNS['etapa']].inner_text()).strip()
-                    # Limpiar el texto de etapa (remover <br> y espacios extra)
-                    etapa = ' '.join(etapa.split())
-                    
-                    fecha_inicio = (await celdas[CRONOGRAMA_COLUMNS['fecha_inicio']].inner_text()).strip()
-                    fecha_fin = (await celdas[CRONOGRAMA_COLUMNS['fecha_fin']].inner_text()).strip()
-                    # Limpiar fecha_fin (puede tener elementos adicionales)
-                    fecha_fin = fecha_fin.split('\n')[0].strip() if '\n' in fecha_fin else fecha_fin
-                    
-                    datos_cronograma.append({
-                        "etapa": etapa,
-                        "fecha_inicio": fecha_inicio,
-                        "fecha_fin": fecha_fin
-                    })
-                    
-                except Exception as e:
-                    self.logger.warning(f"Error procesando fila {indice + 1} del cronograma: {e}")
+                if fila is None:
+                    self.logger.warning(f"Fila {indice + 1} del cronograma no tiene suficientes celdas, saltando...")
                     continue
+                
+                # Limpiar el texto de etapa (remover <br> y espacios extra)
+                etapa = ' '.join(fila['etapa'].split())
+                # Limpiar fecha_fin (puede tener elementos adicionales)
+                fecha_fin = fila['fecha_fin'].split('\n')[0].strip()
+                
+                datos_cronograma.append({
+                    "etapa": etapa,
+                    "fecha_inicio": fila['fecha_inicio'],
+                    "fecha_fin": fecha_fin
+                })
             
             self.logger.info(f"✓ Cronograma extraído: {len(datos_cronograma)} registros")
             return datos_cronograma
@@ -238,10 +649,19 @@ class NomenclaturaScraper(BaseScraper):
             self.logger.error(f"Error al obtener cronograma: {e}")
             raise ScrapingError(f"Error al obtener cronograma: {e}") from e
     
-    async def scrapear_documentos_con_links(self) -> Dict[str, any]:
+    async def scrapear_documentos_con_links(self, resolver_links: bool = True) -> Dict[str, Any]:
         """
         Scrapea la tabla de documentos y obtiene los links reales de descarga.
-        Usa el método mejorado del experimental con expect_download().
+        
+        Los links se construyen a partir del onclick (`descargaDocGeneral`) con la
+        plantilla de `resolvedor_links`; mientras la plantilla no esté verificada
+        se hace click con expect_download() y cada descarga real sirve para
+        aprenderla o confirmarla.
+        
+        Args:
+            resolver_links: Si es False no se hace ningún click: cada documento trae
+                uuid, tipo y nombre, y `link_descarga` solo si la plantilla ya está
+                verificada (ver `obtener_link_documento`)
         
         Returns:
             Diccionario con total_documentos y lista de documentos con sus links
@@ -269,104 +689,60 @@ class NomenclaturaScraper(BaseScraper):
                 debug_path.write_text(html, encoding="utf-8")
                 self.logger.debug(f"HTML guardado en {debug_path}")
             
-            # Obtener todas las filas de la tabla
-            filas = await tabla_documentos.locator(SELECTORS['documentos_rows']).all()
+            # Todas las filas en un solo round trip (textos, tamaño y onclick del enlace)
+            filas = await tabla_documentos.evaluate(
+                _JS_FILAS_TABLA,
+                {
+                    "filas": SELECTORS['documentos_rows'],
+                    "celdas": SELECTORS['documentos_cells'],
+                    "columnas": DOCUMENTOS_COLUMNS,
+                    "minimo": MIN_DOCUMENTOS_CELLS,
+                    "enlace": {
+                        "columna": DOCUMENTOS_COLUMNS['archivo'],
+                        "selector": SELECTORS['documentos_download_link'],
+                        "tamaño": SELECTORS['documentos_size_span'],
+                    },
+                },
+            )
             documentos = []
+            clicks = 0
+            
+            if not self.resolvedor_links.lista:
+                await self._aprender_plantilla_de_js()
             
             self.logger.info(f"Encontradas {len(filas)} filas en la tabla de documentos")
             
             for indice, fila in enumerate(filas):
                 try:
-                    # Extraer datos de las celdas
-                    celdas = await fila.locator(SELECTORS['documentos_cells']).all()
-                    
-                    if len(celdas) < MIN_DOCUMENTOS_CELLS:
+                    if fila is None:
                         self.logger.warning(f"Fila {indice + 1}: No tiene suficientes celdas, saltando...")
                         continue
                     
-                    # Nro.
-                    numero = (await celdas[DOCUMENTOS_COLUMNS['numero']].inner_text()).strip()
-                    
-                    # Etapa
-                    etapa = (await celdas[DOCUMENTOS_COLUMNS['etapa']].inner_text()).strip()
-                    
-                    # Documento
-                    documento = (await celdas[DOCUMENTOS_COLUMNS['documento']].inner_text()).strip()
-                    
-                    # Archivo - aquí está el enlace de descarga
-                    celda_archivo = celdas[DOCUMENTOS_COLUMNS['archivo']]
-                    
-                    # Extraer el tamaño del archivo del span dentro del enlace
-                    tamaño = ""
-                    try:
-                        span_tamaño = celda_archivo.locator(SELECTORS['documentos_size_span']).first
-                        if await span_tamaño.count() > 0:
-                            tamaño = (await span_tamaño.inner_text()).strip()
-                    except Exception:
-                        pass
-                    
-                    # Extraer el nombre del archivo del atributo onclick
-                    nombre_archivo = ""
-                    try:
-                        enlace_descarga = celda_archivo.locator(SELECTORS['documentos_download_link']).first
-                        if await enlace_descarga.count() > 0:
-                            onclick_attr = await enlace_descarga.get_attribute("onclick") or ""
-                            
-                            # Extraer el nombre del archivo del onclick
-                            # Formato: javascript:descargaDocGeneral('uuid','tipo','nombre_archivo.ext');
-                            if "descargaDocGeneral" in onclick_attr:
-                                matches = re.findall(
-                                    r"descargaDocGeneral\('([^']+)','([^']+)','([^']+)'\)",
-                                    onclick_attr
-                                )
-                                if matches:
-                                    uuid_doc, tipo_doc, nombre_archivo = matches[0]
-                    except Exception as e:
-                        self.logger.debug(f"Error extrayendo nombre de archivo de la fila {indice + 1}: {e}")
-                    
-                    # Fecha y Hora de publicación
-                    fecha_publicacion = ""
-                    if len(celdas) > DOCUMENTOS_COLUMNS['fecha_publicacion']:
-                        fecha_publicacion = (await celdas[DOCUMENTOS_COLUMNS['fecha_publicacion']].inner_text()).strip()
+                    # (uuid, tipo, nombre) del onclick: descargaDocGeneral('uuid','tipo','nombre')
+                    descarga = parsear_descarga_doc(fila['onclick'])
                     
-                    # Obtener el link real de descarga usando expect_download() (método mejorado)
+                    # Con la plantilla ya verificada el link se construye sin click
                     link_descarga = None
-                    try:
-                        enlace_descarga = celda_archivo.locator(SELECTORS['documentos_download_link']).first
-                        if await enlace_descarga.count() > 0:
-                            # Método mejorado: interceptar la descarga antes de hacer click
-                            download_timeout = self.config.timeouts['network']
-                            async with self.page.expect_download(timeout=download_timeout) as download_info:
-                                await enlace_descarga.click()
-                            
-                            download = await download_info.value
-                            link_descarga = download.url
-                            # Cancelar la descarga real, solo queremos la URL
-                            await download.cancel()
-                            
-                            self.logger.debug(f"✓ Fila {indice + 1}: Link obtenido - {nombre_archivo}")
-                            
-                    except Exception as e:
-                        self.logger.debug(f"Error obteniendo link de la fila {indice + 1}: {e}")
-                        # Si falla, continuar sin link (no crítico)
+                    if descarga and self.resolvedor_links.lista:
+                        link_descarga = self.resolvedor_links.construir(*descarga)
+                    elif fila['tiene_enlace'] and resolver_links:
+                        enlace_descarga = self._enlace_documento(tabla_documentos, indice, descarga)
+                        link_descarga = await self._obtener_link_con_click(enlace_descarga, indice)
+                        if link_descarga and descarga:
+                            self.resolvedor_links.observar(link_descarga, *descarga)
+                        clicks += 1
                     
-                    # Construir el objeto del documento
-                    documento_info = {
-                        "numero": numero,
-                        "etapa": etapa,
-                        "documento": documento,
-                        "nombre_archivo": nombre_archivo,
-                        "tamaño": tamaño,
-                        "fecha_publicacion": fecha_publicacion,
+                    documentos.append({
+                        "numero": fila['numero'],
+                        "etapa": fila['etapa'],
+                        "documento": fila['documento'],
+                        "uuid": descarga[0] if descarga else None,
+                        "tipo": descarga[1] if descarga else None,
+                        "nombre_archivo": descarga[2] if descarga else "",
+                        "tamaño": fila['tamaño'],
+                        "fecha_publicacion": fila['fecha_publicacion'],
                         "link_descarga": link_descarga
-                    }
-                    
-                    documentos.append(documento_info)
-                    
-                    # Pequeña pausa entre descargas para no sobrecargar el servidor
-                    delay = self.config.DELAY_BETWEEN_DOCUMENTS
-                    if delay > 0:
-                        await asyncio.sleep(delay)
+                    })
                     
                 except Exception as e:
                     self.logger.warning(f"Error procesando fila {indice + 1}: {e}")
@@ -378,7 +754,10 @@ class NomenclaturaScraper(BaseScraper):
             }
             
             documentos_con_link = sum(1 for doc in documentos if doc.get('link_descarga'))
-            self.logger.info(f"✓ Documentos scrapeados: {len(documentos)} total, {documentos_con_link} con link")
+            self.logger.info(
+                f"✓ Documentos scrapeados: {len(documentos)} total, {documentos_con_link} con link "
+                f"({clicks} por click)"
+            )
             
             return resultado
             
@@ -387,3 +766,106 @@ class NomenclaturaScraper(BaseScraper):
         except Exception as e:
             self.logger.error(f"Error al scrapear documentos: {e}")
             raise ScrapingError(f"Error al scrapear documentos: {e}") from e
+    
+    async def obtener_firma_documentos(self) -> Dict[str, Any]:
+        """
+        Lee solo cantidad y última fecha de publicación de la tabla de documentos
+        (un evaluate, sin onclick ni links), para revalidar una ficha cacheada.
+        
+        Raises:
+            ElementNotFoundError: Si no se encuentra la tabla de documentos
+        """
+        self._ensure_started()
+        
+        tabla_documentos = self.page.locator(SELECTORS['documentos_table'])
+        if not await tabla_documentos.is_visible(timeout=self.config.timeouts['element_wait']):
+            raise ElementNotFoundError("No se encontró la tabla de documentos")
+        
+        filas = await tabla_documentos.evaluate(
+            _JS_FILAS_TABLA,
+            {
+                "filas": SELECTORS['documentos_rows'],
+                "celdas": SELECTORS['documentos_cells'],
+                "columnas": {"fecha_publicacion": DOCUMENTOS_COLUMNS['fecha_publicacion']},
+                "minimo": MIN_DOCUMENTOS_CELLS,
+            },
+        )
+        return firma_documentos(fila['fecha_publicacion'] for fila in filas if fila is not None)
+    
+    async def obtener_link_documento(self, uuid: str) -> str:
+        """
+        Resuelve el link de descarga de un solo documento de la ficha abierta.
+        
+        Args:
+            uuid: Identificador del documento (primer argumento de descargaDocGeneral)
+        
+        Returns:
+            Link de descarga
+        
+        Raises:
+            ElementNotFoundError: Si la ficha no tiene un documento con ese uuid
+            ScrapingError: Si no se pudo obtener el link
+        """
+        self._ensure_started()
+        
+        tabla_documentos = self.page.locator(SELECTORS['documentos_table'])
+        if not await tabla_documentos.is_visible(timeout=self.config.timeouts['element_wait']):
+            raise ElementNotFoundError("No se encontró la tabla de documentos")
+        
+        enlace = tabla_documentos.locator(SELECTORS['documentos_link_por_uuid'].format(uuid=uuid)).first
+        if await enlace.count() == 0:
+            raise ElementNotFoundError(f"No se encontró el documento {uuid}")
+        
+        descarga = parsear_descarga_doc(await enlace.get_attribute("onclick") or "")
+        if descarga and self.resolvedor_links.lista:
+            link_construido = self.resolvedor_links.construir(*descarga)
+            if link_construido:
+                return link_construido
+        
+        if not self.resolvedor_links.lista:
+            await self._aprender_plantilla_de_js()
+        link_descarga = await self._obtener_link_con_click(enlace, 0)
+        if not link_descarga:
+            raise ScrapingError(f"No se pudo obtener el link del documento {uuid}")
+        if descarga:
+            self.resolvedor_links.observar(link_descarga, *descarga)
+        return link_descarga
+    
+    def _enlace_documento(self, tabla_documentos, indice: int, descarga: Optional[Tuple[str, str, str]]):
+        """Locator del enlace de descarga de una fila (por uuid si se conoce)."""
+        if descarga:
+            return tabla_documentos.locator(SELECTORS['documentos_link_por_uuid'].format(uuid=descarga[0])).first
+        fila = tabla_documentos.locator(SELECTORS['documentos_rows']).nth(indice)
+        return fila.locator(SELECTORS['documentos_download_link']).first
+    
+    async def _aprender_plantilla_de_js(self) -> None:
+        """Intenta obtener la plantilla de links desde el JS de la página."""
+        try:
+            codigo = await self.page.evaluate(
+                "() => typeof descargaDocGeneral === 'function' ? descargaDocGeneral.toString() : ''"
+            )
+            if codigo and self.resolvedor_links.aprender_de_js(codigo, self.page.url):
+                self.logger.debug("Plantilla de links obtenida del JS de la página (pendiente de verificar)")
+        except Exception as e:
+            self.logger.debug(f"No se pudo leer descargaDocGeneral de la página: {e}")
+    
+    async def _obtener_link_con_click(self, enlace_descarga, indice: int) -> Optional[str]:
+        """
+        Obtiene el link real haciendo click e interceptando la descarga
+        (que se cancela: solo interesa la URL).
+        """
+        try:
+            download_timeout = self.config.timeouts['network']
+            async with self.page.expect_download(timeout=download_timeout) as download_info:
+                await enlace_descarga.click()
+            
+            download = await download_info.value
+            link_descarga = download.url
+            await download.cancel()
+            
+            self.logger.debug(f"✓ Fila {indice + 1}: Link obtenido por click")
+            return link_descarga
+        except Exception as e:
+            # Si falla, continuar sin link (no crítico)
+            self.logger.debug(f"Error obteniendo link de la fila {indice + 1}: {e}")
+            return None
@@ -4,17 +4,205 @@ Busca procesos por departamento y año, con paginación automática.
 """
 
 import asyncio
+import math
+import re
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import pandas as pd
+from bs4 import BeautifulSoup, Tag
 
 from .base import BaseScraper
-from ..selectors.regional import SELECTORS, COLUMNAS_ESPERADAS, INDICES_COLUMNAS, WAIT_SELECTORS
-from ..utils.exceptions import ScrapingError, ElementNotFoundError
+from .ficha import ZONA_SEACE, parsear_fichas_resultados
+from ..selectors.regional import (
+    SELECTORS,
+    COLUMNAS_ESPERADAS,
+    FORMATO_FECHA_PUBLICACION,
+    INDICES_COLUMNAS,
+    OPCION_PLACEHOLDER,
+    WAIT_SELECTORS,
+)
+from ..storage.normalizacion import normalizar_procesos
+from ..storage.sinks import PageSink
+from ..utils.exceptions import ScrapingError, ElementNotFoundError, TableNotFoundError
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# "[ Mostrando de 1 a 15 del total 32 - Página: 1/3 ]"
+_REPORTE_PAGINADOR_RE = re.compile(
+    r"de\s+([\d.,]+)\s+a\s+([\d.,]+)\s+del\s+total\s+([\d.,]+).*?P[áa]gina:?\s*([\d.,]+)\s*/\s*([\d.,]+)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _a_entero(texto: str) -> int:
+    """Convierte "1,234" / "1.234" a 1234."""
+    return int(re.sub(r"[.,]", "", texto))
+
+
+def parsear_reporte_paginador(texto: str) -> Dict[str, int]:
+    """
+    Parsea el texto del page-report de PrimeFaces.
+    
+    Args:
+        texto: Texto del span `ui-paginator-current`
+            (ej: "[ Mostrando de 1 a 15 del total 32 - Página: 1/3 ]")
+    
+    Returns:
+        Diccionario con registro_inicio, registro_fin, total_registros,
+        pagina_actual y total_paginas
+    
+    Raises:
+        ScrapingError: Si el texto no tiene el formato esperado
+    """
+    match = _REPORTE_PAGINADOR_RE.search(texto or "")
+    if not match:
+        raise ScrapingError(f"No se pudo interpretar el paginador: {texto!r}")
+    
+    registro_inicio, registro_fin, total_registros, pagina_actual, total_paginas = (
+        _a_entero(grupo) for grupo in match.groups()
+    )
+    return {
+        "registro_inicio": registro_inicio,
+        "registro_fin": registro_fin,
+        "total_registros": total_registros,
+        "pagina_actual": pagina_actual,
+        "total_paginas": total_paginas,
+    }
+
+
+def _es_busqueda_sin_resultados(error: Optional[BaseException]) -> bool:
+    """True si en la cadena de causas hay un TableNotFoundError de "No hay resultados"."""
+    while error is not None:
+        if isinstance(error, TableNotFoundError) and "no hay resultados" in str(error).lower():
+            return True
+        error = error.__cause__
+    return False
+
+
+def parsear_filas_procesos(html: str) -> List[List[str]]:
+    """
+    Parsea el `<tbody>` de resultados y devuelve las columnas de INDICES_COLUMNAS por fila.
+    
+    Trabaja sobre HTML ya capturado (sin IPC con el navegador), por lo que puede
+    ejecutarse en un hilo aparte.
+    
+    Args:
+        html: outerHTML del tbody de resultados
+    
+    Returns:
+        Lista de filas (listas de strings en el orden de COLUMNAS_ESPERADAS)
+    """
+    # lxml descarta un <tbody> suelto: envolverlo en <table>
+    soup = BeautifulSoup(f"<table>{html}</table>", "lxml")
+    tbody = soup.find("tbody")
+    if tbody is None:
+        return []
+    
+    datos = []
+    for fila in tbody.find_all("tr", recursive=False):
+        # Fila "No se encontraron..." que PrimeFaces pinta cuando la tabla está vacía
+        if "ui-datatable-empty-message" in (fila.get("class") or []):
+            continue
+        
+        celdas = fila.find_all("td", recursive=False)
+        
+        # Verificar que la fila tenga contenido válido (al menos algunas celdas con texto)
+        if len(celdas) == 0:
+            continue
+        
+        fila_datos = [
+            _texto_celda(celdas[indice]) if indice < len(celdas) else ""
+            for indice in INDICES_COLUMNAS
+        ]
+        
+        # Solo agregar si la fila tiene algún contenido válido
+        if any(fila_datos):
+            datos.append(fila_datos)
+    
+    return datos
+
+
+def _texto_celda(celda: Tag) -> str:
+    """
+    Texto de una celda como lo mostraría `inner_text()` en el navegador: los
+    elementos anidados separados por un espacio y los saltos de línea y la
+    indentación del HTML colapsados.
+    """
+    return " ".join(celda.get_text(" ", strip=True).split())
+
+
+def parsear_opciones_panel(html: str) -> List[str]:
+    """
+    Extrae los valores (`data-label`) de un panel selectOneMenu de PrimeFaces,
+    sin la opción "[Seleccione]" y en el orden del panel.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    opciones = []
+    for li in soup.select(SELECTORS['panel_item']):
+        etiqueta = str(li.get("data-label") or "").strip()
+        if etiqueta and etiqueta != OPCION_PLACEHOLDER and etiqueta not in opciones:
+            opciones.append(etiqueta)
+    return opciones
+
+
+def parsear_fecha_publicacion(texto: str) -> Optional[datetime]:
+    """Convierte "28/01/2026 15:09" a datetime (None si está vacío o no tiene ese formato)."""
+    try:
+        return datetime.strptime((texto or "").strip(), FORMATO_FECHA_PUBLICACION)
+    except ValueError:
+        return None
+
+
+def filas_ya_vistas(
+    df: pd.DataFrame,
+    since: Optional[datetime] = None,
+    nomenclaturas_conocidas: Optional[Iterable[str]] = None
+) -> pd.Series:
+    """
+    Marca las filas que están por debajo de la marca de agua.
+    
+    Una fila ya se vio si su Nomenclatura es conocida, o si se publicó antes de `since`.
+    Las fechas del listado son hora de Lima sin zona: un `since` con zona se
+    convierte a esa hora antes de comparar.
+    
+    Returns:
+        Serie booleana alineada con `df`
+    """
+    vistas = pd.Series(False, index=df.index)
+    if nomenclaturas_conocidas is not None:
+        vistas |= df["Nomenclatura"].isin(set(nomenclaturas_conocidas))
+    if since is not None:
+        fechas = pd.to_datetime(
+            df["Fecha y Hora de Publicacion"], format=FORMATO_FECHA_PUBLICACION, errors="coerce"
+        )
+        if since.tzinfo is not None:
+            since = since.astimezone(ZONA_SEACE).replace(tzinfo=None)
+        vistas |= fechas < since
+    return vistas
+
+
+def calcular_rangos_de_paginas(total_paginas: int, paginas_por_shard: int) -> List[Tuple[int, int]]:
+    """
+    Divide el rango [1, total_paginas] en shards contiguos (ambos extremos inclusive).
+    
+    Args:
+        total_paginas: Total de páginas reportado por el paginador
+        paginas_por_shard: Tamaño máximo de cada shard
+    
+    Returns:
+        Lista ordenada de tuplas (pagina_inicio, pagina_fin)
+    """
+    if total_paginas <= 0:
+        return []
+    paginas_por_shard = max(1, paginas_por_shard)
+    num_shards = math.ceil(total_paginas / paginas_por_shard)
+    return [
+        (indice * paginas_por_shard + 1, min((indice + 1) * paginas_por_shard, total_paginas))
+        for indice in range(num_shards)
+    ]
+
 
 class RegionalScraper(BaseScraper):
     """
@@ -31,6 +219,7 @@ class RegionalScraper(BaseScraper):
         self,
         departamento: Optional[str] = None,
         anio: Optional[str] = None,
+        sinks: Optional[List[PageSink]] = None,
         **kwargs
     ):
         """
@@ -39,11 +228,15 @@ class RegionalScraper(BaseScraper):
         Args:
             departamento: Nombre del departamento a buscar (ej: "AREQUIPA")
             anio: Año de convocatoria (ej: "2025")
+            sinks: Destinos adicionales que reciben cada página parseada (opcional)
             **kwargs: Argumentos adicionales para BaseScraper (config, debug, wait_strategy)
         """
         super().__init__(**kwargs)
         self.departamento = departamento
         self.anio = anio
+        self.sinks: List[PageSink] = list(sinks or [])
+        # Página en curso, para nombrar el HTML que se guarda en modo debug
+        self._debug_page_idx = 1
     
     async def desplegar_boton_para_seleccionar_departamento(self):
         """
@@ -241,15 +434,73 @@ class RegionalScraper(BaseScraper):
             self.logger.error(f"Error al hacer click en buscar: {e}")
             raise ScrapingError(f"Error al hacer click en buscar: {e}") from e
     
-    async def _extraer_datos_pagina_actual(self) -> List[List[str]]:
+    async def preparar_busqueda(
+        self,
+        departamento: Optional[str] = None,
+        anio: Optional[str] = None
+    ):
         """
-        Extrae los datos de la página actual.
+        Ejecuta el flujo completo hasta tener la primera página de resultados:
+        navegar, búsqueda avanzada, departamento, año y "Buscar".
+        
+        Args:
+            departamento: Departamento (opcional, usa el del constructor)
+            anio: Año de convocatoria (opcional, usa el del constructor)
+        """
+        await self.navigate_to_seace()
+        await self.select_search_type()
+        await self.click_busqueda_avanzada()
+        
+        # Orden actual: primero departamento, luego año
+        await self.desplegar_boton_para_seleccionar_departamento()
+        await self.seleccionar_departamento(departamento)
+        await self.desplegar_boton_para_seleccionar_anio_de_convocatoria()
+        await self.seleccionar_anio_de_convocatoria(anio)
+        
+        # Importante: la UI de SEACE no carga resultados hasta presionar "Buscar"
+        await self.click_boton_de_buscar()
+    
+    async def _guardar_html_debug_resultados(self, container):
+        """Guarda HTML de resultados/tbody/paginador de la página actual (solo modo debug)."""
+        try:
+            Path(self.config.DEBUG_DIR).mkdir(parents=True, exist_ok=True)
+            page_idx = self._debug_page_idx
+
+            container_html = await container.evaluate("el => el.outerHTML")
+            (Path(self.config.DEBUG_DIR) / f"regional_resultados_container_p{page_idx}.html").write_text(
+                container_html, encoding="utf-8"
+            )
+
+            # Tabla (tbody) real de resultados
+            tbody = container.locator(SELECTORS["results_table_body"])
+            tbody_html = await tbody.evaluate("el => el.outerHTML")
+            (Path(self.config.DEBUG_DIR) / f"regional_resultados_tbody_p{page_idx}.html").write_text(
+                tbody_html, encoding="utf-8"
+            )
+
+            # Paginador inferior (si existe)
+            paginator = self.page.locator(SELECTORS["pagination_container"])
+            if await paginator.count() > 0:
+                paginator_html = await paginator.evaluate("el => el.outerHTML")
+                (Path(self.config.DEBUG_DIR) / f"regional_resultados_paginador_p{page_idx}.html").write_text(
+                    paginator_html, encoding="utf-8"
+                )
+        except Exception as e:
+            # Nunca romper el scraping por un fallo de debug-artefacts
+            self.logger.warning(f"No se pudo guardar HTML de debug de resultados: {e}")
+    
+    async def _capturar_html_pagina_actual(self) -> Optional[str]:
+        """
+        Captura el HTML del `<tbody>` de resultados de la página actual en un solo round trip.
+        
+        Una vez capturado, el HTML es independiente del DOM: se puede parsear
+        mientras la página ya está cargando la siguiente.
         
         Returns:
-            Lista de listas con los datos de cada fila
+            outerHTML del tbody, o None si no hay resultados
         
         Raises:
-            ScrapingError: Si hay un error al extraer los datos
+            ScrapingError: Si hay un error al capturar la tabla
         """
         self._ensure_started()
         
@@ -258,89 +509,55 @@ class RegionalScraper(BaseScraper):
             
             # En modo debug, guardar HTML de resultados/paginador para análisis
             if self.debug:
-                try:
-                    Path(self.config.DEBUG_DIR).mkdir(parents=True, exist_ok=True)
-                    page_idx = getattr(self, "_debug_page_idx", 1)
-                    setattr(self, "_debug_page_idx", page_idx)
-
-                    container_html = await container.evaluate("el => el.outerHTML")
-                    (Path(self.config.DEBUG_DIR) / f"regional_resultados_container_p{page_idx}.html").write_text(
-                        container_html, encoding="utf-8"
-                    )
-
-                    # Tabla (tbody) real de resultados
-                    tbody = container.locator(SELECTORS["results_table_body"])
-                    tbody_html = await tbody.evaluate("el => el.outerHTML")
-                    (Path(self.config.DEBUG_DIR) / f"regional_resultados_tbody_p{page_idx}.html").write_text(
-                        tbody_html, encoding="utf-8"
-                    )
-
-                    # Paginador inferior (si existe)
-                    paginator = self.page.locator(SELECTORS["pagination_container"])
-                    if await paginator.count() > 0:
-                        paginator_html = await paginator.evaluate("el => el.outerHTML")
-                        (Path(self.config.DEBUG_DIR) / f"regional_resultados_paginador_p{page_idx}.html").write_text(
-                            paginator_html, encoding="utf-8"
-                        )
-                except Exception as e:
-                    # Nunca romper el scraping por un fallo de debug-artefacts
-                    self.logger.warning(f"No se pudo guardar HTML de debug de resultados: {e}")
+                await self._guardar_html_debug_resultados(container)
 
             # Verificar si el contenedor existe y es visible
             if not await container.is_visible(timeout=5000):
                 self.logger.warning("El contenedor de resultados no es visible")
-                return []
+                return None
             
             # Obtener el texto del contenedor para verificar si hay mensaje de "sin resultados"
             container_text = (await container.inner_text()).lower()
             if any(msg in container_text for msg in ["no hay", "sin resultados", "no se encontraron"]):
                 self.logger.info("No se encontraron resultados en la búsqueda")
-                return []
-            
-            tbody = container.locator(SELECTORS['results_table_body'])
-            filas = await tbody.locator(SELECTORS['results_table_row']).all()
-            
-            if len(filas) == 0:
-                # Fallback seguro: seguir scopiando al `<tbody>` real (nunca al contenedor grande),
-                # para no capturar filas del layout/paginador.
-                filas_directas = await self.page.locator(SELECTORS['results_table_body']).locator(
-                    SELECTORS['results_table_row']
-                ).all()
-                if len(filas_directas) == 0:
-                    self.logger.warning("No se encontraron filas en la tabla")
-                    return []
-                filas = filas_directas
-            
-            datos = []
-            
-            for fila in filas:
-                celdas = await fila.locator(SELECTORS['results_table_cell']).all()
-                
-                # Verificar que la fila tenga contenido válido (al menos algunas celdas con texto)
-                if len(celdas) == 0:
-                    continue
-                
-                fila_datos = []
-                
-                for indice in INDICES_COLUMNAS:
-                    if indice < len(celdas):
-                        texto = (await celdas[indice].inner_text()).strip()
-                        fila_datos.append(texto)
-                    else:
-                        fila_datos.append("")
-                
-                # Solo agregar si la fila tiene algún contenido válido
-                if any(fila_datos):  # Si al menos un campo tiene contenido
-                    datos.append(fila_datos)
+                return None
+            
+            # Siempre scopiado al `<tbody>` real (nunca al contenedor grande),
+            # para no capturar filas del layout/paginador.
+            tbody = self.page.locator(SELECTORS['results_table_body'])
+            if await tbody.count() == 0:
+                self.logger.warning("No se encontró el tbody de resultados")
+                return None
             
-            self.logger.info(f"Extraídos {len(datos)} registros de la página actual")
-            return datos
+            html: str = await tbody.first.evaluate("el => el.outerHTML")
+            return html
             
+        except Exception as e:
+            self.logger.error(f"Error al capturar la tabla de resultados: {e}")
+            raise ScrapingError(f"Error al capturar la tabla de resultados: {e}") from e
+    
+    async def _extraer_datos_pagina_actual(self) -> List[List[str]]:
+        """
+        Extrae los datos de la página actual.
+        
+        Returns:
+            Lista de listas con los datos de cada fila
+        
+        Raises:
+            ScrapingError: Si hay un error al extraer los datos
+        """
+        html = await self._capturar_html_pagina_actual()
+        if html is None:
+            return []
+        
+        try:
+            datos = parsear_filas_procesos(html)
         except Exception as e:
             self.logger.error(f"Error al extraer datos: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
             raise ScrapingError(f"Error al extraer datos: {e}") from e
+        
+        self.logger.info(f"Extraídos {len(datos)} registros de la página actual")
+        return datos
     
     async def obtener_tabla_de_procesos(self, nombre_archivo_csv: Optional[str] = None) -> pd.DataFrame:
         """
@@ -424,6 +641,316 @@ class RegionalScraper(BaseScraper):
             self.logger.error(f"Error al avanzar a siguiente página: {e}")
             raise ScrapingError(f"Error al avanzar a siguiente página: {e}") from e
     
+    async def obtener_info_paginador(self) -> Dict[str, int]:
+        """
+        Lee el page-report del paginador inferior.
+        
+        Returns:
+            Diccionario de parsear_reporte_paginador()
+        
+        Raises:
+            ElementNotFoundError: Si no se encuentra el paginador
+            ScrapingError: Si el texto no se puede interpretar
+        """
+        self._ensure_started()
+        
+        container = self.page.locator(SELECTORS['pagination_container'])
+        reporte = container.locator(SELECTORS['pagination_current'])
+        
+        if await reporte.count() == 0:
+            raise ElementNotFoundError("No se encontró el reporte del paginador")
+        
+        texto = await reporte.first.inner_text()
+        return parsear_reporte_paginador(texto)
+    
+    async def obtener_opciones(self) -> Dict[str, List[str]]:
+        """
+        Lee los departamentos y años de convocatoria válidos del buscador.
+        
+        Los paneles de los selectOneMenu ya están en el DOM (ocultos) al abrir la
+        búsqueda avanzada, así que no hace falta desplegarlos.
+        
+        Returns:
+            {"departamentos": [...], "anios": [...]}
+        
+        Raises:
+            ScrapingError: Si no se pueden leer los paneles
+        """
+        self._ensure_started()
+        
+        await self.navigate_to_seace()
+        await self.select_search_type()
+        await self.click_busqueda_avanzada()
+        
+        try:
+            html_departamentos = await self.page.locator(SELECTORS['department_panel']).evaluate(
+                "element => element.outerHTML"
+            )
+            html_anios = await self.page.locator(SELECTORS['year_panel']).evaluate(
+                "element => element.outerHTML"
+            )
+        except Exception as e:
+            self.logger.error(f"Error al leer las opciones de búsqueda: {e}")
+            raise ScrapingError(f"Error al leer las opciones de búsqueda: {e}") from e
+        
+        opciones = {
+            "departamentos": parsear_opciones_panel(html_departamentos),
+            "anios": parsear_opciones_panel(html_anios),
+        }
+        if not opciones["departamentos"] or not opciones["anios"]:
+            raise ScrapingError("No se encontraron opciones de departamento o año en el buscador")
+        
+        self.logger.info(
+            f"✓ Opciones: {len(opciones['departamentos'])} departamentos, {len(opciones['anios'])} años"
+        )
+        return opciones
+    
+    async def contar_procesos(
+        self,
+        departamento: Optional[str] = None,
+        anio: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Cuenta los procesos de un departamento/año sin extraer filas.
+        
+        Hace una sola búsqueda y lee el total de registros y de páginas del
+        page-report del paginador.
+        
+        Args:
+            departamento: Departamento (opcional, usa el del constructor)
+            anio: Año de convocatoria (opcional, usa el del constructor)
+        
+        Returns:
+            Diccionario con total_registros, total_paginas y registros_por_pagina
+        
+        Raises:
+            ScrapingError: Si hay un error durante la búsqueda
+        """
+        try:
+            await self.preparar_busqueda(departamento, anio)
+        except ScrapingError as e:
+            if _es_busqueda_sin_resultados(e):
+                self.logger.info("La búsqueda no tiene resultados")
+                return {"total_registros": 0, "total_paginas": 0, "registros_por_pagina": 0}
+            raise
+        
+        try:
+            info = await self.obtener_info_paginador()
+        except ElementNotFoundError:
+            # Sin paginador: todos los resultados están en esta página
+            total = len(await self._extraer_datos_pagina_actual())
+            return {"total_registros": total, "total_paginas": 1 if total else 0, "registros_por_pagina": total}
+        
+        conteo = {
+            "total_registros": info['total_registros'],
+            "total_paginas": info['total_paginas'],
+            "registros_por_pagina": info['registro_fin'] - info['registro_inicio'] + 1,
+        }
+        self.logger.info(
+            f"✓ Conteo: {conteo['total_registros']} registros en {conteo['total_paginas']} páginas"
+        )
+        return conteo
+    
+    async def _saltar_a_pagina_js(self, numero_pagina: int) -> bool:
+        """
+        Intenta saltar de página con un solo request usando el widget PrimeFaces del datatable.
+        
+        Returns:
+            True si se disparó el cambio de página, False si el widget no está disponible
+        """
+        disparado = await self.page.evaluate(
+            """({tableId, pageIndex}) => {
+                const widgets = (window.PrimeFaces && PrimeFaces.widgets) || {};
+                const widget = Object.values(widgets).find(w => w && w.id === tableId);
+                if (!widget || !widget.paginator) return false;
+                widget.paginator.setPage(pageIndex);
+                return true;
+            }""",
+            {"tableId": SELECTORS['results_table_id'], "pageIndex": numero_pagina - 1},
+        )
+        return bool(disparado)
+    
+    async def ir_a_pagina(self, numero_pagina: int):
+        """
+        Posiciona la tabla de resultados en la página indicada.
+        
+        Primero intenta un salto directo vía widget PrimeFaces; si no funciona,
+        recorre los enlaces numerados visibles del paginador (saltando al más
+        cercano al destino en cada paso).
+        
+        Args:
+            numero_pagina: Página destino (1-indexed)
+        
+        Raises:
+            ScrapingError: Si no se puede llegar a la página
+        """
+        self._ensure_started()
+        
+        info = await self.obtener_info_paginador()
+        if info['pagina_actual'] == numero_pagina:
+            return
+        if not 1 <= numero_pagina <= info['total_paginas']:
+            raise ScrapingError(
+                f"Página {numero_pagina} fuera de rango (total: {info['total_paginas']})"
+            )
+        
+        self.logger.info(f"Saltando de la página {info['pagina_actual']} a la {numero_pagina}...")
+        
+        try:
+            if await self._saltar_a_pagina_js(numero_pagina):
+                await self.wait_strategy.wait_for_search_results(
+                    self.page,
+                    WAIT_SELECTORS,
+                    timeout=self.config.timeouts['network']
+                )
+                info = await self.obtener_info_paginador()
+        except Exception as e:
+            self.logger.debug(f"Salto directo no disponible, usando enlaces del paginador: {e}")
+        
+        container = self.page.locator(SELECTORS['pagination_container'])
+        while info['pagina_actual'] != numero_pagina:
+            enlaces = container.locator(SELECTORS['pagination_page'])
+            textos = [texto.strip() for texto in await enlaces.all_inner_texts()]
+            visibles = {int(texto): indice for indice, texto in enumerate(textos) if texto.isdigit()}
+            
+            if numero_pagina in visibles:
+                destino = numero_pagina
+            elif numero_pagina > info['pagina_actual']:
+                destino = max((p for p in visibles if p < numero_pagina), default=info['pagina_actual'])
+            else:
+                destino = min((p for p in visibles if p > numero_pagina), default=info['pagina_actual'])
+            
+            if destino == info['pagina_actual']:
+                raise ScrapingError(f"No se pudo avanzar hacia la página {numero_pagina}")
+            
+            await enlaces.nth(visibles[destino]).click()
+            await self.wait_strategy.wait_for_search_results(
+                self.page,
+                WAIT_SELECTORS,
+                timeout=self.config.timeouts['network']
+            )
+            info = await self.obtener_info_paginador()
+        
+        if self.debug:
+            self._debug_page_idx = numero_pagina
+        self.logger.info(f"✓ Posicionado en la página {numero_pagina}")
+    
+    async def _extraer_rango_de_paginas(
+        self,
+        pagina_inicio: int,
+        pagina_fin: Optional[int],
+        csv_path: Path,
+        es_pagina_final: Optional[Callable[[pd.DataFrame], bool]] = None
+    ) -> pd.DataFrame:
+        """
+        Extrae desde la página actual (que debe ser `pagina_inicio`) hasta `pagina_fin`
+        inclusive, o hasta la última página si `pagina_fin` es None, y guarda el CSV.
+        
+        Si se pasa `es_pagina_final`, la paginación se corta después de la primera
+        página parseada para la que devuelva True (las páginas que el productor ya
+        haya pedido por adelantado se descartan).
+        
+        Funciona como pipeline productor/consumidor: el productor captura el HTML
+        del tbody de la página N y de inmediato dispara el AJAX de la página N+1,
+        mientras el consumidor parsea (en un hilo) y escribe la página N. La cola
+        acotada (PIPELINE_QUEUE_SIZE) aplica backpressure si el parseo se atrasa.
+        
+        Las páginas en texto no se acumulan en memoria: cada una se descarta una vez
+        escrita en el CSV y normalizada para los sinks, y el DataFrame del rango se
+        lee del CSV al terminar.
+        
+        Returns:
+            DataFrame con los datos del rango
+        """
+        cola: asyncio.Queue = asyncio.Queue(maxsize=max(1, self.config.PIPELINE_QUEUE_SIZE))
+        error_consumidor: List[Exception] = []
+        detener = asyncio.Event()
+        ultima_pagina = pagina_inicio
+        
+        # Cabecera ahora: las páginas se agregan al CSV a medida que se parsean
+        pd.DataFrame(columns=COLUMNAS_ESPERADAS).to_csv(csv_path, index=False, encoding="utf-8-sig")
+        
+        async def consumidor() -> None:
+            while True:
+                item = await cola.get()
+                if item is None:
+                    return
+                if error_consumidor or detener.is_set():
+                    # Seguir drenando para no bloquear al productor
+                    continue
+                
+                numero_pagina, html = item
+                try:
+                    datos_pagina = await asyncio.to_thread(parsear_filas_procesos, html) if html else []
+                    df_pagina = pd.DataFrame(datos_pagina, columns=COLUMNAS_ESPERADAS)
+                    await asyncio.to_thread(
+                        df_pagina.to_csv, csv_path, mode="a", header=False, index=False, encoding="utf-8"
+                    )
+                    if self.sinks:
+                        # Los sinks reciben la página tipada; CSV y CDC siguen con el texto original
+                        df_tipado = await asyncio.to_thread(normalizar_procesos, df_pagina)
+                        fichas = await asyncio.to_thread(parsear_fichas_resultados, html) if html else {}
+                        for sink in self.sinks:
+                            await asyncio.to_thread(sink.escribir_pagina, df_tipado, numero_pagina)
+                            if fichas:
+                                await asyncio.to_thread(sink.escribir_fichas, fichas, numero_pagina)
+                    self.logger.info(f"✓ Página {numero_pagina}: {len(df_pagina)} registros extraídos")
+                    if es_pagina_final is not None and es_pagina_final(df_pagina):
+                        self.logger.info(f"Página {numero_pagina} bajo la marca de agua: fin de la paginación")
+                        detener.set()
+                except Exception as e:
+                    self.logger.error(f"Error procesando la página {numero_pagina}: {e}")
+                    error_consumidor.append(e)
+        
+        tarea_consumidor = asyncio.create_task(consumidor())
+        
+        try:
+            numero_pagina = pagina_inicio
+            while True:
+                self.logger.info(f"{'='*60}")
+                self.logger.info(f"Scrapeando página {numero_pagina}...")
+                self.logger.info(f"{'='*60}")
+                
+                html = await self._capturar_html_pagina_actual()
+                await cola.put((numero_pagina, html))
+                ultima_pagina = numero_pagina
+                
+                if error_consumidor or detener.is_set():
+                    break
+                if pagina_fin is not None and numero_pagina >= pagina_fin:
+                    break
+                
+                puede_avanzar = await self.clickear_en_siguiente_pagina()
+                
+                if not puede_avanzar:
+                    self.logger.info(f"\n{'='*60}")
+                    self.logger.info("No hay más páginas. Proceso completado.")
+                    self.logger.info(f"{'='*60}")
+                    break
+                
+                numero_pagina += 1
+                # Para artefactos HTML de debug (1-indexed)
+                if self.debug:
+                    self._debug_page_idx = numero_pagina
+        finally:
+            await cola.put(None)
+            await tarea_consumidor
+        
+        if error_consumidor:
+            raise ScrapingError(f"Error al extraer datos: {error_consumidor[0]}") from error_consumidor[0]
+        
+        df = await asyncio.to_thread(
+            pd.read_csv, csv_path, encoding="utf-8-sig", dtype=str, keep_default_na=False
+        )
+        
+        self.logger.info(f"\n{'='*60}")
+        self.logger.info(f"✓ Datos guardados en {csv_path}")
+        self.logger.info(f"✓ Páginas scrapeadas: {pagina_inicio}-{ultima_pagina}")
+        self.logger.info(f"✓ Total de registros: {len(df)}")
+        self.logger.info(f"{'='*60}\n")
+        
+        return df
+    
     async def obtener_todas_las_paginas_de_procesos(
         self,
         nombre_archivo_csv: str = "procesos_seace.csv"
@@ -439,53 +966,195 @@ class RegionalScraper(BaseScraper):
         """
         self._ensure_started()
         
-        todos_los_datos = []
-        numero_pagina = 1
+        csv_path = Path(self.config.DATA_OUTPUT_DIR) / nombre_archivo_csv
+        return await self._extraer_rango_de_paginas(1, None, csv_path)
+    
+    async def obtener_paginas_nuevas_de_procesos(
+        self,
+        nombre_archivo_csv: str = "procesos_seace.csv",
+        dataset_existente: Optional[Path] = None,
+        since: Optional[datetime] = None,
+        nomenclaturas_conocidas: Optional[Iterable[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Scraping incremental: pagina solo hasta llegar a procesos ya conocidos.
         
-        # Scrapear primera página
-        self.logger.info(f"{'='*60}")
-        self.logger.info(f"Scrapeando página {numero_pagina}...")
-        self.logger.info(f"{'='*60}")
+        SEACE lista los resultados del más nuevo al más antiguo por fecha de
+        publicación, así que se deja de paginar en cuanto una página queda
+        completamente bajo la marca de agua (fecha `since` y/o nomenclaturas
+        conocidas). Las filas nuevas se combinan con el dataset existente
+        (prevalece la versión recién scrapeada) y se guarda el resultado.
         
-        datos_pagina = await self._extraer_datos_pagina_actual()
-        todos_los_datos.extend(datos_pagina)
-        self.logger.info(f"✓ Página {numero_pagina}: {len(datos_pagina)} registros extraídos")
+        Args:
+            nombre_archivo_csv: Nombre del archivo CSV de salida
+            dataset_existente: CSV previo a actualizar (opcional). Si existe y no se
+                indica otra marca, sus nomenclaturas y su fecha máxima son la marca de agua
+            since: Fecha de publicación desde la cual refrescar (opcional)
+            nomenclaturas_conocidas: Nomenclaturas ya vistas (opcional)
         
-        # Continuar con las siguientes páginas
-        while True:
-            puede_avanzar = await self.clickear_en_siguiente_pagina()
-            
-            if not puede_avanzar:
-                self.logger.info(f"\n{'='*60}")
-                self.logger.info("No hay más páginas. Proceso completado.")
-                self.logger.info(f"{'='*60}")
-                break
-            
-            numero_pagina += 1
-            # Para artefactos HTML de debug (1-indexed)
-            if self.debug:
-                setattr(self, "_debug_page_idx", numero_pagina)
-            self.logger.info(f"\n{'='*60}")
-            self.logger.info(f"Scrapeando página {numero_pagina}...")
-            self.logger.info(f"{'='*60}")
-            
-            datos_pagina = await self._extraer_datos_pagina_actual()
-            todos_los_datos.extend(datos_pagina)
-            self.logger.info(f"✓ Página {numero_pagina}: {len(datos_pagina)} registros extraídos")
-            
-            # Delay entre páginas
-            if self.config.DELAY_BETWEEN_PAGES > 0:
-                await asyncio.sleep(self.config.DELAY_BETWEEN_PAGES)
+        Returns:
+            DataFrame combinado (nuevas + existentes)
+        """
+        self._ensure_started()
+        
+        existente = pd.DataFrame(columns=COLUMNAS_ESPERADAS)
+        if dataset_existente is not None and Path(dataset_existente).exists():
+            existente = pd.read_csv(
+                dataset_existente, encoding="utf-8-sig", dtype=str, keep_default_na=False
+            )
+            if since is None and nomenclaturas_conocidas is None and len(existente) > 0:
+                nomenclaturas_conocidas = set(existente["Nomenclatura"])
+                fechas = pd.to_datetime(
+                    existente["Fecha y Hora de Publicacion"], format=FORMATO_FECHA_PUBLICACION, errors="coerce"
+                )
+                if fechas.notna().any():
+                    since = fechas.max().to_pydatetime()
+        
+        if since is None and nomenclaturas_conocidas is None:
+            self.logger.info("Sin marca de agua: se hará un scraping completo")
+        else:
+            self.logger.info(
+                f"Scraping incremental desde {since or '-'} "
+                f"({len(set(nomenclaturas_conocidas or []))} nomenclaturas conocidas)"
+            )
+        
+        conocidas = set(nomenclaturas_conocidas) if nomenclaturas_conocidas is not None else None
+        
+        def es_pagina_final(df_pagina: pd.DataFrame) -> bool:
+            if since is None and conocidas is None:
+                return False
+            return bool(filas_ya_vistas(df_pagina, since, conocidas).all())
         
-        # Crear DataFrame con todos los datos y guardar en CSV
-        df = pd.DataFrame(todos_los_datos, columns=COLUMNAS_ESPERADAS)
         csv_path = Path(self.config.DATA_OUTPUT_DIR) / nombre_archivo_csv
+        nuevas = await self._extraer_rango_de_paginas(1, None, csv_path, es_pagina_final=es_pagina_final)
+        
+        df = pd.concat([nuevas, existente[COLUMNAS_ESPERADAS]], ignore_index=True)
+        df = df.drop_duplicates(subset=["Nomenclatura"], keep="first").reset_index(drop=True)
+        # "N°" es la posición en el listado: recalcularla tras insertar las nuevas arriba
+        df["N°"] = [str(numero) for numero in range(1, len(df) + 1)]
         df.to_csv(csv_path, index=False, encoding="utf-8-sig")
         
-        self.logger.info(f"\n{'='*60}")
-        self.logger.info(f"✓ Todos los datos guardados en {csv_path}")
-        self.logger.info(f"✓ Total de páginas scrapeadas: {numero_pagina}")
-        self.logger.info(f"✓ Total de registros: {len(todos_los_datos)}")
-        self.logger.info(f"{'='*60}\n")
+        self.logger.info(
+            f"✓ Incremental: {len(df) - len(existente)} procesos nuevos, {len(df)} en total ({csv_path})"
+        )
+        return df
+    
+    async def obtener_todas_las_paginas_por_shards(
+        self,
+        nombre_archivo_csv: str = "procesos_seace.csv",
+        concurrencia: Optional[int] = None,
+        paginas_por_shard: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Extrae todas las páginas repartiendo el rango en shards entre varios contextos.
+        
+        Lee el total de páginas del paginador y divide el rango en shards de
+        `paginas_por_shard` páginas. Cada worker (este scraper + sesiones adicionales
+        sobre el mismo navegador) hace su propia búsqueda, salta al inicio de cada
+        shard que toma y escribe un segmento CSV propio. Al final los segmentos se
+        unen en orden y se eliminan duplicados (los resultados pueden desplazarse
+        entre páginas si SEACE publica algo durante el scraping).
+        
+        Args:
+            nombre_archivo_csv: Nombre del archivo CSV de salida
+            concurrencia: Contextos paginando a la vez (opcional, usa SHARD_CONCURRENCY)
+            paginas_por_shard: Tamaño de cada shard (opcional, usa PAGES_PER_SHARD)
+        
+        Returns:
+            DataFrame con todos los datos extraídos
+        
+        Raises:
+            ScrapingError: Si algún shard no se pudo completar
+        """
+        self._ensure_started()
+        
+        concurrencia = concurrencia or self.config.SHARD_CONCURRENCY
+        paginas_por_shard = paginas_por_shard or self.config.PAGES_PER_SHARD
+        
+        try:
+            info = await self.obtener_info_paginador()
+        except ElementNotFoundError:
+            # Una sola página de resultados no muestra paginador: no hay nada que repartir
+            self.logger.info("Sin paginador, extrayendo de forma secuencial")
+            return await self.obtener_todas_las_paginas_de_procesos(nombre_archivo_csv)
+        rangos = calcular_rangos_de_paginas(info['total_paginas'], paginas_por_shard)
+        
+        if concurrencia <= 1 or len(rangos) <= 1:
+            return await self.obtener_todas_las_paginas_de_procesos(nombre_archivo_csv)
+        
+        num_workers = min(concurrencia, len(rangos))
+        self.logger.info(
+            f"Paginación en paralelo: {info['total_paginas']} páginas en {len(rangos)} shards, "
+            f"{num_workers} contextos"
+        )
+        
+        csv_path = Path(self.config.DATA_OUTPUT_DIR) / nombre_archivo_csv
+        segmentos: Dict[int, pd.DataFrame] = {}
+        errores: List[Exception] = []
+        cola: asyncio.Queue = asyncio.Queue()
+        for indice, rango in enumerate(rangos):
+            cola.put_nowait((indice, rango))
+        
+        async def worker(scraper: "RegionalScraper") -> None:
+            while True:
+                try:
+                    indice, (inicio, fin) = cola.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                
+                ruta_segmento = csv_path.with_name(f"{csv_path.stem}.shard{indice:03d}{csv_path.suffix}")
+                try:
+                    await scraper.ir_a_pagina(inicio)
+                    segmentos[indice] = await scraper._extraer_rango_de_paginas(inicio, fin, ruta_segmento)
+                except Exception as e:
+                    # Devolver el shard para que lo tome otro worker y retirar esta sesión
+                    self.logger.warning(f"Shard {indice} ({inicio}-{fin}) falló: {e}")
+                    errores.append(e)
+                    cola.put_nowait((indice, (inicio, fin)))
+                    return
+        
+        async def worker_en_sesion_adicional() -> None:
+            sesion = None
+            try:
+                sesion = await self.abrir_sesion_adicional(
+                    departamento=self.departamento, anio=self.anio, sinks=self.sinks
+                )
+                await sesion.preparar_busqueda()
+            except Exception as e:
+                self.logger.warning(f"No se pudo preparar un contexto adicional: {e}")
+                errores.append(e)
+                if sesion:
+                    await sesion.close()
+                return
+            try:
+                await worker(sesion)
+            finally:
+                await sesion.close()
+        
+        await asyncio.gather(
+            worker(self),
+            *(worker_en_sesion_adicional() for _ in range(num_workers - 1)),
+        )
+        
+        # Si algún worker devolvió shards a la cola después de que este terminó, completarlos aquí
+        if not cola.empty() and len(segmentos) < len(rangos):
+            await worker(self)
+        
+        faltantes = [indice for indice in range(len(rangos)) if indice not in segmentos]
+        if faltantes:
+            raise ScrapingError(
+                f"No se completaron {len(faltantes)} shards: {faltantes}"
+                + (f" (último error: {errores[-1]})" if errores else "")
+            )
+        
+        df = pd.concat([segmentos[indice] for indice in range(len(rangos))], ignore_index=True)
+        # "N°" es la posición en el listado: no sirve para detectar duplicados entre shards
+        columnas_clave = [columna for columna in COLUMNAS_ESPERADAS if columna != "N°"]
+        df = df.drop_duplicates(subset=columnas_clave, keep="first").reset_index(drop=True)
+        df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+        
+        for indice in range(len(rangos)):
+            csv_path.with_name(f"{csv_path.stem}.shard{indice:03d}{csv_path.suffix}").unlink(missing_ok=True)
         
+        self.logger.info(f"✓ {len(rangos)} shards unidos en {csv_path}: {len(df)} registros")
         return df
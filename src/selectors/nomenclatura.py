@@ -37,6 +37,8 @@ SELECTORS = {
     'documentos_cells': 'td',
     'documentos_download_link': 'a:has(span)',
     'documentos_size_span': 'a span',
+    # Enlace de un documento puntual por su uuid (primer argumento de descargaDocGeneral)
+    'documentos_link_por_uuid': "a[onclick*=\"descargaDocGeneral('{uuid}'\"]",
 }
 
 # Índices de columnas en la tabla de cronograma
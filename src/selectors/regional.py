@@ -23,6 +23,9 @@ SELECTORS = {
     'year_panel': '#tbBuscador\\:idFormBuscarProceso\\:anioConvocatoria_panel',
     'year_item': "li[data-label='{anio}']",  # Usar .format() o f-string
     
+    # Ítems de los paneles de departamento/año (para listar opciones)
+    'panel_item': 'li[data-label]',
+    
     # Botón de buscar
     'search_button': '#tbBuscador\\:idFormBuscarProceso\\:btnBuscarSelToken',
     
@@ -38,8 +41,17 @@ SELECTORS = {
     # Paginador
     'pagination_container': '#tbBuscador\\:idFormBuscarProceso\\:dtProcesos_paginator_bottom',
     'pagination_next': 'span.ui-paginator-next',
+    'pagination_page': 'span.ui-paginator-page',
+    # Texto tipo: "[ Mostrando de 1 a 15 del total 32 - Página: 1/3 ]"
+    'pagination_current': 'span.ui-paginator-current',
+
+    # clientId del datatable (para ubicar su widget PrimeFaces desde JS)
+    'results_table_id': 'tbBuscador:idFormBuscarProceso:dtProcesos',
 }
 
+# Opción vacía de los selectOneMenu (no es un valor real)
+OPCION_PLACEHOLDER = "[Seleccione]"
+
 # Nombres de columnas esperadas
 COLUMNAS_ESPERADAS = [
     "N°",
@@ -54,6 +66,12 @@ COLUMNAS_ESPERADAS = [
     "Versión SEACE"
 ]
 
+# Formato de "Fecha y Hora de Publicacion" (ej: "28/01/2026 15:09")
+FORMATO_FECHA_PUBLICACION = "%d/%m/%Y %H:%M"
+
+# Filas por página del datatable de resultados
+REGISTROS_POR_PAGINA = 15
+
 # Índices de columnas a extraer (excluyendo SNIP, CUI y Acciones)
 INDICES_COLUMNAS = [0, 1, 2, 3, 4, 5, 6, 9, 10, 11]
 
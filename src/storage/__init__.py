@@ -0,0 +1 @@
+"""Persistencia de datasets y procesos scrapeados."""
@@ -0,0 +1,99 @@
+"""
+Exportación de datasets regionales como stream Arrow IPC.
+
+Los lotes salen del Parquet del dataset (tal cual, sin reconvertir) o del
+ProcesoStore (paginando por cursor), siempre con ESQUEMA_PARQUET, y se
+serializan de a un record batch: nunca se arma el dataset completo en memoria
+ni se pasa por JSON.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .normalizacion import COLUMNA_FECHA
+from .parquet import ESQUEMA_PARQUET, tabla_arrow
+from .sqlite_store import COLUMNAS_DB, FORMATO_FECHA_ISO, ProcesoStore
+
+# Filas por record batch
+FILAS_POR_LOTE = 10_000
+
+MEDIA_TYPE_ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+# Columna en la tabla `procesos` -> columna del dataset
+_COLUMNAS_DATASET = {columna_db: columna for columna, columna_db in COLUMNAS_DB.items()}
+
+
+class _BufferSalida:
+    """Destino tipo archivo que acumula lo escrito hasta que se vacía."""
+
+    def __init__(self):
+        self._partes: List[bytes] = []
+        self.closed = False
+
+    def write(self, datos) -> int:
+        self._partes.append(bytes(datos))
+        return len(datos)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def vaciar(self) -> bytes:
+        datos = b"".join(self._partes)
+        self._partes.clear()
+        return datos
+
+
+def lotes_desde_parquet(path: str | Path, filas_por_lote: Optional[int] = None) -> Iterator[pa.RecordBatch]:
+    """Lee un Parquet de a record batches."""
+    yield from pq.ParquetFile(path).iter_batches(batch_size=filas_por_lote or FILAS_POR_LOTE)
+
+
+def lotes_desde_store(
+    store: ProcesoStore,
+    departamento: str,
+    anio: str,
+    filas_por_lote: Optional[int] = None,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Lee los procesos de un departamento/año del store por páginas (keyset) y
+    convierte cada página en un record batch con ESQUEMA_PARQUET.
+    """
+    cursor: Optional[str] = None
+    campos = list(_COLUMNAS_DATASET)
+    while True:
+        filas, cursor = store.consultar(
+            departamento=departamento,
+            anio=anio,
+            campos=campos,
+            limit=filas_por_lote or FILAS_POR_LOTE,
+            cursor=cursor,
+        )
+        if filas:
+            df = pd.DataFrame(filas, columns=campos).rename(columns=_COLUMNAS_DATASET)
+            df[COLUMNA_FECHA] = pd.to_datetime(df[COLUMNA_FECHA], format=FORMATO_FECHA_ISO, errors="coerce")
+            yield from tabla_arrow(df).to_batches()
+        if cursor is None:
+            return
+
+
+def stream_ipc(lotes: Iterable[pa.RecordBatch], esquema: pa.Schema = ESQUEMA_PARQUET) -> Iterator[bytes]:
+    """
+    Serializa record batches como stream Arrow IPC, devolviendo los bytes de a un
+    mensaje (esquema, cada batch y el marcador de fin).
+    """
+    buffer = _BufferSalida()
+    with pa.ipc.new_stream(buffer, esquema) as writer:
+        yield buffer.vaciar()
+        for lote in lotes:
+            writer.write_batch(lote)
+            yield buffer.vaciar()
+    yield buffer.vaciar()
@@ -0,0 +1,76 @@
+"""
+Catálogo de datasets publicados.
+
+Al publicar una versión se describen sus archivos (formato, tamaño, sha256)
+junto con las métricas del scraping que la generó, y se guardan en la tabla
+`datasets` del ProcesoStore. Listar datasets es entonces una consulta, sin
+recorrer `data/` ni abrir archivos.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Sufijo -> formato en el catálogo
+FORMATOS_POR_SUFIJO = {
+    ".csv": "csv",
+    ".csv.gz": "csv+gzip",
+    ".csv.zst": "csv+zstd",
+    ".parquet": "parquet",
+}
+
+
+def formato_de_archivo(path: Path) -> Optional[str]:
+    """Formato de catálogo de un archivo, o None si no es un archivo de dataset."""
+    for sufijo, formato in sorted(FORMATOS_POR_SUFIJO.items(), key=lambda item: -len(item[0])):
+        if path.name.endswith(sufijo):
+            return formato
+    return None
+
+
+def sha256_archivo(path: Path) -> str:
+    """Checksum SHA-256 de un archivo, leído por bloques."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as archivo:
+        for bloque in iter(lambda: archivo.read(1024 * 1024), b""):
+            digest.update(bloque)
+    return digest.hexdigest()
+
+
+def describir_version(
+    version_dir: Path,
+    *,
+    departamento: str,
+    anio: str,
+    filas: int,
+    paginas: int,
+    iniciado_en: str,
+    finalizado_en: str,
+) -> List[Dict[str, Any]]:
+    """
+    Arma las entradas de catálogo de los archivos de una versión publicada.
+
+    Returns:
+        Una entrada por archivo de dataset (columnas de la tabla `datasets`)
+    """
+    entradas = []
+    for path in sorted(version_dir.iterdir()):
+        formato = formato_de_archivo(path)
+        if formato is None or not path.is_file():
+            continue
+        entradas.append({
+            "departamento": departamento.upper(),
+            "anio": str(anio),
+            "version": version_dir.name,
+            "formato": formato,
+            "path": str(path),
+            "filas": filas,
+            "paginas": paginas,
+            "iniciado_en": iniciado_en,
+            "finalizado_en": finalizado_en,
+            "bytes": path.stat().st_size,
+            "sha256": sha256_archivo(path),
+        })
+    return entradas
@@ -0,0 +1,254 @@
+"""
+Change-data-capture entre snapshots consecutivos de un departamento/año.
+
+Cada proceso se identifica por su Nomenclatura y se resume con un hash de sus
+columnas (sin "N°", que solo es la posición en el listado). Al registrar un
+snapshot se compara contra el estado anterior y se agregan al log las
+altas (insert), cambios (update) y bajas (delete).
+
+Layout en disco (por departamento/año):
+    {base_dir}/cambios/{DEPARTAMENTO}_{ANIO}/estado.json   -> {nomenclatura: hash}
+    {base_dir}/cambios/{DEPARTAMENTO}_{ANIO}/cambios.jsonl -> un evento por línea
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from ..selectors.regional import COLUMNAS_ESPERADAS
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Columnas que definen el contenido de un proceso ("N°" cambia con cada publicación nueva)
+COLUMNAS_HASH = [columna for columna in COLUMNAS_ESPERADAS if columna != "N°"]
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _a_utc(fecha: datetime) -> datetime:
+    """Normaliza a UTC (las fechas sin zona se asumen UTC)."""
+    if fecha.tzinfo is None:
+        return fecha.replace(tzinfo=timezone.utc)
+    return fecha.astimezone(timezone.utc)
+
+
+def hash_filas(df: pd.DataFrame) -> pd.Series:
+    """
+    Calcula el hash de contenido de cada fila.
+
+    Returns:
+        Serie de hashes (sha1 hex) alineada con `df`
+    """
+    if df.empty:
+        return pd.Series([], index=df.index, dtype=object)
+    texto = df[COLUMNAS_HASH].fillna("").astype(str).agg("\x1f".join, axis=1)
+    return texto.map(lambda valor: hashlib.sha1(valor.encode("utf-8")).hexdigest())
+
+
+def calcular_cambios(estado_anterior: Dict[str, str], df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Compara un snapshot contra el estado anterior.
+
+    Args:
+        estado_anterior: {nomenclatura: hash} del snapshot previo
+        df: Snapshot actual (columnas COLUMNAS_ESPERADAS)
+
+    Returns:
+        {"inserts": [filas], "updates": [filas], "deletes": [nomenclaturas], "estado": {nomenclatura: hash}}
+        Cada fila incluye además la clave "_hash".
+    """
+    df = df[df["Nomenclatura"].astype(str) != ""].drop_duplicates(subset=["Nomenclatura"], keep="first")
+    hashes = hash_filas(df)
+    estado = dict(zip(df["Nomenclatura"], hashes))
+
+    inserts: List[Dict[str, Any]] = []
+    updates: List[Dict[str, Any]] = []
+    for fila, hash_fila in zip(df[COLUMNAS_ESPERADAS].to_dict(orient="records"), hashes):
+        anterior = estado_anterior.get(fila["Nomenclatura"])
+        if anterior is None:
+            inserts.append({**fila, "_hash": hash_fila})
+        elif anterior != hash_fila:
+            updates.append({**fila, "_hash": hash_fila})
+
+    deletes = [nomenclatura for nomenclatura in estado_anterior if nomenclatura not in estado]
+    return {"inserts": inserts, "updates": updates, "deletes": deletes, "estado": estado}
+
+
+class RegistroCambios:
+    """Log de cambios por departamento/año en disco (estado + eventos JSONL)."""
+
+    def __init__(self, base_dir: str):
+        """
+        Args:
+            base_dir: Directorio de datos (se usa `{base_dir}/cambios`)
+        """
+        self.base_dir = Path(base_dir) / "cambios"
+        self._lock = threading.Lock()
+
+    def _dir(self, departamento: str, anio: str) -> Path:
+        return self.base_dir / f"{departamento.upper()}_{anio}"
+
+    def _leer_estado(self, directorio: Path) -> Dict[str, str]:
+        ruta = directorio / "estado.json"
+        if not ruta.exists():
+            return {}
+        estado: Dict[str, str] = json.loads(ruta.read_text(encoding="utf-8"))
+        return estado
+
+    def registrar_snapshot(
+        self,
+        departamento: str,
+        anio: str,
+        df: pd.DataFrame,
+        snapshot_at: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Registra un snapshot completo y agrega al log los cambios respecto al anterior.
+
+        Args:
+            departamento: Departamento del snapshot
+            anio: Año de convocatoria
+            df: Snapshot completo (no usar con extracciones parciales: generaría bajas falsas)
+            snapshot_at: Marca de tiempo ISO (opcional, ahora)
+
+        Returns:
+            Resumen {"snapshot_at", "inserts", "updates", "deletes"} con los conteos
+        """
+        snapshot_at = snapshot_at or _now_iso()
+        directorio = self._dir(departamento, anio)
+
+        with self._lock:
+            directorio.mkdir(parents=True, exist_ok=True)
+            cambios = calcular_cambios(self._leer_estado(directorio), df)
+
+            with open(directorio / "cambios.jsonl", "a", encoding="utf-8") as log:
+                for op, filas in (("insert", cambios["inserts"]), ("update", cambios["updates"])):
+                    for fila in filas:
+                        hash_fila = fila.pop("_hash")
+                        evento = {
+                            "snapshot_at": snapshot_at,
+                            "op": op,
+                            "nomenclatura": fila["Nomenclatura"],
+                            "hash": hash_fila,
+                            "fila": fila,
+                        }
+                        log.write(json.dumps(evento, ensure_ascii=False, default=str) + "\n")
+                for nomenclatura in cambios["deletes"]:
+                    evento = {"snapshot_at": snapshot_at, "op": "delete", "nomenclatura": nomenclatura}
+                    log.write(json.dumps(evento, ensure_ascii=False) + "\n")
+
+            # Reemplazo atómico del estado: un lector nunca ve un JSON a medio escribir
+            ruta_tmp = directorio / "estado.json.tmp"
+            ruta_tmp.write_text(json.dumps(cambios["estado"], ensure_ascii=False), encoding="utf-8")
+            os.replace(ruta_tmp, directorio / "estado.json")
+
+        resumen = {
+            "snapshot_at": snapshot_at,
+            "inserts": len(cambios["inserts"]),
+            "updates": len(cambios["updates"]),
+            "deletes": len(cambios["deletes"]),
+        }
+        logger.info(f"CDC {departamento.upper()}/{anio}: {resumen}")
+        return resumen
+
+    def existe(self, departamento: str, anio: str) -> bool:
+        """True si hay al menos un snapshot registrado para el departamento/año."""
+        return (self._dir(departamento, anio) / "estado.json").exists()
+
+    def obtener_cambios(
+        self,
+        departamento: str,
+        anio: str,
+        since: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Lee los eventos del log posteriores a `since`.
+
+        Args:
+            departamento: Departamento
+            anio: Año de convocatoria
+            since: Solo eventos de snapshots estrictamente posteriores (opcional, todos)
+
+        Returns:
+            Lista de eventos en orden de registro
+        """
+        eventos, _ = self.pagina_cambios(departamento, anio, since=since)
+        return eventos
+
+    def pagina_cambios(
+        self,
+        departamento: str,
+        anio: str,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Lee como máximo `limit` eventos del log posteriores a `since`.
+
+        El cursor es la posición en bytes del siguiente evento en `cambios.jsonl`;
+        como el log solo crece, sigue siendo válido entre requests y la siguiente
+        página se lee desde ahí sin recorrer el log de nuevo.
+
+        Args:
+            departamento: Departamento
+            anio: Año de convocatoria
+            since: Solo eventos de snapshots estrictamente posteriores (opcional, todos)
+            limit: Máximo de eventos a devolver (opcional, sin límite)
+            cursor: `next_cursor` de la página anterior (opcional)
+
+        Returns:
+            (eventos en orden de registro, cursor de la siguiente página o None)
+
+        Raises:
+            ValueError: Si el cursor no es válido
+        """
+        inicio = 0
+        if cursor is not None:
+            try:
+                inicio = int(cursor)
+            except ValueError:
+                raise ValueError(f"Cursor inválido: {cursor}") from None
+            if inicio < 0:
+                raise ValueError(f"Cursor inválido: {cursor}")
+
+        ruta = self._dir(departamento, anio) / "cambios.jsonl"
+        if not ruta.exists():
+            return [], None
+
+        desde = _a_utc(since) if since is not None else None
+        eventos: List[Dict[str, Any]] = []
+        with open(ruta, "rb") as log:
+            log.seek(inicio)
+            while True:
+                posicion = log.tell()
+                linea = log.readline()
+                if not linea:
+                    return eventos, None
+                if not linea.strip():
+                    continue
+                try:
+                    evento = json.loads(linea)
+                except ValueError:
+                    # Un cursor que no cae al inicio de una línea deja un fragmento
+                    if cursor is None or posicion != inicio:
+                        raise
+                    raise ValueError(f"Cursor inválido: {cursor}") from None
+                if desde is not None:
+                    snapshot_at = datetime.fromisoformat(evento["snapshot_at"].replace("Z", "+00:00"))
+                    if snapshot_at <= desde:
+                        continue
+                if limit is not None and len(eventos) >= limit:
+                    return eventos, str(posicion)
+                eventos.append(evento)
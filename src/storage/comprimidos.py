@@ -0,0 +1,125 @@
+"""
+Variantes precomprimidas (zstd / gzip) de los datasets descargables.
+
+Se generan una sola vez, al terminar de escribir el CSV, y se guardan junto a
+él (`procesos.csv.zst`, `procesos.csv.gz`). La descarga elige la variante según
+`Accept-Encoding` y la sirve tal cual, sin comprimir en cada request.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pyarrow as pa
+
+# Content-Encoding -> sufijo del archivo, en orden de preferencia
+VARIANTES: Dict[str, str] = {
+    "zstd": ".zst",
+    "gzip": ".gz",
+}
+
+
+def ruta_variante(path: str | Path, codificacion: str) -> Path:
+    """Ruta de la variante comprimida de `path` (ej: procesos.csv.gz)."""
+    path = Path(path)
+    return path.with_name(path.name + VARIANTES[codificacion])
+
+
+def _comprimir(origen: Path, destino: Path, codificacion: str) -> None:
+    temporal = destino.with_name(destino.name + ".part")
+    with open(origen, "rb") as entrada:
+        if codificacion == "gzip":
+            with gzip.open(temporal, "wb", compresslevel=6) as salida:
+                shutil.copyfileobj(entrada, salida, 1024 * 1024)
+        else:
+            # pyarrow ya es dependencia y trae zstd (frames estándar)
+            with pa.CompressedOutputStream(str(temporal), codificacion) as salida:
+                shutil.copyfileobj(entrada, salida, 1024 * 1024)
+    os.replace(temporal, destino)
+
+
+def precomprimir(path: str | Path, codificaciones: Iterable[str] = tuple(VARIANTES)) -> List[Path]:
+    """
+    Genera las variantes comprimidas de un archivo.
+
+    Args:
+        path: Archivo original
+        codificaciones: Content-Encodings a generar ("zstd", "gzip")
+
+    Returns:
+        Rutas de las variantes escritas
+
+    Raises:
+        ValueError: Si alguna codificación no está soportada
+    """
+    path = Path(path)
+    generadas = []
+    for codificacion in codificaciones:
+        if codificacion not in VARIANTES:
+            raise ValueError(f"Codificación no soportada: {codificacion}")
+        destino = ruta_variante(path, codificacion)
+        _comprimir(path, destino, codificacion)
+        generadas.append(destino)
+    return generadas
+
+
+def variante_vigente(path: str | Path, codificacion: str) -> Optional[Path]:
+    """
+    Devuelve la variante comprimida si existe y no es más vieja que el original
+    (si el CSV se reescribió sin recomprimir, la variante ya no corresponde).
+    """
+    variante = ruta_variante(path, codificacion)
+    try:
+        if variante.stat().st_mtime_ns >= Path(path).stat().st_mtime_ns:
+            return variante
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def _codificaciones_aceptadas(accept_encoding: str) -> Dict[str, float]:
+    aceptadas: Dict[str, float] = {}
+    for parte in accept_encoding.split(","):
+        nombre, _, parametros = parte.strip().partition(";")
+        nombre = nombre.strip().lower()
+        if not nombre:
+            continue
+        calidad = 1.0
+        parametro = parametros.strip()
+        if parametro.startswith("q="):
+            try:
+                calidad = float(parametro[2:])
+            except ValueError:
+                calidad = 0.0
+        aceptadas[nombre] = calidad
+    return aceptadas
+
+
+def elegir_variante(path: str | Path, accept_encoding: Optional[str]) -> Tuple[Path, Optional[str]]:
+    """
+    Elige qué archivo servir según el header `Accept-Encoding`.
+
+    Prefiere la codificación con mayor q; a igual q, el orden de VARIANTES.
+
+    Returns:
+        (ruta a servir, Content-Encoding o None para el original)
+    """
+    aceptadas = _codificaciones_aceptadas(accept_encoding or "")
+    comodin = aceptadas.get("*", 0.0)
+    candidatas = sorted(
+        (
+            (-aceptadas.get(codificacion, comodin), orden, codificacion)
+            for orden, codificacion in enumerate(VARIANTES)
+        ),
+    )
+    for calidad_negativa, _, codificacion in candidatas:
+        if calidad_negativa >= 0:
+            break
+        variante = variante_vigente(path, codificacion)
+        if variante is not None:
+            return variante, codificacion
+    return Path(path), None
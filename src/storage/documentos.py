@@ -0,0 +1,181 @@
+"""
+Archivo por contenido de los documentos de una ficha (PDF, ZIP, ...).
+
+Cada documento se descarga en streaming (cliente HTTP con pool de conexiones y
+concurrencia acotada) a un temporal mientras se calcula su SHA-256. Al
+terminar, el temporal se mueve a `{base_dir}/blobs/{sha[:2]}/{sha}`; si ese
+blob ya existía (mismo archivo publicado en otra ficha, o ya archivado) se
+descarta. La memoria usada no depende del tamaño del archivo.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from ..utils.logging import get_logger
+from ..utils.rate_limit import LimitadorHosts
+
+logger = get_logger(__name__)
+
+# Bytes leídos y escritos por vez
+BLOQUE_BYTES = 1024 * 1024
+
+
+class ArchivoDocumentos:
+    """Blobs direccionados por SHA-256 bajo un directorio base."""
+
+    def __init__(self, base_dir: str):
+        """
+        Args:
+            base_dir: Directorio del archivo (ej: DOCUMENT_ARCHIVE_DIR)
+        """
+        self.base_dir = Path(base_dir)
+
+    @property
+    def dir_temporal(self) -> Path:
+        # Dentro de base_dir: el rename final queda en el mismo filesystem
+        return self.base_dir / ".tmp"
+
+    def ruta_blob(self, sha256: str) -> Path:
+        return self.base_dir / "blobs" / sha256[:2] / sha256
+
+    def existe(self, sha256: str) -> bool:
+        return self.ruta_blob(sha256).exists()
+
+    async def guardar_stream(self, bloques: AsyncIterator[bytes]) -> Tuple[str, int, bool]:
+        """
+        Escribe un stream de bytes como blob, calculando el hash al vuelo.
+
+        Returns:
+            (sha256, tamaño en bytes, True si el blob es nuevo)
+        """
+        self.dir_temporal.mkdir(parents=True, exist_ok=True)
+        temporal = self.dir_temporal / f"{uuid.uuid4().hex}.part"
+        digest = hashlib.sha256()
+        tamaño = 0
+        try:
+            # Abrir y cerrar también bloquean (el cierre vacía el buffer a disco)
+            salida = await asyncio.to_thread(open, temporal, "wb")
+            try:
+                async for bloque in bloques:
+                    digest.update(bloque)
+                    tamaño += len(bloque)
+                    await asyncio.to_thread(salida.write, bloque)
+            finally:
+                await asyncio.to_thread(salida.close)
+
+            sha256 = digest.hexdigest()
+            destino = self.ruta_blob(sha256)
+            if destino.exists():
+                return sha256, tamaño, False
+            destino.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(temporal, destino)
+            return sha256, tamaño, True
+        finally:
+            temporal.unlink(missing_ok=True)
+
+
+async def archivar_documentos(
+    documentos: List[Dict[str, Any]],
+    archivo: ArchivoDocumentos,
+    *,
+    concurrencia: int = 4,
+    timeout: float = 60.0,
+    ya_archivados: Optional[Dict[str, str]] = None,
+    cliente: Optional[httpx.AsyncClient] = None,
+    limitador: Optional[LimitadorHosts] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Descarga y archiva los documentos con `link_descarga`.
+
+    Args:
+        documentos: Documentos de `scrapear_documentos_con_links` (con links resueltos)
+        archivo: Destino de los blobs
+        concurrencia: Descargas simultáneas (y tamaño del pool de conexiones)
+        timeout: Timeout HTTP por operación, en segundos
+        ya_archivados: uuid -> sha256 de documentos archivados antes; si el blob
+            sigue en disco no se vuelven a descargar
+        cliente: Cliente HTTP a reutilizar (si no, se crea uno para el lote)
+        limitador: Limitador por host a respetar en cada descarga (opcional)
+
+    Returns:
+        Una entrada de manifiesto por documento, en el mismo orden, con `status`
+        "archivado" (blob nuevo), "existente" (contenido ya archivado),
+        "sin_link" o "failed" (y `error`)
+    """
+    ya_archivados = ya_archivados or {}
+    concurrencia = max(1, concurrencia)
+    resultados: List[Dict[str, Any]] = []
+
+    cola: asyncio.Queue = asyncio.Queue()
+    for documento in documentos:
+        entrada: Dict[str, Any] = {
+            "uuid": documento.get("uuid"),
+            "nombre_archivo": documento.get("nombre_archivo"),
+            "link_descarga": documento.get("link_descarga"),
+            "sha256": None,
+            "tamaño_bytes": None,
+            "status": None,
+            "error": None,
+        }
+        resultados.append(entrada)
+        uuid_documento: Optional[str] = entrada["uuid"]
+        sha_previo = ya_archivados.get(uuid_documento) if uuid_documento else None
+        if sha_previo and archivo.existe(sha_previo):
+            entrada.update(
+                sha256=sha_previo,
+                tamaño_bytes=archivo.ruta_blob(sha_previo).stat().st_size,
+                status="existente",
+            )
+        elif not entrada["link_descarga"]:
+            entrada["status"] = "sin_link"
+        else:
+            cola.put_nowait(entrada)
+
+    if cola.empty():
+        return resultados
+
+    async def descargar(http: httpx.AsyncClient, entrada: Dict[str, Any]) -> None:
+        if limitador is not None:
+            await limitador.adquirir(urlparse(entrada["link_descarga"]).hostname)
+        async with http.stream("GET", entrada["link_descarga"]) as respuesta:
+            respuesta.raise_for_status()
+            sha256, tamaño, nuevo = await archivo.guardar_stream(respuesta.aiter_bytes(BLOQUE_BYTES))
+        entrada.update(sha256=sha256, tamaño_bytes=tamaño, status="archivado" if nuevo else "existente")
+
+    async def worker(http: httpx.AsyncClient) -> None:
+        while True:
+            try:
+                entrada = cola.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                await descargar(http, entrada)
+            except Exception as e:
+                logger.warning(f"No se pudo archivar {entrada['nombre_archivo']}: {e}")
+                entrada.update(status="failed", error=str(e))
+
+    async def procesar(http: httpx.AsyncClient) -> None:
+        await asyncio.gather(*(worker(http) for _ in range(min(concurrencia, cola.qsize()))))
+
+    if cliente is not None:
+        await procesar(cliente)
+    else:
+        async with httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=concurrencia, max_keepalive_connections=concurrencia),
+        ) as http:
+            await procesar(http)
+
+    archivados = sum(1 for entrada in resultados if entrada["status"] == "archivado")
+    logger.info(f"Documentos archivados: {archivados} nuevos de {len(documentos)}")
+    return resultados
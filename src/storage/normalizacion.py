@@ -0,0 +1,83 @@
+"""
+Normalización tipada (vectorizada) de las columnas del scraper regional.
+
+El scraper entrega todo como texto tal cual aparece en SEACE ("28/01/2026 15:09",
+"98,600.00", "---", "Soles"). Aquí se convierte cada lote de filas a tipos de
+pandas con operaciones por columna, sin recorrer celdas en Python:
+
+- N° y Versión SEACE: enteros (Int64, admite nulos); Versión además categórica
+- Fecha y Hora de Publicacion: datetime64
+- VR / VE / Cuantía: float64, con "---" o vacío como NaN
+- Moneda y Objeto de Contratación: categóricas (pocos valores muy repetidos)
+
+El CSV y el hash de CDC siguen usando el texto original; los sinks (SQLite,
+Parquet) reciben la versión tipada.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from ..selectors.regional import COLUMNAS_ESPERADAS, FORMATO_FECHA_PUBLICACION
+
+COLUMNA_NUMERO = "N°"
+COLUMNA_FECHA = "Fecha y Hora de Publicacion"
+COLUMNA_MONTO = "VR / VE / Cuantía de la contratación"
+COLUMNA_VERSION = "Versión SEACE"
+COLUMNAS_CATEGORICAS = ["Objeto de Contratación", "Moneda", COLUMNA_VERSION]
+
+# Valores que SEACE usa para "sin monto"
+VALORES_MONTO_NULO = ["", "---", "-"]
+
+
+def _a_texto(serie: pd.Series) -> pd.Series:
+    return serie.astype("string").str.strip()
+
+
+def _normalizar_fecha(serie: pd.Series) -> pd.Series:
+    if pd.api.types.is_datetime64_any_dtype(serie):
+        return serie
+    return pd.to_datetime(_a_texto(serie), format=FORMATO_FECHA_PUBLICACION, errors="coerce")
+
+
+def _normalizar_monto(serie: pd.Series) -> pd.Series:
+    if pd.api.types.is_float_dtype(serie):
+        return serie
+    texto = _a_texto(serie)
+    texto = texto.mask(texto.isin(VALORES_MONTO_NULO))
+    # "98,600.00" -> "98600.00"
+    return pd.to_numeric(texto.str.replace(",", "", regex=False), errors="coerce").astype("float64")
+
+
+def _normalizar_entero(serie: pd.Series) -> pd.Series:
+    if pd.api.types.is_integer_dtype(serie):
+        return serie
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        serie = serie.astype(object)
+    return pd.to_numeric(_a_texto(serie), errors="coerce").astype("Int64")
+
+
+def normalizar_procesos(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Devuelve una copia de `df` (columnas COLUMNAS_ESPERADAS) con tipos normalizados.
+
+    Es idempotente: columnas que ya tienen el tipo destino no se vuelven a convertir.
+
+    Args:
+        df: Filas tal cual las entrega el scraper (texto)
+
+    Returns:
+        DataFrame tipado con las mismas columnas y orden
+    """
+    tipado = df[COLUMNAS_ESPERADAS].copy()
+
+    tipado[COLUMNA_NUMERO] = _normalizar_entero(tipado[COLUMNA_NUMERO])
+    tipado[COLUMNA_FECHA] = _normalizar_fecha(tipado[COLUMNA_FECHA])
+    tipado[COLUMNA_MONTO] = _normalizar_monto(tipado[COLUMNA_MONTO])
+    tipado[COLUMNA_VERSION] = _normalizar_entero(tipado[COLUMNA_VERSION])
+
+    for columna in COLUMNAS_CATEGORICAS:
+        if not isinstance(tipado[columna].dtype, pd.CategoricalDtype):
+            tipado[columna] = tipado[columna].astype("category")
+
+    return tipado
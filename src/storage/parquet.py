@@ -0,0 +1,93 @@
+"""
+Escritura de datasets regionales en Parquet.
+
+Las filas se normalizan por lote (ver `normalizacion`) y cada lote se escribe
+como un row group comprimido. Fecha de publicación, monto y N° llevan
+estadísticas min/max, así los lectores pueden saltarse row groups completos al
+filtrar por fecha o monto.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .normalizacion import COLUMNA_FECHA, COLUMNA_MONTO, COLUMNA_NUMERO, normalizar_procesos
+
+ESQUEMA_PARQUET = pa.schema(
+    [
+        pa.field("N°", pa.int64()),
+        pa.field("Nombre o Sigla de la Entidad", pa.string()),
+        pa.field(COLUMNA_FECHA, pa.timestamp("ms")),
+        pa.field("Nomenclatura", pa.string()),
+        pa.field("Reiniciado Desde", pa.string()),
+        pa.field("Objeto de Contratación", pa.string()),
+        pa.field("Descripción de Objeto", pa.string()),
+        pa.field(COLUMNA_MONTO, pa.float64()),
+        pa.field("Moneda", pa.string()),
+        pa.field("Versión SEACE", pa.int64()),
+    ]
+)
+
+COLUMNAS_CON_ESTADISTICAS = [COLUMNA_NUMERO, COLUMNA_FECHA, COLUMNA_MONTO]
+
+
+def ruta_parquet(csv_path: str | Path) -> Path:
+    """Ruta del Parquet que acompaña a un CSV (mismo nombre, extensión .parquet)."""
+    return Path(csv_path).with_suffix(".parquet")
+
+
+def tabla_arrow(df: pd.DataFrame) -> pa.Table:
+    """Convierte filas (texto o tipadas) a una tabla Arrow con ESQUEMA_PARQUET."""
+    tipado = normalizar_procesos(df)
+    # Parquet ya codifica por diccionario; las categóricas se guardan como texto
+    # para que todos los row groups compartan el mismo esquema.
+    for columna in tipado.columns:
+        if isinstance(tipado[columna].dtype, pd.CategoricalDtype):
+            tipado[columna] = tipado[columna].astype(object)
+    return pa.Table.from_pandas(tipado, schema=ESQUEMA_PARQUET, preserve_index=False)
+
+
+def escribir_parquet(
+    df: pd.DataFrame,
+    path: str | Path,
+    filas_por_grupo: int,
+    compresion: str = "zstd",
+) -> Path:
+    """
+    Escribe `df` en Parquet, un row group cada `filas_por_grupo` filas.
+
+    Se escribe a un archivo temporal y se renombra al final, así un lector nunca
+    ve un Parquet a medio escribir.
+
+    Args:
+        df: Dataset (columnas COLUMNAS_ESPERADAS)
+        path: Ruta destino
+        filas_por_grupo: Filas por row group
+        compresion: Códec de Parquet
+
+    Returns:
+        Ruta del archivo escrito
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporal = path.with_name(path.name + ".part")
+    filas_por_grupo = max(1, filas_por_grupo)
+
+    with pq.ParquetWriter(
+        temporal,
+        ESQUEMA_PARQUET,
+        compression=compresion,
+        write_statistics=COLUMNAS_CON_ESTADISTICAS,
+    ) as writer:
+        if df.empty:
+            writer.write_table(ESQUEMA_PARQUET.empty_table())
+        for inicio in range(0, len(df), filas_por_grupo):
+            writer.write_table(tabla_arrow(df.iloc[inicio:inicio + filas_por_grupo]))
+
+    os.replace(temporal, path)
+    return path
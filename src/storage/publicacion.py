@@ -0,0 +1,129 @@
+"""
+Publicación atómica y versionada de datasets regionales.
+
+Cada scraping escribe en su propio directorio de staging
+(`{base_dir}/.staging/{id}/`). Al terminar, el directorio completo se mueve
+con un solo rename a `{base_dir}/datasets/{DEP}_{ANIO}/{version}/` y se
+actualiza el puntero `LATEST` (también por rename). Así dos jobs del mismo
+departamento/año no se pisan y un lector nunca ve un archivo a medio escribir.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+ARCHIVO_LATEST = "LATEST"
+
+
+class PublicadorDatasets:
+    """Namespace de salida por job y publicación versionada con puntero LATEST."""
+
+    def __init__(self, base_dir: str, versiones_a_conservar: int = 5):
+        """
+        Args:
+            base_dir: Directorio base de datos (ej: DATA_OUTPUT_DIR)
+            versiones_a_conservar: Versiones publicadas que se conservan por dataset
+        """
+        self.base_dir = Path(base_dir)
+        self.versiones_a_conservar = max(1, versiones_a_conservar)
+        self._lock = threading.Lock()
+
+    @property
+    def dir_staging(self) -> Path:
+        # Dentro de base_dir: el rename de publicación queda en el mismo filesystem
+        return self.base_dir / ".staging"
+
+    def dir_dataset(self, departamento: str, anio: str) -> Path:
+        return self.base_dir / "datasets" / f"{departamento.upper()}_{anio}"
+
+    def preparar_staging(self) -> Path:
+        """Crea un directorio de trabajo exclusivo para un job."""
+        staging = self.dir_staging / uuid.uuid4().hex
+        staging.mkdir(parents=True)
+        return staging
+
+    def version_latest(self, departamento: str, anio: str) -> Optional[str]:
+        """Versión a la que apunta LATEST, o None si nunca se publicó."""
+        try:
+            version = (self.dir_dataset(departamento, anio) / ARCHIVO_LATEST).read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return None
+        return version or None
+
+    def dir_latest(self, departamento: str, anio: str) -> Optional[Path]:
+        """Directorio de la última versión publicada, o None si nunca se publicó."""
+        version = self.version_latest(departamento, anio)
+        if version is None:
+            return None
+        return self.dir_dataset(departamento, anio) / version
+
+    def ruta_latest(self, departamento: str, anio: str, nombre_archivo: str) -> Optional[Path]:
+        """Ruta de un archivo de la última versión publicada, o None si no existe."""
+        dir_latest = self.dir_latest(departamento, anio)
+        if dir_latest is None:
+            return None
+        path = dir_latest / nombre_archivo
+        return path if path.exists() else None
+
+    def versiones(self, departamento: str, anio: str) -> List[str]:
+        """Versiones publicadas, de la más antigua a la más reciente."""
+        dir_dataset = self.dir_dataset(departamento, anio)
+        if not dir_dataset.exists():
+            return []
+        return sorted(p.name for p in dir_dataset.iterdir() if p.is_dir())
+
+    def publicar(self, departamento: str, anio: str, staging: Path) -> Path:
+        """
+        Publica el contenido de un directorio de staging como nueva versión.
+
+        Las versiones se nombran por fecha de publicación, así que ordenan
+        cronológicamente; LATEST solo avanza (si un job más viejo publica después,
+        su versión queda guardada pero no reemplaza a la más nueva).
+
+        Args:
+            departamento: Departamento del dataset
+            anio: Año del dataset
+            staging: Directorio creado con `preparar_staging`
+
+        Returns:
+            Directorio de la versión publicada
+        """
+        dir_dataset = self.dir_dataset(departamento, anio)
+        dir_dataset.mkdir(parents=True, exist_ok=True)
+        version = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S%fZ}-{uuid.uuid4().hex[:6]}"
+        destino = dir_dataset / version
+        os.replace(staging, destino)
+
+        with self._lock:
+            actual = self.version_latest(departamento, anio)
+            if actual is None or version > actual:
+                puntero = dir_dataset / ARCHIVO_LATEST
+                temporal = dir_dataset / f".{ARCHIVO_LATEST}.{uuid.uuid4().hex}"
+                temporal.write_text(version, encoding="utf-8")
+                os.replace(temporal, puntero)
+            self._podar(departamento, anio)
+
+        logger.info(f"Dataset {departamento.upper()}/{anio} publicado como versión {version}")
+        return destino
+
+    def _podar(self, departamento: str, anio: str) -> None:
+        """Borra las versiones más antiguas (nunca la apuntada por LATEST)."""
+        latest = self.version_latest(departamento, anio)
+        versiones = self.versiones(departamento, anio)
+        for version in versiones[:-self.versiones_a_conservar]:
+            if version != latest:
+                shutil.rmtree(self.dir_dataset(departamento, anio) / version, ignore_errors=True)
+
+    def descartar_staging(self, staging: Path) -> None:
+        """Elimina un staging no publicado (job fallido o cancelado)."""
+        shutil.rmtree(staging, ignore_errors=True)
@@ -0,0 +1,110 @@
+"""
+Sinks: destinos que reciben cada página parseada por el scraper regional.
+
+El pipeline de paginación llama `escribir_pagina` desde un hilo
+(`asyncio.to_thread`), así que las implementaciones pueden hacer I/O bloqueante.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from .sqlite_store import ProcesoStore
+
+
+class PageSink:
+    """Interfaz base de un sink de páginas."""
+
+    def escribir_pagina(self, df: pd.DataFrame, numero_pagina: int) -> None:
+        """
+        Recibe las filas de una página ya parseada.
+
+        Args:
+            df: Filas de la página (columnas COLUMNAS_ESPERADAS, tipadas con
+                `normalizar_procesos`)
+            numero_pagina: Número de página (1-indexed)
+        """
+        raise NotImplementedError
+
+    def escribir_fichas(self, fichas: Dict[str, Dict[str, Any]], numero_pagina: int) -> None:
+        """
+        Recibe el acceso directo a la ficha de cada fila de la página (opcional).
+
+        Args:
+            fichas: Nomenclatura -> acción de ficha (ver `parsear_fichas_resultados`)
+            numero_pagina: Número de página (1-indexed)
+        """
+        pass
+
+    def cerrar(self) -> None:
+        """Libera recursos. Lo llama quien creó el sink, al terminar todo el scraping."""
+        pass
+
+
+class SqliteSink(PageSink):
+    """
+    Upsert de cada página en el ProcesoStore (una transacción por página).
+
+    Las filas escritas se cuentan por número de página: si un shard falla y
+    otro worker vuelve a emitir sus páginas, la cuenta se reemplaza en vez de
+    sumarse (el upsert ya es idempotente).
+    """
+
+    def __init__(
+        self,
+        store: ProcesoStore,
+        departamento: str,
+        anio: str,
+        scraped_at: Optional[str] = None,
+    ):
+        self.store = store
+        self.departamento = departamento
+        self.anio = anio
+        # Misma marca para todas las páginas del scraping
+        self.scraped_at = scraped_at or datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        self._filas_por_pagina: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def filas_escritas(self) -> int:
+        with self._lock:
+            return sum(self._filas_por_pagina.values())
+
+    def escribir_pagina(self, df: pd.DataFrame, numero_pagina: int) -> None:
+        escritas = self.store.upsert_procesos(df, self.departamento, self.anio, scraped_at=self.scraped_at)
+        with self._lock:
+            self._filas_por_pagina[numero_pagina] = escritas
+
+    def escribir_fichas(self, fichas: Dict[str, Dict[str, Any]], numero_pagina: int) -> None:
+        self.store.registrar_fichas(fichas)
+
+
+class MetricasSink(PageSink):
+    """
+    Cuenta páginas y filas recibidas y registra el inicio del scraping, para el
+    catálogo de datasets. Es seguro con shards (varias páginas a la vez) y con
+    reintentos: una página re-emitida reemplaza su cuenta anterior.
+    """
+
+    def __init__(self):
+        self.iniciado_en = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        self._filas_por_pagina: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def paginas(self) -> int:
+        with self._lock:
+            return len(self._filas_por_pagina)
+
+    @property
+    def filas(self) -> int:
+        with self._lock:
+            return sum(self._filas_por_pagina.values())
+
+    def escribir_pagina(self, df: pd.DataFrame, numero_pagina: int) -> None:
+        with self._lock:
+            self._filas_por_pagina[numero_pagina] = len(df)
@@ -0,0 +1,703 @@
+"""
+Almacén local de procesos en SQLite (modo WAL) con upsert por Nomenclatura.
+
+Cada fila extraída por el scraper regional se guarda con el esquema de
+COLUMNAS_ESPERADAS más departamento, año y fecha de scraping. Las escrituras
+se agrupan por página en una sola transacción.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .normalizacion import normalizar_procesos
+from ..scrapers.ficha import clave_nomenclatura
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Columna del CSV -> columna en la tabla `procesos`
+COLUMNAS_DB = {
+    "N°": "numero",
+    "Nombre o Sigla de la Entidad": "entidad",
+    "Fecha y Hora de Publicacion": "fecha_publicacion",
+    "Nomenclatura": "nomenclatura",
+    "Reiniciado Desde": "reiniciado_desde",
+    "Objeto de Contratación": "objeto_contratacion",
+    "Descripción de Objeto": "descripcion_objeto",
+    "VR / VE / Cuantía de la contratación": "valor_referencial",
+    "Moneda": "moneda",
+    "Versión SEACE": "version_seace",
+}
+
+COLUMNAS_PROCESO = list(COLUMNAS_DB.values()) + ["departamento", "anio", "scraped_at"]
+
+# Columnas que se pueden pedir en una consulta (`fields=`)
+CAMPOS_CONSULTABLES = ["id"] + COLUMNAS_PROCESO
+
+# Formato ISO con el que se guarda `fecha_publicacion`
+FORMATO_FECHA_ISO = "%Y-%m-%dT%H:%M:%S"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS procesos (
+    id INTEGER PRIMARY KEY,
+    nomenclatura TEXT NOT NULL UNIQUE,
+    numero INTEGER,
+    entidad TEXT COLLATE NOCASE,
+    fecha_publicacion TEXT,
+    reiniciado_desde TEXT,
+    objeto_contratacion TEXT,
+    descripcion_objeto TEXT,
+    valor_referencial REAL,
+    moneda TEXT,
+    version_seace INTEGER,
+    departamento TEXT NOT NULL,
+    anio TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,
+    -- Nomenclatura canónica (`clave_nomenclatura`), la de fichas, documentos y cronograma
+    clave TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_procesos_entidad ON procesos(entidad);
+CREATE INDEX IF NOT EXISTS idx_procesos_fecha ON procesos(fecha_publicacion);
+CREATE INDEX IF NOT EXISTS idx_procesos_dep_anio_fecha ON procesos(departamento, anio, fecha_publicacion);
+
+-- Catálogo de archivos publicados: una fila por (dataset, versión, formato)
+CREATE TABLE IF NOT EXISTS datasets (
+    departamento TEXT NOT NULL,
+    anio TEXT NOT NULL,
+    version TEXT NOT NULL,
+    formato TEXT NOT NULL,
+    path TEXT NOT NULL,
+    filas INTEGER NOT NULL,
+    paginas INTEGER NOT NULL,
+    iniciado_en TEXT NOT NULL,
+    finalizado_en TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (departamento, anio, version, formato)
+);
+
+-- Acceso directo a la ficha de cada nomenclatura (ver src/scrapers/ficha.py)
+CREATE TABLE IF NOT EXISTS fichas (
+    nomenclatura TEXT PRIMARY KEY,
+    accion TEXT,
+    url TEXT,
+    actualizado_en TEXT NOT NULL
+);
+
+-- Manifiesto del archivo de documentos: documento de una ficha -> blob (ver src/storage/documentos.py)
+CREATE TABLE IF NOT EXISTS documentos_archivados (
+    nomenclatura TEXT NOT NULL,
+    uuid TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    tamano_bytes INTEGER,
+    nombre_archivo TEXT,
+    link_descarga TEXT,
+    archivado_en TEXT NOT NULL,
+    PRIMARY KEY (nomenclatura, uuid)
+);
+CREATE INDEX IF NOT EXISTS idx_documentos_archivados_sha ON documentos_archivados(sha256);
+
+-- Etapas del cronograma de cada ficha, con fechas ISO en hora de SEACE
+CREATE TABLE IF NOT EXISTS cronograma (
+    nomenclatura TEXT NOT NULL,
+    etapa TEXT NOT NULL,
+    fecha_inicio TEXT,
+    fecha_fin TEXT,
+    actualizado_en TEXT NOT NULL,
+    PRIMARY KEY (nomenclatura, etapa)
+);
+CREATE INDEX IF NOT EXISTS idx_cronograma_fin_etapa ON cronograma(fecha_fin, etapa);
+"""
+
+
+# Índice de texto completo (FTS5) sobre descripción y entidad. Es una tabla de
+# contenido externo sincronizada por triggers: cada upsert de `procesos` la
+# actualiza en la misma transacción. `remove_diacritics 2` pliega tildes
+# ("construcción" encuentra "construccion").
+_SCHEMA_FTS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS procesos_fts USING fts5(
+    descripcion_objeto,
+    entidad,
+    content='procesos',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS procesos_fts_ai AFTER INSERT ON procesos BEGIN
+    INSERT INTO procesos_fts(rowid, descripcion_objeto, entidad)
+    VALUES (new.id, new.descripcion_objeto, new.entidad);
+END;
+CREATE TRIGGER IF NOT EXISTS procesos_fts_ad AFTER DELETE ON procesos BEGIN
+    INSERT INTO procesos_fts(procesos_fts, rowid, descripcion_objeto, entidad)
+    VALUES ('delete', old.id, old.descripcion_objeto, old.entidad);
+END;
+CREATE TRIGGER IF NOT EXISTS procesos_fts_au AFTER UPDATE ON procesos BEGIN
+    INSERT INTO procesos_fts(procesos_fts, rowid, descripcion_objeto, entidad)
+    VALUES ('delete', old.id, old.descripcion_objeto, old.entidad);
+    INSERT INTO procesos_fts(rowid, descripcion_objeto, entidad)
+    VALUES (new.id, new.descripcion_objeto, new.entidad);
+END;
+"""
+
+# Marcadores de resaltado en los resultados de búsqueda
+MARCA_INICIO = "<mark>"
+MARCA_FIN = "</mark>"
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def codificar_cursor(fecha_publicacion: str, id_: int) -> str:
+    """Codifica la posición (fecha, id) de la última fila devuelta como cursor opaco."""
+    crudo = json.dumps([fecha_publicacion, id_]).encode("utf-8")
+    return base64.urlsafe_b64encode(crudo).decode("ascii")
+
+
+def decodificar_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decodifica un cursor generado por `codificar_cursor`.
+
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    try:
+        fecha, id_ = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return str(fecha), int(id_)
+    except (ValueError, TypeError, UnicodeEncodeError) as e:
+        raise ValueError(f"Cursor inválido: {cursor!r}") from e
+
+
+def _consulta_fts(q: str) -> str:
+    """
+    Convierte el texto del usuario en una consulta FTS5 segura.
+
+    Cada palabra se cita como literal (así comillas, guiones o `OR` no se
+    interpretan como sintaxis FTS); un `*` final se conserva como prefijo.
+    """
+    terminos = []
+    for palabra in q.split():
+        prefijo = palabra.endswith("*")
+        palabra = palabra.rstrip("*").replace('"', "")
+        if palabra:
+            terminos.append(f'"{palabra}"' + ("*" if prefijo else ""))
+    if not terminos:
+        raise ValueError("La búsqueda no contiene palabras")
+    return " ".join(terminos)
+
+
+class ProcesoStore:
+    """
+    Almacén SQLite de procesos.
+
+    La conexión se abre al primer uso (importar el módulo no crea archivos) y se
+    comparte entre hilos protegida por un lock: los sinks del scraper escriben
+    desde `asyncio.to_thread`.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: Ruta del archivo SQLite (":memory:" para tests)
+        """
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _conexion(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.db_path != ":memory:":
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            columnas = {fila["name"] for fila in conn.execute("PRAGMA table_info(procesos)")}
+            if "clave" not in columnas:
+                # Bases creadas antes de la clave canónica: se calcula una vez
+                with conn:
+                    conn.execute("ALTER TABLE procesos ADD COLUMN clave TEXT")
+                    conn.executemany(
+                        "UPDATE procesos SET clave = ? WHERE id = ?",
+                        [
+                            (clave_nomenclatura(fila["nomenclatura"]), fila["id"])
+                            for fila in conn.execute("SELECT id, nomenclatura FROM procesos").fetchall()
+                        ],
+                    )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_procesos_clave ON procesos(clave)")
+            fts_existia = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'procesos_fts'"
+            ).fetchone()
+            conn.executescript(_SCHEMA_FTS)
+            if not fts_existia:
+                # Bases creadas antes del índice: se indexan las filas existentes una vez
+                with conn:
+                    conn.execute("INSERT INTO procesos_fts(procesos_fts) VALUES ('rebuild')")
+            self._conn = conn
+        return self._conn
+
+    def upsert_procesos(
+        self,
+        df: pd.DataFrame,
+        departamento: str,
+        anio: str,
+        scraped_at: Optional[str] = None,
+    ) -> int:
+        """
+        Inserta o actualiza (por Nomenclatura) las filas de una página en una transacción.
+
+        Args:
+            df: Filas con columnas COLUMNAS_ESPERADAS, en texto o ya normalizadas
+            departamento: Departamento de la búsqueda
+            anio: Año de convocatoria de la búsqueda
+            scraped_at: Marca de tiempo ISO del scraping (opcional, ahora)
+
+        Returns:
+            Número de filas escritas
+        """
+        df = df[df["Nomenclatura"].astype(str) != ""]
+        if df.empty:
+            return 0
+
+        filas = normalizar_procesos(df).rename(columns=COLUMNAS_DB)
+        # ISO 8601 para que el orden lexicográfico coincida con el cronológico.
+        # Fechas no parseables quedan como "" (no NULL) para que la paginación por
+        # (fecha, id) no pierda filas.
+        filas["fecha_publicacion"] = filas["fecha_publicacion"].dt.strftime(FORMATO_FECHA_ISO).fillna("")
+        filas["departamento"] = departamento.upper()
+        filas["anio"] = str(anio)
+        filas["scraped_at"] = scraped_at or _now_iso()
+        # object + None: sqlite3 solo enlaza tipos nativos de Python
+        filas = filas[COLUMNAS_PROCESO].astype(object)
+        filas = filas.where(filas.notna(), None)
+        filas["clave"] = filas["nomenclatura"].map(clave_nomenclatura)
+
+        columnas_tabla = COLUMNAS_PROCESO + ["clave"]
+        columnas = ", ".join(columnas_tabla)
+        marcadores = ", ".join("?" for _ in columnas_tabla)
+        actualizar = ", ".join(f"{c} = excluded.{c}" for c in columnas_tabla if c != "nomenclatura")
+        sql = (
+            f"INSERT INTO procesos ({columnas}) VALUES ({marcadores}) "
+            f"ON CONFLICT(nomenclatura) DO UPDATE SET {actualizar}"
+        )
+
+        with self._lock:
+            conn = self._conexion()
+            with conn:
+                conn.executemany(sql, filas.itertuples(index=False, name=None))
+        return len(filas)
+
+    def obtener(self, nomenclatura: str) -> Optional[Dict[str, Any]]:
+        """Devuelve el proceso con esa Nomenclatura, o None."""
+        with self._lock:
+            fila = self._conexion().execute(
+                "SELECT * FROM procesos WHERE nomenclatura = ?", (nomenclatura,)
+            ).fetchone()
+        return dict(fila) if fila else None
+
+    def consultar(
+        self,
+        *,
+        departamento: Optional[str] = None,
+        anio: Optional[str] = None,
+        entidad: Optional[str] = None,
+        objeto_contratacion: Optional[str] = None,
+        moneda: Optional[str] = None,
+        fecha_desde: Optional[datetime] = None,
+        fecha_hasta: Optional[datetime] = None,
+        campos: Optional[List[str]] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Consulta procesos ordenados por fecha de publicación descendente (luego id).
+
+        La paginación es por keyset sobre (fecha_publicacion, id): cada página
+        continúa estrictamente después de la última fila de la anterior, así que
+        el costo no crece con la profundidad (no hay OFFSET).
+
+        Args:
+            departamento: Filtra por departamento
+            anio: Filtra por año de convocatoria
+            entidad: Prefijo del nombre de la entidad (sin distinguir mayúsculas)
+            objeto_contratacion: Objeto de contratación exacto (ej: "Obra")
+            moneda: Moneda exacta (ej: "Soles")
+            fecha_desde: Publicados desde esta fecha (inclusive)
+            fecha_hasta: Publicados hasta esta fecha (inclusive)
+            campos: Columnas a devolver (por defecto todas)
+            limit: Máximo de filas
+            cursor: Cursor `next_cursor` de la página anterior
+
+        Returns:
+            Tupla (filas, next_cursor); next_cursor es None en la última página
+
+        Raises:
+            ValueError: Si algún campo no existe o el cursor no es válido
+        """
+        campos = campos or CAMPOS_CONSULTABLES
+        desconocidos = [c for c in campos if c not in CAMPOS_CONSULTABLES]
+        if desconocidos:
+            raise ValueError(f"Campos desconocidos: {', '.join(desconocidos)}")
+
+        condiciones: List[str] = []
+        parametros: List[Any] = []
+        if departamento:
+            condiciones.append("departamento = ?")
+            parametros.append(departamento.upper())
+        if anio:
+            condiciones.append("anio = ?")
+            parametros.append(str(anio))
+        if entidad:
+            # LIKE sobre columna NOCASE puede usar idx_procesos_entidad
+            prefijo = entidad.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            condiciones.append("entidad LIKE ? ESCAPE '\\'")
+            parametros.append(f"{prefijo}%")
+        if objeto_contratacion:
+            condiciones.append("objeto_contratacion = ?")
+            parametros.append(objeto_contratacion)
+        if moneda:
+            condiciones.append("moneda = ?")
+            parametros.append(moneda)
+        if fecha_desde:
+            condiciones.append("fecha_publicacion >= ?")
+            parametros.append(fecha_desde.strftime(FORMATO_FECHA_ISO))
+        if fecha_hasta:
+            condiciones.append("fecha_publicacion <= ?")
+            parametros.append(fecha_hasta.strftime(FORMATO_FECHA_ISO))
+        if cursor:
+            condiciones.append("(fecha_publicacion, id) < (?, ?)")
+            parametros.extend(decodificar_cursor(cursor))
+
+        # id y fecha siempre se leen para poder armar el cursor
+        columnas = list(dict.fromkeys(campos + ["id", "fecha_publicacion"]))
+        where = f" WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        sql = (
+            f"SELECT {', '.join(columnas)} FROM procesos{where} "
+            "ORDER BY fecha_publicacion DESC, id DESC LIMIT ?"
+        )
+        # Se pide una fila extra para saber si hay página siguiente
+        parametros.append(limit + 1)
+
+        with self._lock:
+            resultado = self._conexion().execute(sql, parametros).fetchall()
+
+        filas = [dict(fila) for fila in resultado[:limit]]
+        next_cursor = None
+        if len(resultado) > limit:
+            ultima = filas[-1]
+            next_cursor = codificar_cursor(ultima["fecha_publicacion"], ultima["id"])
+        return [{c: fila[c] for c in campos} for fila in filas], next_cursor
+
+    def buscar(
+        self,
+        q: str,
+        *,
+        departamento: Optional[str] = None,
+        anio: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        Búsqueda de texto completo en descripción del objeto y nombre de la entidad.
+
+        Cada palabra de `q` debe aparecer (AND); una palabra terminada en `*` busca
+        por prefijo. Se ignoran tildes y mayúsculas. Los resultados se ordenan por
+        relevancia (BM25) e incluyen los fragmentos resaltados con <mark>.
+
+        Args:
+            q: Texto a buscar (ej: "agua potable")
+            departamento: Filtra por departamento (opcional)
+            anio: Filtra por año de convocatoria (opcional)
+            limit: Máximo de resultados
+
+        Returns:
+            Lista de procesos con `score`, `descripcion_resaltada` y `entidad_resaltada`
+
+        Raises:
+            ValueError: Si `q` no contiene palabras
+        """
+        consulta = _consulta_fts(q)
+
+        condiciones = ["procesos_fts MATCH ?"]
+        parametros: List[Any] = [consulta]
+        if departamento:
+            condiciones.append("p.departamento = ?")
+            parametros.append(departamento.upper())
+        if anio:
+            condiciones.append("p.anio = ?")
+            parametros.append(str(anio))
+        parametros.append(limit)
+
+        sql = f"""
+            SELECT p.id, p.nomenclatura, p.entidad, p.fecha_publicacion, p.objeto_contratacion,
+                   p.descripcion_objeto, p.departamento, p.anio,
+                   bm25(procesos_fts) AS score,
+                   highlight(procesos_fts, 0, '{MARCA_INICIO}', '{MARCA_FIN}') AS descripcion_resaltada,
+                   highlight(procesos_fts, 1, '{MARCA_INICIO}', '{MARCA_FIN}') AS entidad_resaltada
+            FROM procesos_fts
+            JOIN procesos p ON p.id = procesos_fts.rowid
+            WHERE {' AND '.join(condiciones)}
+            ORDER BY score
+            LIMIT ?
+        """
+        with self._lock:
+            filas = self._conexion().execute(sql, parametros).fetchall()
+        return [dict(fila) for fila in filas]
+
+    def contar(self, departamento: Optional[str] = None, anio: Optional[str] = None) -> int:
+        """Cuenta procesos almacenados, opcionalmente por departamento/año."""
+        condiciones: List[str] = []
+        parametros: List[Any] = []
+        if departamento:
+            condiciones.append("departamento = ?")
+            parametros.append(departamento.upper())
+        if anio:
+            condiciones.append("anio = ?")
+            parametros.append(str(anio))
+        where = f" WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        with self._lock:
+            return int(self._conexion().execute(f"SELECT COUNT(*) FROM procesos{where}", parametros).fetchone()[0])
+
+    def registrar_archivos_dataset(self, entradas: List[Dict[str, Any]]) -> None:
+        """
+        Registra (o reemplaza) en el catálogo los archivos de una versión publicada.
+
+        Args:
+            entradas: Filas con las columnas de la tabla `datasets`
+        """
+        if not entradas:
+            return
+        columnas = list(entradas[0])
+        sql = (
+            f"INSERT OR REPLACE INTO datasets ({', '.join(columnas)}) "
+            f"VALUES ({', '.join('?' for _ in columnas)})"
+        )
+        with self._lock:
+            conn = self._conexion()
+            with conn:
+                conn.executemany(sql, [tuple(entrada[c] for c in columnas) for entrada in entradas])
+
+    def podar_catalogo(self, departamento: str, anio: str, versiones_vigentes: List[str]) -> None:
+        """Quita del catálogo las versiones de un dataset que ya no existen en disco."""
+        marcadores = ", ".join("?" for _ in versiones_vigentes) or "NULL"
+        with self._lock:
+            conn = self._conexion()
+            with conn:
+                conn.execute(
+                    f"DELETE FROM datasets WHERE departamento = ? AND anio = ? AND version NOT IN ({marcadores})",
+                    [departamento.upper(), str(anio), *versiones_vigentes],
+                )
+
+    def listar_datasets(
+        self,
+        departamento: Optional[str] = None,
+        anio: Optional[str] = None,
+        todas_las_versiones: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Lista archivos del catálogo, por defecto solo los de la última versión de
+        cada departamento/año (las versiones ordenan cronológicamente).
+        """
+        condiciones: List[str] = []
+        parametros: List[Any] = []
+        if departamento:
+            condiciones.append("d.departamento = ?")
+            parametros.append(departamento.upper())
+        if anio:
+            condiciones.append("d.anio = ?")
+            parametros.append(str(anio))
+        if not todas_las_versiones:
+            condiciones.append(
+                "d.version = (SELECT MAX(version) FROM datasets u "
+                "WHERE u.departamento = d.departamento AND u.anio = d.anio)"
+            )
+        where = f" WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        sql = f"SELECT * FROM datasets d{where} ORDER BY departamento, anio, version DESC, formato"
+        with self._lock:
+            filas = self._conexion().execute(sql, parametros).fetchall()
+        return [dict(fila) for fila in filas]
+
+    def registrar_fichas(self, fichas: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Guarda (o actualiza) el acceso directo a la ficha de cada nomenclatura.
+
+        Una URL ya conocida no se pierde si la nueva entrada no trae URL (las
+        filas del buscador regional solo traen la acción JSF).
+
+        Args:
+            fichas: Nomenclatura (clave canónica) -> {"accion": dict | None, "url": str | None}
+        """
+        if not fichas:
+            return
+        ahora = _now_iso()
+        filas = [
+            (
+                nomenclatura,
+                json.dumps(ficha.get("accion")) if ficha.get("accion") else None,
+                ficha.get("url"),
+                ahora,
+            )
+            for nomenclatura, ficha in fichas.items()
+        ]
+        sql = (
+            "INSERT INTO fichas (nomenclatura, accion, url, actualizado_en) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(nomenclatura) DO UPDATE SET "
+            "accion = COALESCE(excluded.accion, fichas.accion), "
+            "url = COALESCE(excluded.url, fichas.url), "
+            "actualizado_en = excluded.actualizado_en"
+        )
+        with self._lock:
+            conn = self._conexion()
+            with conn:
+                conn.executemany(sql, filas)
+
+    def obtener_ficha(self, nomenclatura: str) -> Optional[Dict[str, Any]]:
+        """Acceso directo guardado para una nomenclatura (clave canónica), o None."""
+        with self._lock:
+            fila = self._conexion().execute(
+                "SELECT accion, url FROM fichas WHERE nomenclatura = ?", (nomenclatura,)
+            ).fetchone()
+        if fila is None:
+            return None
+        return {"accion": json.loads(fila["accion"]) if fila["accion"] else None, "url": fila["url"]}
+
+    def olvidar_ficha(self, nomenclatura: str) -> None:
+        """Elimina un acceso directo que dejó de funcionar."""
+        with self._lock:
+            conn = self._conexion()
+            with conn:
+                conn.execute("DELETE FROM fichas WHERE nomenclatura = ?", (nomenclatura,))
+
+    def registrar_documentos_archivados(self, nomenclatura: str, entradas: List[Dict[str, Any]]) -> None:
+        """
+        Guarda en el manifiesto qué blob corresponde a cada documento de una ficha.
+
+        Args:
+            nomenclatura: Nomenclatura (clave canónica)
+            entradas: Entradas de `archivar_documentos`; se ignoran las que no tienen sha256
+        """
+        ahora = _now_iso()
+        filas = [
+            (
+                nomenclatura,
+                entrada["uuid"],
+                entrada["sha256"],
+                entrada.get("tamaño_bytes"),
+                entrada.get("nombre_archivo"),
+                entrada.get("link_descarga"),
+                ahora,
+            )
+            for entrada in entradas
+            if entrada.get("uuid") and entrada.get("sha256")
+        ]
+        if not filas:
+            return
+        sql = (
+            "INSERT INTO documentos_archivados "
+            "(nomenclatura, uuid, sha256, tamano_bytes, nombre_archivo, link_descarga, archivado_en) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(nomenclatura, uuid) DO UPDATE SET "
+            "sha256 = excluded.sha256, tamano_bytes = excluded.tamano_bytes, "
+            "nombre_archivo = excluded.nombre_archivo, link_descarga = excluded.link_descarga, "
+            "archivado_en = excluded.archivado_en"
+        )
+        with self._lock:
+            conn = self._conexion()
+            with conn:
+                conn.executemany(sql, filas)
+
+    def documentos_archivados(self, nomenclatura: str) -> Dict[str, str]:
+        """uuid -> sha256 de los documentos ya archivados de una nomenclatura (clave canónica)."""
+        with self._lock:
+            filas = self._conexion().execute(
+                "SELECT uuid, sha256 FROM documentos_archivados WHERE nomenclatura = ?", (nomenclatura,)
+            ).fetchall()
+        return {fila["uuid"]: fila["sha256"] for fila in filas}
+
+    def registrar_cronograma(self, nomenclatura: str, etapas: List[Dict[str, Any]]) -> None:
+        """
+        Reemplaza las etapas del cronograma de una nomenclatura en una transacción.
+
+        Args:
+            nomenclatura: Nomenclatura (clave canónica)
+            etapas: {"etapa": str, "fecha_inicio": datetime | None, "fecha_fin": datetime | None};
+                las fechas se guardan en ISO sin zona (hora de SEACE)
+        """
+        ahora = _now_iso()
+        filas = {
+            etapa["etapa"]: (
+                nomenclatura,
+                etapa["etapa"],
+                etapa["fecha_inicio"].strftime(FORMATO_FECHA_ISO) if etapa.get("fecha_inicio") else None,
+                etapa["fecha_fin"].strftime(FORMATO_FECHA_ISO) if etapa.get("fecha_fin") else None,
+                ahora,
+            )
+            for etapa in etapas
+            if etapa.get("etapa")
+        }
+        with self._lock:
+            conn = self._conexion()
+            with conn:
+                conn.execute("DELETE FROM cronograma WHERE nomenclatura = ?", (nomenclatura,))
+                conn.executemany(
+                    "INSERT INTO cronograma (nomenclatura, etapa, fecha_inicio, fecha_fin, actualizado_en) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    list(filas.values()),
+                )
+
+    def proximos_cierres(
+        self,
+        desde: datetime,
+        hasta: datetime,
+        departamento: Optional[str] = None,
+        etapa: Optional[str] = None,
+        limit: int = 500,
+    ) -> List[Dict[str, Any]]:
+        """
+        Etapas del cronograma que terminan entre `desde` y `hasta`, por fecha de fin.
+
+        Recorre el índice (fecha_fin, etapa); los datos del proceso (departamento,
+        entidad, descripción) salen de `procesos` si la nomenclatura está almacenada
+        (se cruzan por la clave canónica, como se guarda el cronograma).
+
+        Args:
+            desde: Inicio de la ventana (hora de SEACE, sin zona o con ella)
+            hasta: Fin de la ventana
+            departamento: Solo procesos de este departamento
+            etapa: Texto contenido en el nombre de la etapa (ej: "propuesta")
+            limit: Máximo de filas
+        """
+        sql = (
+            "SELECT c.nomenclatura, c.etapa, c.fecha_inicio, c.fecha_fin, "
+            "p.departamento, p.entidad, p.objeto_contratacion, p.descripcion_objeto "
+            "FROM cronograma c LEFT JOIN procesos p ON p.clave = c.nomenclatura "
+            "WHERE c.fecha_fin >= ? AND c.fecha_fin <= ?"
+        )
+        parametros: List[Any] = [desde.strftime(FORMATO_FECHA_ISO), hasta.strftime(FORMATO_FECHA_ISO)]
+        if etapa:
+            sql += " AND c.etapa LIKE ?"
+            parametros.append(f"%{etapa}%")
+        if departamento:
+            sql += " AND p.departamento = ?"
+            parametros.append(departamento.upper())
+        sql += " ORDER BY c.fecha_fin, c.etapa LIMIT ?"
+        parametros.append(limit)
+
+        with self._lock:
+            filas = self._conexion().execute(sql, parametros).fetchall()
+        return [dict(fila) for fila in filas]
+
+    def close(self) -> None:
+        """Cierra la conexión (se reabre sola al siguiente uso)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
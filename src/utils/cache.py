@@ -0,0 +1,68 @@
+"""
+Cache en memoria con expiración (TTL) por entrada.
+"""
+
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Diccionario con expiración por entrada, pensado para un solo event loop.
+
+    Las entradas vencidas se descartan al leerlas. No es thread-safe: se usa
+    desde corrutinas del mismo loop (como el resto del estado in-memory de la API).
+    """
+
+    def __init__(self, ttl: float, max_entradas: Optional[int] = None):
+        """
+        Inicializa la cache.
+
+        Args:
+            ttl: Tiempo de vida por defecto de cada entrada (en segundos)
+            max_entradas: Máximo de entradas; al superarlo se descarta la más antigua (opcional)
+        """
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        self._entradas: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, clave: Hashable, default: Any = None) -> Any:
+        """Obtiene el valor de una entrada vigente, o `default` si no existe o venció."""
+        entrada = self._entradas.get(clave)
+        if entrada is None:
+            return default
+
+        expira_en, valor = entrada
+        if expira_en <= time.monotonic():
+            del self._entradas[clave]
+            return default
+        return valor
+
+    def set(self, clave: Hashable, valor: Any, ttl: Optional[float] = None) -> None:
+        """
+        Guarda un valor.
+
+        Args:
+            clave: Clave de la entrada
+            valor: Valor a guardar
+            ttl: Tiempo de vida de esta entrada (opcional, usa el TTL por defecto)
+        """
+        self._entradas.pop(clave, None)
+        self._entradas[clave] = (time.monotonic() + (self.ttl if ttl is None else ttl), valor)
+
+        if self.max_entradas is not None and len(self._entradas) > self.max_entradas:
+            # Los dict preservan orden de inserción: la primera es la más antigua
+            del self._entradas[next(iter(self._entradas))]
+
+    def invalidate(self, clave: Optional[Hashable] = None) -> None:
+        """Elimina una entrada, o todas si no se indica clave."""
+        if clave is None:
+            self._entradas.clear()
+        else:
+            self._entradas.pop(clave, None)
+
+    def __contains__(self, clave: Hashable) -> bool:
+        return self.get(clave) is not None
+
+    def __len__(self) -> int:
+        return len(self._entradas)
@@ -0,0 +1,201 @@
+"""
+Control adaptativo (AIMD) de cuántos scrapes corren a la vez contra SEACE.
+
+Las estrategias de espera informan la latencia de cada respuesta AJAX de
+`buscadorPublico.xhtml`, los timeouts y los errores HTTP. Mientras SEACE
+responde bajo la latencia objetivo el límite sube de a poco (+1 por cada
+`limite` respuestas sanas, como TCP); ante una respuesta lenta, un timeout o un
+error se multiplica por `factor_reduccion` (a lo sumo una vez por
+`enfriamiento` segundos, para no castigar varias veces el mismo episodio).
+
+El JobManager pide un turno al controlador antes de ejecutar cada job.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from ..config.settings import BaseConfig
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ControladorAIMD:
+    """Límite de concurrencia con aumento aditivo y reducción multiplicativa."""
+
+    def __init__(
+        self,
+        minimo: int,
+        maximo: int,
+        inicial: int,
+        latencia_objetivo: float,
+        factor_reduccion: float = 0.5,
+        enfriamiento: float = 10.0,
+    ):
+        """
+        Args:
+            minimo: Límite más bajo (nunca se frena del todo)
+            maximo: Límite más alto
+            inicial: Límite al arrancar
+            latencia_objetivo: Latencia AJAX (segundos) por encima de la cual SEACE se considera degradado
+            factor_reduccion: Multiplicador del límite ante degradación (0 < f < 1)
+            enfriamiento: Segundos mínimos entre dos reducciones
+        """
+        self.minimo = max(1, minimo)
+        self.maximo = max(self.minimo, maximo)
+        self.latencia_objetivo = latencia_objetivo
+        self.factor_reduccion = factor_reduccion
+        self.enfriamiento = enfriamiento
+        self._limite = min(self.maximo, max(self.minimo, inicial))
+        # Respuestas sanas desde el último cambio de límite
+        self._sanas = 0
+        self._ultima_reduccion = float("-inf")
+        self._latencia_media: Optional[float] = None
+        self._contadores = {
+            "respuestas": 0, "lentas": 0, "timeouts": 0, "errores_http": 0, "aumentos": 0, "reducciones": 0,
+        }
+        # Un turno por job en curso, con el loop que lo tomó: si ese loop se cierra
+        # sin liberar (tests con asyncio.run) el turno se recupera solo
+        self._activos: List[asyncio.AbstractEventLoop] = []
+        self._en_espera: Deque[asyncio.Future] = deque()
+        # Esperas a las que `_despertar` ya les asignó turno (aunque no se hayan reanudado)
+        self._entregados: Set[asyncio.Future] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def limite(self) -> int:
+        return self._limite
+
+    # --- señales ---
+
+    def registrar_latencia(self, segundos: float) -> None:
+        """Latencia de una respuesta AJAX exitosa."""
+        with self._lock:
+            self._contadores["respuestas"] += 1
+            self._latencia_media = (
+                segundos if self._latencia_media is None else 0.8 * self._latencia_media + 0.2 * segundos
+            )
+            if segundos > self.latencia_objetivo:
+                self._contadores["lentas"] += 1
+                self._reducir(f"latencia {segundos:.1f}s")
+            else:
+                self._aumentar()
+        self._despertar()
+
+    def registrar_timeout(self) -> None:
+        with self._lock:
+            self._contadores["timeouts"] += 1
+            self._reducir("timeout")
+
+    def registrar_error_http(self, status: int) -> None:
+        with self._lock:
+            self._contadores["errores_http"] += 1
+            self._reducir(f"HTTP {status}")
+
+    def _aumentar(self) -> None:
+        if self._limite >= self.maximo:
+            return
+        self._sanas += 1
+        if self._sanas >= self._limite:
+            self._sanas = 0
+            self._limite += 1
+            self._contadores["aumentos"] += 1
+            logger.info(f"Concurrencia SEACE: {self._limite - 1} -> {self._limite}")
+
+    def _reducir(self, motivo: str) -> None:
+        ahora = time.monotonic()
+        if ahora - self._ultima_reduccion < self.enfriamiento:
+            return
+        self._ultima_reduccion = ahora
+        self._sanas = 0
+        anterior = self._limite
+        self._limite = max(self.minimo, int(self._limite * self.factor_reduccion))
+        self._contadores["reducciones"] += 1
+        logger.warning(f"Concurrencia SEACE: {anterior} -> {self.limite} ({motivo})")
+
+    # --- turnos ---
+
+    def _purgar(self) -> None:
+        self._activos = [loop for loop in self._activos if not loop.is_closed()]
+        self._en_espera = deque(
+            futuro for futuro in self._en_espera if not futuro.done() and not futuro.get_loop().is_closed()
+        )
+        self._entregados = {futuro for futuro in self._entregados if not futuro.get_loop().is_closed()}
+
+    async def adquirir(self) -> None:
+        """Espera un turno libre según el límite actual."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._purgar()
+            if len(self._activos) < self.limite and not self._en_espera:
+                self._activos.append(loop)
+                return
+            futuro = loop.create_future()
+            self._en_espera.append(futuro)
+        try:
+            await futuro
+        except asyncio.CancelledError:
+            with self._lock:
+                turno_entregado = futuro in self._entregados
+                self._entregados.discard(futuro)
+                if not turno_entregado and futuro in self._en_espera:
+                    self._en_espera.remove(futuro)
+            if turno_entregado:
+                # El turno llegó junto con la cancelación: se devuelve
+                self.liberar()
+            raise
+        with self._lock:
+            self._entregados.discard(futuro)
+
+    def liberar(self) -> None:
+        """Devuelve el turno tomado con `adquirir` desde el loop actual."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop in self._activos:
+                self._activos.remove(loop)
+        self._despertar()
+
+    def _despertar(self) -> None:
+        with self._lock:
+            self._purgar()
+            while self._en_espera and len(self._activos) < self.limite:
+                futuro = self._en_espera.popleft()
+                loop = futuro.get_loop()
+                if futuro.done() or loop.is_closed():
+                    continue
+                self._activos.append(loop)
+                self._entregados.add(futuro)
+                loop.call_soon_threadsafe(_entregar_turno, futuro)
+
+    def metricas(self) -> Dict[str, Any]:
+        with self._lock:
+            self._purgar()
+            return {
+                "limite": self.limite,
+                "minimo": self.minimo,
+                "maximo": self.maximo,
+                "en_curso": len(self._activos),
+                "en_espera": len(self._en_espera),
+                "latencia_objetivo_s": self.latencia_objetivo,
+                "latencia_media_s": round(self._latencia_media, 3) if self._latencia_media is not None else None,
+                **self._contadores,
+            }
+
+
+def _entregar_turno(futuro: asyncio.Future) -> None:
+    if not futuro.done():
+        futuro.set_result(None)
+
+
+# Compartido por el JobManager y las estrategias de espera de todos los scrapers
+controlador_seace = ControladorAIMD(
+    minimo=BaseConfig.AIMD_MIN_CONCURRENCY,
+    maximo=BaseConfig.AIMD_MAX_CONCURRENCY,
+    inicial=BaseConfig.AIMD_INITIAL_CONCURRENCY,
+    latencia_objetivo=BaseConfig.AIMD_LATENCY_TARGET,
+    factor_reduccion=BaseConfig.AIMD_DECREASE_FACTOR,
+    enfriamiento=BaseConfig.AIMD_COOLDOWN,
+)
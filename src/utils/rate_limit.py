@@ -0,0 +1,110 @@
+"""
+Limitador de solicitudes por host (token bucket) compartido por todo el proceso.
+
+Reemplaza los delays fijos entre páginas y documentos: cuando hay un solo job
+las solicitudes salen sin espera (hasta la ráfaga), y con muchos jobs a la vez
+la carga total sobre cada host queda acotada a `tasa` solicitudes por segundo.
+
+Cada `adquirir` reserva su turno sin await de por medio (los tokens pueden
+quedar negativos: esa deuda es la cola de espera), así que no necesita locks
+de asyncio y sirve desde cualquier event loop.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from ..config.settings import BaseConfig
+
+
+class TokenBucket:
+    """Token bucket de `tasa` tokens por segundo con capacidad `rafaga`."""
+
+    def __init__(self, tasa: float, rafaga: float):
+        """
+        Args:
+            tasa: Tokens repuestos por segundo (<= 0 desactiva el límite)
+            rafaga: Tokens acumulables (solicitudes seguidas sin espera)
+        """
+        self.tasa = tasa
+        self.rafaga = max(1.0, rafaga)
+        self._tokens = self.rafaga
+        self._actualizado = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reservar(self) -> float:
+        """Toma un token y devuelve cuántos segundos hay que esperar para usarlo."""
+        if self.tasa <= 0:
+            return 0.0
+        with self._lock:
+            ahora = time.monotonic()
+            self._tokens = min(self.rafaga, self._tokens + (ahora - self._actualizado) * self.tasa)
+            self._actualizado = ahora
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.tasa
+
+
+class LimitadorHosts:
+    """Un TokenBucket por host, con métricas de espera."""
+
+    def __init__(self, tasa: float, rafaga: float):
+        """
+        Args:
+            tasa: Solicitudes por segundo permitidas a cada host
+            rafaga: Solicitudes seguidas sin espera a cada host
+        """
+        self.tasa = tasa
+        self.rafaga = rafaga
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._metricas: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.tasa, self.rafaga)
+                self._metricas[host] = {"solicitudes": 0, "esperas": 0, "espera_total_s": 0.0, "espera_max_s": 0.0}
+            return bucket
+
+    async def adquirir(self, host: Optional[str]) -> float:
+        """
+        Espera el turno de una solicitud a `host`.
+
+        Returns:
+            Segundos esperados
+        """
+        if not host:
+            return 0.0
+        espera = self._bucket(host).reservar()
+        with self._lock:
+            metricas = self._metricas[host]
+            metricas["solicitudes"] += 1
+            if espera > 0:
+                metricas["esperas"] += 1
+                metricas["espera_total_s"] += espera
+                metricas["espera_max_s"] = max(metricas["espera_max_s"], espera)
+        if espera > 0:
+            await asyncio.sleep(espera)
+        return espera
+
+    def metricas(self) -> Dict[str, Any]:
+        """Configuración y, por host, solicitudes y tiempo esperado en el limitador."""
+        with self._lock:
+            hosts = {
+                host: {**valores, "espera_total_s": round(valores["espera_total_s"], 3),
+                       "espera_max_s": round(valores["espera_max_s"], 3)}
+                for host, valores in self._metricas.items()
+            }
+        return {"tasa": self.tasa, "rafaga": self.rafaga, "hosts": hosts}
+
+    def reiniciar(self) -> None:
+        """Olvida buckets y métricas (tests)."""
+        with self._lock:
+            self._buckets.clear()
+            self._metricas.clear()
+
+
+# Compartido por todos los scrapers y descargas del proceso
+limitador_hosts = LimitadorHosts(BaseConfig.HOST_RATE_LIMIT, BaseConfig.HOST_RATE_BURST)
@@ -7,6 +7,9 @@ import asyncio
 import inspect
 from typing import Optional
 
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from ..utils.concurrencia import controlador_seace
 from ..utils.exceptions import ScrapingError, TableNotFoundError, InvalidTableStructureError
 from ..utils.logging import get_logger
 
@@ -19,6 +22,42 @@ async def _maybe_await(value):
     return value
 
 
+def _latencia_respuesta(response) -> Optional[float]:
+    """
+    Segundos desde que la solicitud salió hacia SEACE hasta el primer byte de la
+    respuesta, según `request.timing` del navegador. No incluye la espera en el
+    limitador de hosts (el route retiene la solicitud antes de enviarla).
+
+    Returns:
+        Latencia en segundos, o None si el navegador no informó los tiempos
+    """
+    timing = response.request.timing
+    envio, primer_byte = timing.get("requestStart", -1), timing.get("responseStart", -1)
+    if envio < 0 or primer_byte < 0:
+        return None
+    return float(primer_byte - envio) / 1000
+
+
+def _registrar_respuesta_ajax(response) -> None:
+    """
+    Informa al controlador de concurrencia la latencia o el error HTTP de una respuesta AJAX.
+
+    Raises:
+        ScrapingError: Si SEACE respondió con un error HTTP
+    """
+    if response.status >= 400:
+        controlador_seace.registrar_error_http(response.status)
+        raise ScrapingError(f"SEACE respondió HTTP {response.status}")
+    latencia = _latencia_respuesta(response)
+    if latencia is not None:
+        controlador_seace.registrar_latencia(latencia)
+
+
+def _registrar_falla_ajax(error: Exception) -> None:
+    if isinstance(error, PlaywrightTimeoutError):
+        controlador_seace.registrar_timeout()
+
+
 class WaitStrategy:
     """Estrategia base para esperar a que la página cargue."""
     
@@ -103,11 +142,11 @@ class ProductionWaitStrategy(WaitStrategy):
             logger.debug("Haciendo click y esperando respuesta AJAX (POST a buscadorPublico.xhtml)...")
             
             # Usar expect_response como context manager ANTES del click
+            # (cualquier status: los errores HTTP también alimentan al controlador AIMD)
             async with page.expect_response(
                 lambda response: (
                     "buscadorPublico.xhtml" in response.url and
-                    response.request.method == "POST" and
-                    response.status == 200
+                    response.request.method == "POST"
                 ),
                 timeout=timeout
             ) as response_info:
@@ -116,9 +155,9 @@ class ProductionWaitStrategy(WaitStrategy):
             
             # Obtener la respuesta después de que se complete
             response = await response_info.value
-            logger.info(f"✓ Respuesta AJAX recibida: {response.url} (status: {response.status})")
             
         except Exception as e:
+            _registrar_falla_ajax(e)
             logger.warning(f"No se detectó respuesta AJAX específica: {e}")
             # Fallback: hacer click sin esperar respuesta específica
             logger.debug("Usando fallback: haciendo click sin espera específica...")
@@ -127,6 +166,11 @@ class ProductionWaitStrategy(WaitStrategy):
                 await page.wait_for_load_state("networkidle", timeout=min(timeout, 15000))
             except Exception:
                 logger.debug("networkidle timeout, continuando...")
+            return
+        
+        # Fuera del try: un error HTTP se informa una sola vez y no se repite el click
+        _registrar_respuesta_ajax(response)
+        logger.info(f"✓ Respuesta AJAX recibida: {response.url} (status: {response.status})")
     
     async def wait_for_search_results(
         self,
@@ -315,9 +359,9 @@ class DevelopmentWaitStrategy(WaitStrategy):
             
             # Obtener la respuesta después de que se complete
             response = await response_info.value
-            logger.info(f"✓ Respuesta AJAX recibida: {response.url} (status: {response.status})")
             
         except Exception as e:
+            _registrar_falla_ajax(e)
             logger.warning(f"No se detectó respuesta AJAX: {e}")
             # Fallback: hacer click sin esperar respuesta específica
             logger.debug("Usando fallback: haciendo click sin espera específica...")
@@ -326,6 +370,11 @@ class DevelopmentWaitStrategy(WaitStrategy):
                 await page.wait_for_load_state("networkidle", timeout=min(timeout, 15000))
             except Exception:
                 logger.debug("networkidle timeout, continuando...")
+            return
+        
+        # Fuera del try: un error HTTP se informa una sola vez y no se repite el click
+        _registrar_respuesta_ajax(response)
+        logger.info(f"✓ Respuesta AJAX recibida: {response.url} (status: {response.status})")
     
     async def wait_for_search_results(
         self,
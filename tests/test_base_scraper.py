@@ -5,6 +5,7 @@ Tests unitarios para la clase base BaseScraper.
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from src.scrapers.base import BaseScraper
+from src.scrapers import base
 from src.config.settings import BaseConfig
 from src.utils.exceptions import SeaceScraperError
 
@@ -96,3 +97,27 @@ class TestBaseScraper:
                 mock_start.assert_called_once()
             
             mock_close.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_limitar_solicitud_solo_navegaciones_y_ajax(self, scraper):
+        """Test que verifica que el route pide turno al limitador solo para document/xhr/fetch."""
+        limitador = MagicMock(adquirir=AsyncMock(return_value=0.0))
+        
+        with patch.object(base, "limitador_hosts", limitador):
+            for tipo in ("xhr", "image"):
+                route = MagicMock(continue_=AsyncMock())
+                route.request.resource_type = tipo
+                route.request.url = "https://prod2.seace.gob.pe/seacebus-uiwd-pub/buscadorPublico/buscadorPublico.xhtml"
+                await scraper._limitar_solicitud(route)
+                route.continue_.assert_awaited_once()
+        
+        limitador.adquirir.assert_awaited_once_with("prod2.seace.gob.pe")
+    
+    def test_route_solo_endpoints_de_seace(self):
+        """Test que verifica que los recursos estáticos no pasan por el route del limitador."""
+        raiz = "https://prod2.seace.gob.pe/seacebus-uiwd-pub"
+        assert base.es_endpoint_limitado(f"{raiz}/buscadorPublico/buscadorPublico.xhtml")
+        assert base.es_endpoint_limitado(f"{raiz}/fichaSeleccion/fichaSeleccion.xhtml?id=1")
+        assert base.es_endpoint_limitado("https://prod2.seace.gob.pe/SeaceWeb-PRO/SdescargarArchivoAlfresco?fileCode=u-1")
+        assert not base.es_endpoint_limitado(f"{raiz}/javax.faces.resource/jquery/jquery.js.xhtml?ln=primefaces")
+        assert not base.es_endpoint_limitado(f"{raiz}/resources/img/logo.png")
@@ -0,0 +1,60 @@
+"""
+Tests para la cache en memoria con TTL.
+"""
+
+from unittest.mock import patch
+
+from src.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests para TTLCache."""
+    
+    def test_set_y_get(self):
+        """Test que verifica guardar y leer una entrada vigente."""
+        cache = TTLCache(ttl=60)
+        cache.set(("AREQUIPA", "2026"), {"total": 32})
+        
+        assert cache.get(("AREQUIPA", "2026")) == {"total": 32}
+        assert ("AREQUIPA", "2026") in cache
+    
+    def test_entrada_vencida(self):
+        """Test que verifica que una entrada vencida se descarta."""
+        cache = TTLCache(ttl=10)
+        with patch("src.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("clave", "valor")
+        with patch("src.utils.cache.time.monotonic", return_value=111.0):
+            assert cache.get("clave", "default") == "default"
+        assert len(cache) == 0
+    
+    def test_ttl_por_entrada(self):
+        """Test que verifica que el TTL por entrada tiene prioridad sobre el por defecto."""
+        cache = TTLCache(ttl=10)
+        with patch("src.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("corta", 1, ttl=1)
+            cache.set("larga", 2)
+        with patch("src.utils.cache.time.monotonic", return_value=105.0):
+            assert cache.get("corta") is None
+            assert cache.get("larga") == 2
+    
+    def test_max_entradas_descarta_la_mas_antigua(self):
+        """Test que verifica el límite de entradas."""
+        cache = TTLCache(ttl=60, max_entradas=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        
+        assert "a" not in cache
+        assert cache.get("c") == 3
+    
+    def test_invalidate(self):
+        """Test que verifica invalidar una entrada o toda la cache."""
+        cache = TTLCache(ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        cache.invalidate("a")
+        assert "a" not in cache and "b" in cache
+        
+        cache.invalidate()
+        assert len(cache) == 0
@@ -0,0 +1,73 @@
+"""
+Tests para el catálogo de datasets publicados.
+"""
+
+import hashlib
+
+import pytest
+
+from src.storage.catalogo import describir_version, formato_de_archivo
+from src.storage.sqlite_store import ProcesoStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ProcesoStore(str(tmp_path / "seace.db"))
+    yield store
+    store.close()
+
+
+def _version(tmp_path, nombre, departamento="AREQUIPA"):
+    version_dir = tmp_path / "datasets" / f"{departamento}_2026" / nombre
+    version_dir.mkdir(parents=True)
+    (version_dir / "procesos.csv").write_bytes(b"N\xc2\xb0\n1\n")
+    (version_dir / "procesos.csv.gz").write_bytes(b"gz")
+    (version_dir / "notas.txt").write_text("no es dataset")
+    return describir_version(
+        version_dir,
+        departamento=departamento,
+        anio="2026",
+        filas=1,
+        paginas=1,
+        iniciado_en="2026-01-28T10:00:00Z",
+        finalizado_en="2026-01-28T10:05:00Z",
+    )
+
+
+class TestCatalogo:
+    """Tests para describir_version y el catálogo del ProcesoStore."""
+    
+    def test_formato_de_archivo(self, tmp_path):
+        """Test que verifica el formato según el sufijo."""
+        assert formato_de_archivo(tmp_path / "a.csv") == "csv"
+        assert formato_de_archivo(tmp_path / "a.csv.zst") == "csv+zstd"
+        assert formato_de_archivo(tmp_path / "a.parquet") == "parquet"
+        assert formato_de_archivo(tmp_path / "LATEST") is None
+    
+    def test_describir_version(self, tmp_path):
+        """Test que verifica tamaño y checksum de cada archivo de la versión."""
+        entradas = _version(tmp_path, "v1")
+        
+        assert [e["formato"] for e in entradas] == ["csv", "csv+gzip"]
+        assert entradas[0]["bytes"] == 6
+        assert entradas[0]["sha256"] == hashlib.sha256(b"N\xc2\xb0\n1\n").hexdigest()
+    
+    def test_listar_solo_ultima_version(self, tmp_path, store):
+        """Test que verifica que por defecto se lista solo la última versión de cada dataset."""
+        store.registrar_archivos_dataset(_version(tmp_path, "v1"))
+        store.registrar_archivos_dataset(_version(tmp_path, "v2"))
+        store.registrar_archivos_dataset(_version(tmp_path, "v1", departamento="CUSCO"))
+        
+        ultimas = store.listar_datasets()
+        
+        assert {(e["departamento"], e["version"]) for e in ultimas} == {("AREQUIPA", "v2"), ("CUSCO", "v1")}
+        assert len(store.listar_datasets(departamento="arequipa", todas_las_versiones=True)) == 4
+    
+    def test_podar_catalogo(self, tmp_path, store):
+        """Test que verifica que se quitan las versiones que ya no existen."""
+        store.registrar_archivos_dataset(_version(tmp_path, "v1"))
+        store.registrar_archivos_dataset(_version(tmp_path, "v2"))
+        
+        store.podar_catalogo("AREQUIPA", "2026", ["v2"])
+        
+        assert {e["version"] for e in store.listar_datasets(todas_las_versiones=True)} == {"v2"}
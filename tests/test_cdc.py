@@ -0,0 +1,76 @@
+"""
+Tests para el change-data-capture entre snapshots regionales.
+"""
+
+from datetime import datetime, timezone
+
+import pandas as pd
+import pytest
+
+from src.selectors.regional import COLUMNAS_ESPERADAS
+from src.storage.cdc import RegistroCambios, calcular_cambios, hash_filas
+
+
+def _snapshot(*filas):
+    """Crea un snapshot a partir de tuplas (nomenclatura, descripcion)."""
+    return pd.DataFrame(
+        [
+            [str(i), "ENTIDAD", "28/01/2026 10:00", nomenclatura, "", "Bien", descripcion, "---", "Soles", "3"]
+            for i, (nomenclatura, descripcion) in enumerate(filas, start=1)
+        ],
+        columns=COLUMNAS_ESPERADAS,
+    )
+
+
+class TestCalcularCambios:
+    """Tests para el diff entre snapshots."""
+    
+    def test_hash_ignora_posicion(self):
+        """Test que verifica que "N°" no afecta el hash de contenido."""
+        a = _snapshot(("NOM-1", "X"))
+        b = a.copy()
+        b["N°"] = "99"
+        
+        assert hash_filas(a).iloc[0] == hash_filas(b).iloc[0]
+    
+    def test_inserts_updates_deletes(self):
+        """Test que verifica la clasificación de cambios."""
+        anterior = calcular_cambios({}, _snapshot(("NOM-1", "A"), ("NOM-2", "B"), ("NOM-3", "C")))["estado"]
+        
+        cambios = calcular_cambios(anterior, _snapshot(("NOM-4", "D"), ("NOM-1", "A"), ("NOM-2", "B2")))
+        
+        assert [fila["Nomenclatura"] for fila in cambios["inserts"]] == ["NOM-4"]
+        assert [fila["Nomenclatura"] for fila in cambios["updates"]] == ["NOM-2"]
+        assert cambios["deletes"] == ["NOM-3"]
+
+
+class TestRegistroCambios:
+    """Tests para el log de cambios en disco."""
+    
+    @pytest.fixture
+    def registro(self, tmp_path):
+        return RegistroCambios(str(tmp_path))
+    
+    def test_registrar_y_leer_desde(self, registro):
+        """Test que verifica que `since` filtra por snapshot."""
+        registro.registrar_snapshot(
+            "arequipa", "2026", _snapshot(("NOM-1", "A")), snapshot_at="2026-01-28T10:00:00Z"
+        )
+        resumen = registro.registrar_snapshot(
+            "AREQUIPA", "2026", _snapshot(("NOM-2", "B"), ("NOM-1", "A2")), snapshot_at="2026-01-29T10:00:00Z"
+        )
+        
+        assert resumen == {"snapshot_at": "2026-01-29T10:00:00Z", "inserts": 1, "updates": 1, "deletes": 0}
+        assert registro.existe("AREQUIPA", "2026")
+        assert len(registro.obtener_cambios("AREQUIPA", "2026")) == 3
+        
+        recientes = registro.obtener_cambios(
+            "AREQUIPA", "2026", since=datetime(2026, 1, 28, 12, 0, tzinfo=timezone.utc)
+        )
+        assert [(e["op"], e["nomenclatura"]) for e in recientes] == [("insert", "NOM-2"), ("update", "NOM-1")]
+        assert recientes[0]["fila"]["Descripción de Objeto"] == "B"
+    
+    def test_sin_snapshots(self, registro):
+        """Test que verifica un departamento/año sin historial."""
+        assert not registro.existe("CUSCO", "2026")
+        assert registro.obtener_cambios("CUSCO", "2026") == []
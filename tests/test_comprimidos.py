@@ -0,0 +1,66 @@
+"""
+Tests para las variantes precomprimidas de descargas.
+"""
+
+import gzip
+import os
+
+import pyarrow as pa
+import pytest
+
+from src.storage.comprimidos import elegir_variante, precomprimir, ruta_variante
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "procesos.csv"
+    path.write_text("N°,Nomenclatura\n" + "1,NOM-1\n" * 500, encoding="utf-8-sig")
+    return path
+
+
+class TestPrecomprimir:
+    """Tests para precomprimir y elegir_variante."""
+    
+    def test_genera_variantes_decodificables(self, csv_path):
+        """Test que verifica que gzip y zstd reproducen el original."""
+        gz, zst = ruta_variante(csv_path, "gzip"), ruta_variante(csv_path, "zstd")
+        assert set(precomprimir(csv_path)) == {gz, zst}
+        
+        original = csv_path.read_bytes()
+        assert gzip.decompress(gz.read_bytes()) == original
+        with pa.input_stream(str(zst), compression="zstd") as entrada:
+            assert entrada.read() == original
+        assert zst.stat().st_size < len(original) / 5
+    
+    def test_codificacion_no_soportada(self, csv_path):
+        """Test que verifica error con una codificación desconocida."""
+        with pytest.raises(ValueError):
+            precomprimir(csv_path, ["br"])
+    
+    @pytest.mark.parametrize(
+        "accept_encoding, esperada",
+        [
+            ("gzip, deflate, br, zstd", "zstd"),
+            ("gzip", "gzip"),
+            ("zstd;q=0.5, gzip", "gzip"),
+            ("zstd;q=0, *", "gzip"),
+            ("identity", None),
+            (None, None),
+        ],
+    )
+    def test_negociacion(self, csv_path, accept_encoding, esperada):
+        """Test que verifica la elección según Accept-Encoding."""
+        precomprimir(csv_path)
+        
+        path, codificacion = elegir_variante(csv_path, accept_encoding)
+        
+        assert codificacion == esperada
+        assert path == (ruta_variante(csv_path, esperada) if esperada else csv_path)
+    
+    def test_variante_desactualizada_se_ignora(self, csv_path):
+        """Test que verifica que no se sirve una variante más vieja que el CSV."""
+        precomprimir(csv_path, ["gzip"])
+        gz = ruta_variante(csv_path, "gzip")
+        os.utime(gz, ns=(0, csv_path.stat().st_mtime_ns - 10**9))
+        
+        assert elegir_variante(csv_path, "gzip") == (csv_path, None)
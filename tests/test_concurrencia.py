@@ -0,0 +1,119 @@
+"""
+Tests para el controlador AIMD de concurrencia.
+"""
+
+import asyncio
+
+from src.utils.concurrencia import ControladorAIMD
+
+
+def _controlador(**kwargs):
+    opciones = {
+        "minimo": 1, "maximo": 8, "inicial": 2, "latencia_objetivo": 5.0, "factor_reduccion": 0.5, "enfriamiento": 0,
+    }
+    opciones.update(kwargs)
+    return ControladorAIMD(**opciones)
+
+
+class TestControladorAIMD:
+    """Tests para ControladorAIMD."""
+    
+    def test_aumento_aditivo_con_respuestas_sanas(self):
+        """Test que verifica que el límite sube de a uno por ventana de respuestas sanas."""
+        controlador = _controlador()
+        for _ in range(2):
+            controlador.registrar_latencia(1.0)
+        assert controlador.limite == 3
+        for _ in range(3):
+            controlador.registrar_latencia(1.0)
+        assert controlador.limite == 4
+    
+    def test_reduccion_multiplicativa(self):
+        """Test que verifica la reducción ante latencia alta, timeouts y errores HTTP."""
+        controlador = _controlador(inicial=8)
+        controlador.registrar_latencia(9.0)
+        assert controlador.limite == 4
+        controlador.registrar_timeout()
+        assert controlador.limite == 2
+        controlador.registrar_error_http(503)
+        controlador.registrar_error_http(503)
+        assert controlador.limite == 1
+        
+        metricas = controlador.metricas()
+        assert (metricas["lentas"], metricas["timeouts"], metricas["errores_http"]) == (1, 1, 2)
+    
+    def test_enfriamiento_entre_reducciones(self):
+        """Test que verifica que un mismo episodio no reduce varias veces."""
+        controlador = _controlador(inicial=8, enfriamiento=60)
+        controlador.registrar_timeout()
+        controlador.registrar_timeout()
+        assert controlador.limite == 4
+    
+    def test_turnos_respetan_el_limite(self):
+        """Test que verifica que con el límite ocupado se espera hasta que alguien libere."""
+        controlador = _controlador(inicial=1)
+        orden = []
+        
+        async def tarea(nombre):
+            await controlador.adquirir()
+            orden.append(f"inicio {nombre}")
+            await asyncio.sleep(0.01)
+            orden.append(f"fin {nombre}")
+            controlador.liberar()
+        
+        async def principal():
+            await asyncio.gather(tarea("a"), tarea("b"))
+        
+        asyncio.run(principal())
+        assert orden == ["inicio a", "fin a", "inicio b", "fin b"]
+        assert controlador.metricas()["en_curso"] == 0
+    
+    def test_turno_de_un_loop_cerrado_se_recupera(self):
+        """Test que verifica que un turno no liberado se recupera al cerrarse su loop."""
+        controlador = _controlador(inicial=1)
+        asyncio.run(controlador.adquirir())
+        
+        asyncio.run(asyncio.wait_for(controlador.adquirir(), timeout=1))
+        assert controlador.metricas()["en_curso"] == 0
+    
+    def test_espera_cancelada_no_libera_turnos_ajenos(self):
+        """Test que verifica que cancelar una espera purgada no devuelve el turno de otro job."""
+        controlador = _controlador(inicial=1)
+        
+        async def principal():
+            await controlador.adquirir()
+            b = asyncio.create_task(controlador.adquirir())
+            await asyncio.sleep(0)
+            b.cancel()
+            # metricas() purga la espera cancelada antes de que B procese la cancelación
+            assert controlador.metricas()["en_espera"] == 0
+            await asyncio.gather(b, return_exceptions=True)
+            
+            assert controlador.metricas()["en_curso"] == 1
+            c = asyncio.create_task(controlador.adquirir())
+            await asyncio.sleep(0.01)
+            assert not c.done()
+            controlador.liberar()
+            await asyncio.wait_for(c, timeout=1)
+            controlador.liberar()
+        
+        asyncio.run(principal())
+        assert controlador.metricas()["en_curso"] == 0
+    
+    def test_turno_entregado_a_una_espera_cancelada_se_devuelve(self):
+        """Test que verifica que un turno asignado junto con la cancelación vuelve al controlador."""
+        controlador = _controlador(inicial=1)
+        
+        async def principal():
+            await controlador.adquirir()
+            b = asyncio.create_task(controlador.adquirir())
+            await asyncio.sleep(0)
+            controlador.liberar()
+            b.cancel()
+            await asyncio.gather(b, return_exceptions=True)
+            
+            assert controlador.metricas()["en_curso"] == 0
+            await asyncio.wait_for(controlador.adquirir(), timeout=1)
+            controlador.liberar()
+        
+        asyncio.run(principal())
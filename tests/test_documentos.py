@@ -0,0 +1,85 @@
+"""
+Tests para el archivo por contenido de documentos.
+"""
+
+import hashlib
+
+import httpx
+import pytest
+
+from src.storage.documentos import ArchivoDocumentos, archivar_documentos
+
+CONTENIDOS = {
+    "/a.pdf": b"%PDF-1.4 documento a" * 1000,
+    "/copia-de-a.pdf": b"%PDF-1.4 documento a" * 1000,
+    "/b.zip": b"PK zip b",
+}
+
+
+def _cliente(pedidos):
+    def responder(request):
+        pedidos.append(request.url.path)
+        if request.url.path not in CONTENIDOS:
+            return httpx.Response(404)
+        return httpx.Response(200, content=CONTENIDOS[request.url.path])
+    
+    return httpx.AsyncClient(transport=httpx.MockTransport(responder))
+
+
+def _documento(uuid, ruta):
+    return {
+        "uuid": uuid,
+        "nombre_archivo": f"{uuid}.pdf",
+        "link_descarga": f"https://seace.test{ruta}" if ruta else None,
+    }
+
+
+class TestArchivoDocumentos:
+    """Tests para archivar_documentos."""
+    
+    @pytest.fixture
+    def archivo(self, tmp_path):
+        return ArchivoDocumentos(str(tmp_path / "documentos"))
+    
+    async def test_guarda_por_sha256_y_deduplica(self, archivo):
+        """Test que verifica que dos documentos con el mismo contenido comparten blob."""
+        pedidos = []
+        documentos = [_documento("u-1", "/a.pdf"), _documento("u-2", "/copia-de-a.pdf"), _documento("u-3", "/b.zip")]
+        async with _cliente(pedidos) as cliente:
+            entradas = await archivar_documentos(documentos, archivo, concurrencia=1, cliente=cliente)
+        
+        sha_a = hashlib.sha256(CONTENIDOS["/a.pdf"]).hexdigest()
+        assert [entrada["status"] for entrada in entradas] == ["archivado", "existente", "archivado"]
+        assert entradas[0]["sha256"] == entradas[1]["sha256"] == sha_a
+        assert entradas[0]["tamaño_bytes"] == len(CONTENIDOS["/a.pdf"])
+        assert archivo.ruta_blob(sha_a).read_bytes() == CONTENIDOS["/a.pdf"]
+        assert len([blob for blob in (archivo.base_dir / "blobs").rglob("*") if blob.is_file()]) == 2
+        assert list(archivo.dir_temporal.iterdir()) == []
+    
+    async def test_no_descarga_lo_ya_archivado(self, archivo):
+        """Test que verifica que un documento del manifiesto con blob en disco no se pide de nuevo."""
+        async with _cliente([]) as cliente:
+            previas = await archivar_documentos([_documento("u-1", "/a.pdf")], archivo, cliente=cliente)
+        
+        pedidos = []
+        async with _cliente(pedidos) as cliente:
+            entradas = await archivar_documentos(
+                [_documento("u-1", "/a.pdf")],
+                archivo,
+                ya_archivados={"u-1": previas[0]["sha256"]},
+                cliente=cliente,
+            )
+        
+        assert pedidos == []
+        assert entradas[0]["status"] == "existente"
+        assert entradas[0]["sha256"] == previas[0]["sha256"]
+    
+    async def test_errores_y_documentos_sin_link(self, archivo):
+        """Test que verifica que un documento fallido no corta el resto."""
+        documentos = [_documento("u-1", "/no-existe.pdf"), _documento("u-2", None), _documento("u-3", "/b.zip")]
+        async with _cliente([]) as cliente:
+            entradas = await archivar_documentos(documentos, archivo, concurrencia=2, cliente=cliente)
+        
+        assert [entrada["status"] for entrada in entradas] == ["failed", "sin_link", "archivado"]
+        assert "404" in entradas[0]["error"]
+        assert entradas[0]["sha256"] is None
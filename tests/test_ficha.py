@@ -0,0 +1,100 @@
+"""
+Tests para el acceso directo a la ficha de selección.
+"""
+
+from datetime import datetime
+
+from src.scrapers.ficha import (
+    ZONA_SEACE,
+    clave_nomenclatura,
+    es_url_ficha,
+    firma_documentos,
+    parsear_accion_ficha,
+    parsear_fecha_cronograma,
+    parsear_fichas_resultados,
+    ttl_ficha,
+)
+
+ONCLICK_FICHA = (
+    "PrimeFaces.addSubmitParam('tbBuscador:idFormBuscarProceso',{"
+    "'tbBuscador:idFormBuscarProceso:dtProcesos:0:j_idt377':'tbBuscador:idFormBuscarProceso:dtProcesos:0:j_idt377',"
+    "'ntipo':'1','nidConvocatoria':'WSXRX05ZZ','nidProceso':'988756','nidSistema':'3','ptoRetorno':'LOCAL'"
+    "}).submit('tbBuscador:idFormBuscarProceso');"
+)
+
+
+def _tbody_con_acciones(nomenclatura: str, onclick: str) -> str:
+    celdas = ["1", "ENTIDAD", "28/01/2026 10:00", nomenclatura, "", "Bien", "DESC", "", "", "---", "Soles", "3"]
+    html = "".join(f"<td>{celda}</td>" for celda in celdas)
+    html += (
+        f'<td><a onclick="PrimeFaces.addSubmitParam(\'f\',{{\'nidProceso\':\'1\'}})"><img src="btnHistorial.png"/></a>'
+        f'<a onclick="{onclick}"><img src="../resources/img/fichaSeleccion.gif"/></a></td>'
+    )
+    return f"<tbody><tr>{html}</tr></tbody>"
+
+
+class TestAccesoFicha:
+    """Tests para el parseo del submit JSF de la ficha."""
+    
+    def test_parsear_accion_ficha(self):
+        accion = parsear_accion_ficha(ONCLICK_FICHA)
+        
+        assert accion["formulario"] == "tbBuscador:idFormBuscarProceso"
+        assert accion["parametros"]["nidConvocatoria"] == "WSXRX05ZZ"
+        assert accion["parametros"]["ptoRetorno"] == "LOCAL"
+    
+    def test_parsear_accion_sin_convocatoria(self):
+        assert parsear_accion_ficha("PrimeFaces.addSubmitParam('f',{'nidProceso':'1'}).submit('f')") is None
+        assert parsear_accion_ficha("") is None
+    
+    def test_parsear_fichas_resultados_usa_el_enlace_de_la_ficha(self):
+        fichas = parsear_fichas_resultados(_tbody_con_acciones("cp  ser-sm-1-2026-mdcc-1", ONCLICK_FICHA))
+        
+        assert list(fichas) == ["CP SER-SM-1-2026-MDCC-1"]
+        assert fichas["CP SER-SM-1-2026-MDCC-1"]["accion"]["parametros"]["nidProceso"] == "988756"
+        assert fichas["CP SER-SM-1-2026-MDCC-1"]["url"] is None
+    
+    def test_es_url_ficha(self):
+        assert es_url_ficha("https://prod2.seace.gob.pe/seacebus-uiwd-pub/fichaSeleccion/fichaSeleccion.xhtml?id=1")
+        assert not es_url_ficha("https://prod2.seace.gob.pe/seacebus-uiwd-pub/buscadorPublico/buscadorPublico.xhtml")
+        assert not es_url_ficha(None)
+    
+    def test_clave_nomenclatura(self):
+        assert clave_nomenclatura("  sie-sie-1-2026-sedapar-1 ") == "SIE-SIE-1-2026-SEDAPAR-1"
+
+
+class TestVigenciaFicha:
+    """Tests para la vigencia de fichas según el cronograma."""
+    
+    AHORA = datetime(2026, 2, 10, 12, 0, tzinfo=ZONA_SEACE)
+    
+    def test_parsear_fecha_cronograma(self):
+        """Test que verifica fechas con y sin hora."""
+        assert parsear_fecha_cronograma("28/01/2026 15:09") == datetime(2026, 1, 28, 15, 9, tzinfo=ZONA_SEACE)
+        assert parsear_fecha_cronograma("28/01/2026", fin_del_dia=True).hour == 23
+        assert parsear_fecha_cronograma("---") is None
+    
+    def test_etapa_en_curso_usa_ttl_corto(self):
+        """Test que verifica el TTL corto con una etapa en curso."""
+        cronograma = [{"etapa": "Consultas", "fecha_inicio": "09/02/2026", "fecha_fin": "11/02/2026"}]
+        assert ttl_ficha(cronograma, 900, 86400, ahora=self.AHORA) == 900
+    
+    def test_sin_etapa_en_curso_vence_en_el_proximo_cambio(self):
+        """Test que verifica que el TTL largo no pasa del próximo inicio de etapa."""
+        cronograma = [
+            {"etapa": "Convocatoria", "fecha_inicio": "01/02/2026", "fecha_fin": "05/02/2026"},
+            {"etapa": "Propuestas", "fecha_inicio": "10/02/2026 18:00", "fecha_fin": "12/02/2026"},
+        ]
+        assert ttl_ficha(cronograma, 900, 86400, ahora=self.AHORA) == 6 * 3600
+    
+    def test_cronograma_terminado_usa_ttl_largo(self):
+        """Test que verifica el TTL largo si ya no quedan etapas."""
+        cronograma = [{"etapa": "Buena pro", "fecha_inicio": "01/01/2026", "fecha_fin": "02/01/2026"}]
+        assert ttl_ficha(cronograma, 900, 86400, ahora=self.AHORA) == 86400
+        assert ttl_ficha([], 900, 86400, ahora=self.AHORA) == 86400
+    
+    def test_firma_documentos(self):
+        """Test que verifica la firma por cantidad y última publicación."""
+        firma = firma_documentos(["28/01/2026 15:09", "30/01/2026 08:00", ""])
+        assert firma == {"total": 3, "ultima_publicacion": "2026-01-30T08:00:00-05:00"}
+        assert firma_documentos([]) == {"total": 0, "ultima_publicacion": None}
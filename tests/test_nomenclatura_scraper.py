@@ -4,7 +4,8 @@ Tests unitarios para el scraper por nomenclatura.
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from src.scrapers.nomenclatura import NomenclaturaScraper
+from src.scrapers.nomenclatura import NomenclaturaScraper, ResolvedorLinksDocumento, parsear_descarga_doc
+from src.selectors.nomenclatura import CRONOGRAMA_COLUMNS, DOCUMENTOS_COLUMNS
 from src.config.settings import BaseConfig
 from src.utils.exceptions import ElementNotFoundError, ScrapingError
 
@@ -78,3 +79,251 @@ class TestNomenclaturaScraper:
         from src.scrapers.base import BaseScraper
         
         assert issubclass(NomenclaturaScraper, BaseScraper)
+
+
+class TestResolvedorLinksDocumento:
+    """Tests para la construcción de links de documentos sin click."""
+    
+    URL_BASE = "https://prod2.seace.gob.pe/seacebus-uiwd-pub/fichaSeleccion/fichaSeleccion.xhtml"
+    
+    def _url(self, uuid, nombre):
+        return f"https://prod2.seace.gob.pe/SeaceWeb-PRO/SdescargarArchivoAlfresco?fileCode={uuid}&tipo=2&nombre={nombre}"
+    
+    def test_parsear_descarga_doc(self):
+        onclick = "javascript:descargaDocGeneral('a1b2-c3','2','Bases Integradas.pdf');"
+        
+        assert parsear_descarga_doc(onclick) == ("a1b2-c3", "2", "Bases Integradas.pdf")
+        assert parsear_descarga_doc("") is None
+    
+    def test_aprende_de_descarga_y_verifica_con_la_segunda(self):
+        resolvedor = ResolvedorLinksDocumento()
+        
+        resolvedor.observar(self._url("uuid-1", "Bases%20Integradas.pdf"), "uuid-1", "2", "Bases Integradas.pdf")
+        assert resolvedor.plantilla is not None
+        assert not resolvedor.lista
+        
+        assert resolvedor.observar(self._url("uuid-2", "Acta.pdf"), "uuid-2", "2", "Acta.pdf")
+        assert resolvedor.lista
+        assert resolvedor.construir("uuid-3", "2", "Informe {1}.pdf") == self._url("uuid-3", "Informe%20%7B1%7D.pdf")
+    
+    def test_sin_uuid_en_la_url_no_aprende(self):
+        resolvedor = ResolvedorLinksDocumento()
+        
+        resolvedor.observar("https://seace.gob.pe/descarga.xhtml", "uuid-1", "2", "a.pdf")
+        
+        assert resolvedor.plantilla is None
+        assert resolvedor.construir("uuid-1", "2", "a.pdf") is None
+    
+    def test_plantilla_que_no_coincide_se_descarta(self):
+        resolvedor = ResolvedorLinksDocumento()
+        resolvedor.observar(self._url("uuid-1", "a.pdf"), "uuid-1", "2", "a.pdf")
+        
+        assert not resolvedor.observar("https://otro.host/d?id=uuid-2", "uuid-2", "2", "b.pdf")
+        
+        assert not resolvedor.lista
+        assert resolvedor.construir("uuid-9", "2", "c.pdf") == "https://otro.host/d?id=uuid-9"
+    
+    def test_aprender_de_js(self):
+        codigo = (
+            "function descargaDocGeneral(codigo, tipo, nombre) {"
+            " window.location.href = '../../SeaceWeb-PRO/SdescargarArchivoAlfresco?fileCode=' + codigo"
+            " + '&tipo=' + tipo + '&nombre=' + encodeURIComponent(nombre); }"
+        )
+        resolvedor = ResolvedorLinksDocumento()
+        
+        assert resolvedor.aprender_de_js(codigo, self.URL_BASE)
+        assert not resolvedor.lista
+        assert resolvedor.construir("uuid-1", "2", "Bases Integradas.pdf") == self._url("uuid-1", "Bases%20Integradas.pdf")
+    
+    def test_aprender_de_js_sin_url(self):
+        codigo = "function descargaDocGeneral(a, b, c) { PrimeFaces.ab({s: 'frm', p: a}); }"
+        
+        assert not ResolvedorLinksDocumento().aprender_de_js(codigo, self.URL_BASE)
+    
+    def test_valores_cortos_solo_reemplazan_componentes_completos(self):
+        resolvedor = ResolvedorLinksDocumento()
+        
+        resolvedor.observar(self._url("uuid-1", "a.pdf"), "uuid-1", "2", "a.pdf")
+        
+        assert resolvedor.plantilla.startswith("https://prod2.seace.gob.pe/")
+        assert "tipo={tipo}" in resolvedor.plantilla
+
+
+class TestScrapearDocumentosConLinks:
+    """Tests del flujo de documentos: click solo hasta verificar la plantilla."""
+    
+    def _fila(self, indice, uuid):
+        """Fila tal como la devuelve el evaluate de la tabla de documentos."""
+        return {
+            "numero": str(indice),
+            "etapa": "Convocatoria",
+            "documento": "Bases",
+            "archivo": f"{uuid}.pdf (1.2 MB)",
+            "fecha_publicacion": "28/01/2026 15:09",
+            "tiene_enlace": True,
+            "onclick": f"javascript:descargaDocGeneral('{uuid}','2','{uuid}.pdf');",
+            "tamaño": "1.2 MB",
+        }
+    
+    def _page(self, filas):
+        tabla = MagicMock()
+        tabla.is_visible = AsyncMock(return_value=True)
+        tabla.evaluate = AsyncMock(return_value=filas)
+        tabla.locator.return_value.first.click = AsyncMock()
+        page = MagicMock()
+        page.url = "https://seace.gob.pe/ficha.xhtml"
+        page.locator.return_value = tabla
+        page.evaluate = AsyncMock(return_value="")
+        return page, tabla
+    
+    @pytest.mark.asyncio
+    async def test_solo_hace_click_hasta_verificar_la_plantilla(self):
+        scraper = NomenclaturaScraper(debug=False)
+        scraper._started = True
+        
+        uuids = [f"uuid-{i}" for i in range(5)]
+        page, tabla = self._page([self._fila(i, uuid) for i, uuid in enumerate(uuids)])
+        urls_descargadas = iter(f"https://seace.gob.pe/d?fileCode={uuid}" for uuid in uuids)
+        
+        class _ExpectDownload:
+            async def __aenter__(self):
+                download = MagicMock(url=next(urls_descargadas))
+                download.cancel = AsyncMock()
+                self.value = AsyncMock(return_value=download)()
+                return self
+            
+            async def __aexit__(self, *args):
+                return False
+        
+        page.expect_download = MagicMock(side_effect=lambda **kwargs: _ExpectDownload())
+        scraper.page = page
+        
+        with patch("src.scrapers.nomenclatura.asyncio.sleep", new=AsyncMock()):
+            resultado = await scraper.scrapear_documentos_con_links()
+        
+        assert [doc["link_descarga"] for doc in resultado["documentos"]] == [
+            f"https://seace.gob.pe/d?fileCode={uuid}" for uuid in uuids
+        ]
+        assert [doc["nombre_archivo"] for doc in resultado["documentos"]] == [f"{uuid}.pdf" for uuid in uuids]
+        assert resultado["documentos"][0]["tamaño"] == "1.2 MB"
+        # Una descarga para aprender la plantilla y otra para verificarla
+        assert page.expect_download.call_count == 2
+        # Toda la tabla se lee en un solo evaluate, con el mapa de columnas como argumento
+        tabla.evaluate.assert_awaited_once()
+        assert tabla.evaluate.await_args.args[1]["columnas"] == DOCUMENTOS_COLUMNS
+    
+    @pytest.mark.asyncio
+    async def test_sin_resolver_links_no_hace_click(self):
+        scraper = NomenclaturaScraper(debug=False)
+        scraper._started = True
+        
+        page, _ = self._page([self._fila(i, f"uuid-{i}") for i in range(3)] + [None])
+        page.expect_download = MagicMock()
+        scraper.page = page
+        
+        with patch("src.scrapers.nomenclatura.asyncio.sleep", new=AsyncMock()):
+            resultado = await scraper.scrapear_documentos_con_links(resolver_links=False)
+        
+        assert [(doc["uuid"], doc["tipo"], doc["nombre_archivo"]) for doc in resultado["documentos"]] == [
+            (f"uuid-{i}", "2", f"uuid-{i}.pdf") for i in range(3)
+        ]
+        assert all(doc["link_descarga"] is None for doc in resultado["documentos"])
+        page.expect_download.assert_not_called()
+
+
+class TestObtenerCronograma:
+    """Tests de la extracción del cronograma."""
+    
+    @pytest.mark.asyncio
+    async def test_limpia_filas_del_evaluate(self):
+        scraper = NomenclaturaScraper(debug=False)
+        scraper._started = True
+        tabla = MagicMock()
+        tabla.is_visible = AsyncMock(return_value=True)
+        tabla.evaluate = AsyncMock(return_value=[
+            {"etapa": "Convocatoria\n  ", "fecha_inicio": "28/01/2026", "fecha_fin": "28/01/2026"},
+            None,
+            {"etapa": "Presentación de\npropuestas", "fecha_inicio": "10/02/2026 09:00",
+             "fecha_fin": "10/02/2026 17:00\n(Hora local)"},
+        ])
+        scraper.page = MagicMock()
+        scraper.page.locator.return_value = tabla
+        
+        cronograma = await scraper.obtener_cronograma()
+        
+        assert cronograma == [
+            {"etapa": "Convocatoria", "fecha_inicio": "28/01/2026", "fecha_fin": "28/01/2026"},
+            {"etapa": "Presentación de propuestas", "fecha_inicio": "10/02/2026 09:00", "fecha_fin": "10/02/2026 17:00"},
+        ]
+        assert tabla.evaluate.await_args.args[1]["columnas"] == CRONOGRAMA_COLUMNS
+
+
+class TestScrapearLote:
+    """Tests del lote de nomenclaturas sobre sesiones reutilizadas."""
+    
+    def _scraper(self):
+        scraper = NomenclaturaScraper(debug=False)
+        scraper._started = True
+        scraper.preparar_buscador = AsyncMock()
+        scraper.volver_al_buscador = AsyncMock()
+        scraper.scrapear_ficha = AsyncMock(
+            side_effect=lambda nomenclatura, resolver_links: {"cronograma": [], "documentos": {"ficha": nomenclatura}}
+        )
+        return scraper
+    
+    @pytest.mark.asyncio
+    async def test_navega_una_vez_y_vuelve_al_buscador_entre_items(self):
+        scraper = self._scraper()
+        
+        resultados = await scraper.scrapear_lote(["A", "B", "C"], concurrencia=1)
+        
+        assert [r["nomenclatura"] for r in resultados] == ["A", "B", "C"]
+        assert all(r["status"] == "succeeded" for r in resultados)
+        assert resultados[1]["documentos"] == {"ficha": "B"}
+        assert scraper.preparar_buscador.await_count == 1
+        assert scraper.volver_al_buscador.await_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_item_fallido_no_corta_el_lote(self):
+        scraper = self._scraper()
+        
+        async def ficha(nomenclatura, resolver_links):
+            if nomenclatura == "B":
+                raise ScrapingError("sin resultados")
+            return {"cronograma": [], "documentos": {}}
+        
+        scraper.scrapear_ficha = AsyncMock(side_effect=ficha)
+        
+        resultados = await scraper.scrapear_lote(["A", "B", "C"], concurrencia=1)
+        
+        assert [r["status"] for r in resultados] == ["succeeded", "failed", "succeeded"]
+        assert "sin resultados" in resultados[1]["error"]
+        # Después de un fallo la sesión se prepara de nuevo desde el inicio
+        assert scraper.preparar_buscador.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_reparte_entre_sesiones_y_reintenta_items_de_sesion_rota(self):
+        scraper = self._scraper()
+        sesion_rota = self._scraper()
+        sesion_rota.preparar_buscador = AsyncMock(side_effect=ScrapingError("timeout"))
+        sesion_rota.close = AsyncMock()
+        scraper.abrir_sesion_adicional = AsyncMock(return_value=sesion_rota)
+        
+        resultados = await scraper.scrapear_lote([f"N-{i}" for i in range(4)], concurrencia=2)
+        
+        assert all(r["status"] == "succeeded" for r in resultados)
+        scraper.abrir_sesion_adicional.assert_awaited_once()
+        sesion_rota.close.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_fichas_conocidas_se_abren_sin_buscar(self):
+        scraper = self._scraper()
+        scraper.abrir_ficha_directa = AsyncMock(return_value=True)
+        scraper.extraer_ficha = AsyncMock(return_value={"cronograma": [], "documentos": {"ficha": "directa"}})
+        acceso = {"accion": {"formulario": "f", "parametros": {"nidConvocatoria": "X"}}, "url": None}
+        
+        resultados = await scraper.scrapear_lote(["A", "b"], concurrencia=1, fichas={"B": acceso})
+        
+        assert resultados[1]["documentos"] == {"ficha": "directa"}
+        scraper.abrir_ficha_directa.assert_awaited_once_with(acceso)
+        assert [llamada.args[0] for llamada in scraper.scrapear_ficha.await_args_list] == ["A"]
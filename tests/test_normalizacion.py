@@ -0,0 +1,67 @@
+"""
+Tests para la normalización tipada de columnas del scraper regional.
+"""
+
+import pandas as pd
+import pytest
+
+from src.selectors.regional import COLUMNAS_ESPERADAS
+from src.storage.normalizacion import normalizar_procesos
+
+
+@pytest.fixture
+def df_texto():
+    """Página tal cual la entrega el scraper."""
+    return pd.DataFrame(
+        [
+            ["1", "MUNI A", "28/01/2026 15:09", "NOM-1", "", "Obra", "DESC", "98,600.00", "Soles", "3"],
+            ["2", "MUNI B", "27/01/2026 09:30", "NOM-2", "", "Bien", "DESC", "---", "Soles", "3"],
+            ["3", "MUNI C", "fecha rara", "NOM-3", "", "Servicio", "DESC", "1,234,567.89", "Dólares", ""],
+        ],
+        columns=COLUMNAS_ESPERADAS,
+    )
+
+
+class TestNormalizarProcesos:
+    """Tests para normalizar_procesos."""
+    
+    def test_tipos(self, df_texto):
+        """Test que verifica los tipos resultantes por columna."""
+        tipado = normalizar_procesos(df_texto)
+        
+        assert list(tipado.columns) == COLUMNAS_ESPERADAS
+        assert str(tipado["N°"].dtype) == "Int64"
+        assert pd.api.types.is_datetime64_any_dtype(tipado["Fecha y Hora de Publicacion"])
+        assert tipado["VR / VE / Cuantía de la contratación"].dtype == "float64"
+        for columna in ["Moneda", "Objeto de Contratación", "Versión SEACE"]:
+            assert isinstance(tipado[columna].dtype, pd.CategoricalDtype)
+    
+    def test_valores(self, df_texto):
+        """Test que verifica montos, fechas y nulos."""
+        tipado = normalizar_procesos(df_texto)
+        
+        montos = tipado["VR / VE / Cuantía de la contratación"]
+        assert montos[0] == 98600.0
+        assert pd.isna(montos[1])
+        assert montos[2] == 1234567.89
+        assert tipado["Fecha y Hora de Publicacion"][0] == pd.Timestamp("2026-01-28 15:09")
+        assert pd.isna(tipado["Fecha y Hora de Publicacion"][2])
+        assert pd.isna(tipado["Versión SEACE"][2])
+    
+    def test_idempotente_y_sin_mutar(self, df_texto):
+        """Test que verifica que normalizar dos veces da lo mismo y no modifica la entrada."""
+        tipado = normalizar_procesos(df_texto)
+        
+        pd.testing.assert_frame_equal(normalizar_procesos(tipado), tipado)
+        assert df_texto["N°"][0] == "1"
+    
+    def test_reduce_memoria(self, df_texto):
+        """Test que verifica que las columnas convertidas ocupan menos memoria que el texto."""
+        grande = pd.concat([df_texto] * 1000, ignore_index=True)
+        columnas = ["N°", "Fecha y Hora de Publicacion", "VR / VE / Cuantía de la contratación",
+                    "Objeto de Contratación", "Moneda", "Versión SEACE"]
+        
+        antes = grande[columnas].memory_usage(deep=True).sum()
+        despues = normalizar_procesos(grande)[columnas].memory_usage(deep=True).sum()
+        
+        assert despues < antes / 2
@@ -0,0 +1,62 @@
+"""
+Tests para la escritura de datasets en Parquet.
+"""
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.selectors.regional import COLUMNAS_ESPERADAS
+from src.storage.parquet import ESQUEMA_PARQUET, escribir_parquet, ruta_parquet
+
+
+def _dataset(n):
+    return pd.DataFrame(
+        [
+            [str(i), "MUNI", f"{i + 1:02d}/01/2026 10:00", f"NOM-{i}", "", "Obra", "DESC",
+             "---" if i == 0 else f"{i},000.00", "Soles", "3"]
+            for i in range(n)
+        ],
+        columns=COLUMNAS_ESPERADAS,
+    )
+
+
+class TestEscribirParquet:
+    """Tests para escribir_parquet."""
+    
+    def test_row_groups_tipados_con_estadisticas(self, tmp_path):
+        """Test que verifica row groups por lote, tipos y min/max de fecha y monto."""
+        path = escribir_parquet(_dataset(25), tmp_path / "procesos.parquet", filas_por_grupo=10)
+        
+        archivo = pq.ParquetFile(path)
+        assert archivo.metadata.num_row_groups == 3
+        assert archivo.schema_arrow == ESQUEMA_PARQUET
+        
+        grupo = archivo.metadata.row_group(1)
+        columnas = {grupo.column(i).path_in_schema: grupo.column(i) for i in range(grupo.num_columns)}
+        fecha = columnas["Fecha y Hora de Publicacion"].statistics
+        monto = columnas["VR / VE / Cuantía de la contratación"].statistics
+        assert fecha.min == pd.Timestamp("2026-01-11 10:00")
+        assert fecha.max == pd.Timestamp("2026-01-20 10:00")
+        assert (monto.min, monto.max) == (10000.0, 19000.0)
+        assert not columnas["Descripción de Objeto"].is_stats_set
+    
+    def test_valores_nulos_y_sin_archivo_temporal(self, tmp_path):
+        """Test que verifica '---' como nulo y que no queda el .part."""
+        path = escribir_parquet(_dataset(3), tmp_path / "procesos.parquet", filas_por_grupo=100)
+        
+        df = pq.read_table(path).to_pandas()
+        assert pd.isna(df["VR / VE / Cuantía de la contratación"][0])
+        assert df["N°"].tolist() == [0, 1, 2]
+        assert [p.name for p in tmp_path.iterdir()] == ["procesos.parquet"]
+    
+    def test_dataset_vacio(self, tmp_path):
+        """Test que verifica que un dataset vacío produce un Parquet válido con el esquema."""
+        path = escribir_parquet(_dataset(0), tmp_path / "vacio.parquet", filas_por_grupo=10)
+        
+        tabla = pq.read_table(path)
+        assert tabla.num_rows == 0
+        assert tabla.schema == ESQUEMA_PARQUET
+    
+    def test_ruta_parquet(self):
+        """Test que verifica la ruta derivada del CSV."""
+        assert ruta_parquet("data/procesos_CUSCO_2026.csv").name == "procesos_CUSCO_2026.parquet"
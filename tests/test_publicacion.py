@@ -0,0 +1,54 @@
+"""
+Tests para la publicación atómica y versionada de datasets.
+"""
+
+import pytest
+
+from src.storage.publicacion import PublicadorDatasets
+
+
+@pytest.fixture
+def publicador(tmp_path):
+    return PublicadorDatasets(str(tmp_path), versiones_a_conservar=2)
+
+
+def _publicar(publicador, contenido, departamento="arequipa", anio="2026"):
+    staging = publicador.preparar_staging()
+    (staging / "procesos.csv").write_text(contenido, encoding="utf-8")
+    return publicador.publicar(departamento, anio, staging)
+
+
+class TestPublicadorDatasets:
+    """Tests para PublicadorDatasets."""
+    
+    def test_staging_exclusivo(self, publicador):
+        """Test que verifica que cada job recibe su propio directorio."""
+        assert publicador.preparar_staging() != publicador.preparar_staging()
+    
+    def test_publicar_y_latest(self, publicador):
+        """Test que verifica que LATEST apunta a la última versión y el staging desaparece."""
+        assert publicador.ruta_latest("AREQUIPA", "2026", "procesos.csv") is None
+        
+        primera = _publicar(publicador, "v1")
+        segunda = _publicar(publicador, "v2")
+        
+        assert primera != segunda
+        assert (primera / "procesos.csv").read_text(encoding="utf-8") == "v1"
+        assert publicador.version_latest("AREQUIPA", "2026") == segunda.name
+        assert publicador.ruta_latest("AREQUIPA", "2026", "procesos.csv").read_text() == "v2"
+        assert list(publicador.dir_staging.iterdir()) == []
+    
+    def test_poda_conserva_latest(self, publicador):
+        """Test que verifica que solo se conservan las N versiones más recientes."""
+        versiones = [_publicar(publicador, f"v{i}").name for i in range(4)]
+        
+        assert publicador.versiones("AREQUIPA", "2026") == versiones[-2:]
+    
+    def test_descartar_staging(self, publicador):
+        """Test que verifica la limpieza de un staging no publicado."""
+        staging = publicador.preparar_staging()
+        (staging / "parcial.csv").write_text("x")
+        
+        publicador.descartar_staging(staging)
+        
+        assert not staging.exists()
@@ -0,0 +1,55 @@
+"""
+Tests para el limitador de solicitudes por host.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import rate_limit
+from src.utils.rate_limit import LimitadorHosts, TokenBucket
+
+
+class _Reloj:
+    def __init__(self):
+        self.ahora = 100.0
+    
+    def __call__(self):
+        return self.ahora
+
+
+class TestTokenBucket:
+    """Tests para TokenBucket."""
+    
+    def test_rafaga_sin_espera_y_luego_a_la_tasa(self):
+        """Test que verifica que pasada la ráfaga cada solicitud espera 1/tasa más que la anterior."""
+        reloj = _Reloj()
+        with patch.object(rate_limit.time, "monotonic", reloj):
+            bucket = TokenBucket(tasa=2.0, rafaga=3)
+            assert [bucket.reservar() for _ in range(5)] == [0.0, 0.0, 0.0, 0.5, 1.0]
+            
+            reloj.ahora += 10
+            assert bucket.reservar() == 0.0
+    
+    def test_tasa_cero_no_limita(self):
+        """Test que verifica que tasa <= 0 desactiva el límite."""
+        bucket = TokenBucket(tasa=0, rafaga=1)
+        assert [bucket.reservar() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+class TestLimitadorHosts:
+    """Tests para LimitadorHosts."""
+    
+    async def test_buckets_por_host_y_metricas(self):
+        """Test que verifica que cada host tiene su propio bucket y se mide la espera."""
+        limitador = LimitadorHosts(tasa=1000.0, rafaga=1)
+        
+        assert await limitador.adquirir("a.test") == 0.0
+        assert await limitador.adquirir("b.test") == 0.0
+        assert await limitador.adquirir("a.test") == pytest.approx(0.001, abs=1e-3)
+        assert await limitador.adquirir(None) == 0.0
+        
+        metricas = limitador.metricas()
+        assert metricas["hosts"]["a.test"]["solicitudes"] == 2
+        assert metricas["hosts"]["a.test"]["esperas"] == 1
+        assert metricas["hosts"]["b.test"]["esperas"] == 0
@@ -2,9 +2,21 @@
 Tests unitarios para el scraper regional.
 """
 
+from datetime import datetime
+
+import pandas as pd
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from src.scrapers.regional import RegionalScraper
+from src.scrapers.regional import (
+    RegionalScraper,
+    calcular_rangos_de_paginas,
+    filas_ya_vistas,
+    parsear_fecha_publicacion,
+    parsear_filas_procesos,
+    parsear_opciones_panel,
+    parsear_reporte_paginador,
+)
+from src.selectors.regional import COLUMNAS_ESPERADAS
 from src.config.settings import BaseConfig
 from src.utils.exceptions import ElementNotFoundError, ScrapingError
 
@@ -92,3 +104,395 @@ class TestRegionalScraper:
         from src.scrapers.base import BaseScraper
         
         assert issubclass(RegionalScraper, BaseScraper)
+
+
+def _fila(numero: int, nomenclatura: str, fecha: str = "28/01/2026 10:00") -> list:
+    """Fila mínima con las columnas esperadas."""
+    return [str(numero), "ENTIDAD", fecha, nomenclatura, "", "Bien", "DESC", "---", "Soles", "3"]
+
+
+class TestPaginador:
+    """Tests para el parseo del paginador y el cálculo de shards."""
+    
+    def test_parsear_reporte_paginador(self):
+        """Test que verifica el parseo del page-report de PrimeFaces."""
+        info = parsear_reporte_paginador("[ Mostrando de 16 a 30 del total 1,032 - Página: 2/69 ]")
+        
+        assert info == {
+            "registro_inicio": 16,
+            "registro_fin": 30,
+            "total_registros": 1032,
+            "pagina_actual": 2,
+            "total_paginas": 69,
+        }
+    
+    def test_parsear_reporte_paginador_invalido(self):
+        """Test que verifica error con texto no reconocido."""
+        with pytest.raises(ScrapingError):
+            parsear_reporte_paginador("sin paginador")
+    
+    def test_calcular_rangos_de_paginas(self):
+        """Test que verifica la división del rango en shards contiguos."""
+        assert calcular_rangos_de_paginas(7, 3) == [(1, 3), (4, 6), (7, 7)]
+        assert calcular_rangos_de_paginas(2, 20) == [(1, 2)]
+        assert calcular_rangos_de_paginas(0, 20) == []
+
+
+class TestShards:
+    """Tests para la paginación en paralelo por shards."""
+    
+    @pytest.fixture
+    def scraper(self, tmp_path):
+        config = BaseConfig()
+        config.DATA_OUTPUT_DIR = str(tmp_path)
+        scraper = RegionalScraper(departamento="AREQUIPA", anio="2026", config=config)
+        scraper._started = True
+        return scraper
+    
+    @staticmethod
+    def _extraer_falso(inicio, fin, ruta):
+        # Las páginas 2 y 3 comparten un proceso desplazado entre shards
+        filas = [_fila(p, f"NOM-{p}") for p in range(inicio, fin + 1)]
+        if inicio == 3:
+            filas.insert(0, _fila(99, "NOM-2"))
+        df = pd.DataFrame(filas, columns=COLUMNAS_ESPERADAS)
+        df.to_csv(ruta, index=False)
+        return df
+    
+    @pytest.mark.asyncio
+    async def test_shards_se_unen_en_orden_sin_duplicados(self, scraper, tmp_path):
+        """Test que verifica que los segmentos se unen en orden y sin duplicados."""
+        sesion = RegionalScraper(departamento="AREQUIPA", anio="2026", config=scraper.config)
+        sesion.preparar_busqueda = AsyncMock()
+        sesion.ir_a_pagina = AsyncMock()
+        sesion._extraer_rango_de_paginas = AsyncMock(side_effect=self._extraer_falso)
+        sesion.close = AsyncMock()
+        
+        scraper.obtener_info_paginador = AsyncMock(return_value={"total_paginas": 5})
+        scraper.abrir_sesion_adicional = AsyncMock(return_value=sesion)
+        scraper.ir_a_pagina = AsyncMock()
+        scraper._extraer_rango_de_paginas = AsyncMock(side_effect=self._extraer_falso)
+        
+        df = await scraper.obtener_todas_las_paginas_por_shards(
+            "procesos.csv", concurrencia=2, paginas_por_shard=2
+        )
+        
+        assert list(df["Nomenclatura"]) == [f"NOM-{p}" for p in range(1, 6)]
+        assert (tmp_path / "procesos.csv").exists()
+        assert not list(tmp_path.glob("*.shard*"))
+        sesion.close.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_sin_concurrencia_usa_paginacion_secuencial(self, scraper):
+        """Test que verifica que con concurrencia 1 no se abren contextos adicionales."""
+        scraper.obtener_info_paginador = AsyncMock(return_value={"total_paginas": 50})
+        scraper.abrir_sesion_adicional = AsyncMock()
+        scraper.obtener_todas_las_paginas_de_procesos = AsyncMock(return_value=pd.DataFrame())
+        
+        await scraper.obtener_todas_las_paginas_por_shards("procesos.csv", concurrencia=1)
+        
+        scraper.abrir_sesion_adicional.assert_not_called()
+        scraper.obtener_todas_las_paginas_de_procesos.assert_awaited_once_with("procesos.csv")
+    
+    @pytest.mark.asyncio
+    async def test_sin_paginador_usa_paginacion_secuencial(self, scraper):
+        """Test que verifica que una sola página (sin paginador) se extrae de forma secuencial."""
+        scraper.obtener_info_paginador = AsyncMock(side_effect=ElementNotFoundError("sin paginador"))
+        scraper.abrir_sesion_adicional = AsyncMock()
+        scraper.obtener_todas_las_paginas_de_procesos = AsyncMock(return_value=pd.DataFrame())
+        
+        await scraper.obtener_todas_las_paginas_por_shards("procesos.csv", concurrencia=4)
+        
+        scraper.abrir_sesion_adicional.assert_not_called()
+        scraper.obtener_todas_las_paginas_de_procesos.assert_awaited_once_with("procesos.csv")
+
+
+def _tbody(*filas: list) -> str:
+    """Construye un <tbody> con 13 celdas por fila (como la tabla real de SEACE)."""
+    html = []
+    for fila in filas:
+        # Columnas 7 y 8 (SNIP/CUI) no se extraen; 12 son las acciones
+        celdas = fila[:7] + ["<a>snip</a>", "<a>cui</a>"] + fila[7:] + ["<a>acciones</a>"]
+        html.append("<tr>" + "".join(f"<td>{celda}</td>" for celda in celdas) + "</tr>")
+    return f'<tbody id="dtProcesos_data">{"".join(html)}</tbody>'
+
+
+class TestPipelinePaginacion:
+    """Tests para el parseo de filas y el pipeline productor/consumidor."""
+    
+    def test_parsear_filas_procesos(self):
+        """Test que verifica que se extraen solo las columnas esperadas."""
+        filas = parsear_filas_procesos(_tbody(_fila(1, "NOM-1"), _fila(2, "NOM-2")))
+        
+        assert filas == [_fila(1, "NOM-1"), _fila(2, "NOM-2")]
+    
+    def test_parsear_filas_celda_con_varios_elementos(self):
+        """Test que verifica que una celda con elementos anidados da el mismo texto que inner_text()."""
+        fila = _fila(1, "NOM-1")
+        fila[6] = (
+            '<span class="ui-column-title">Descripción de Objeto</span>\n'
+            '            <span title="ADQUISICION DE\n    CEMENTO">ADQUISICION DE\n'
+            '                CEMENTO   PORTLAND</span>'
+        )
+        
+        filas = parsear_filas_procesos(_tbody(fila))
+        
+        # Salida de inner_text() (más strip) sobre la misma celda
+        assert filas[0][6] == "Descripción de Objeto ADQUISICION DE CEMENTO PORTLAND"
+    
+    def test_parsear_filas_ignora_mensaje_vacio(self):
+        """Test que verifica que la fila de "sin resultados" de PrimeFaces se ignora."""
+        html = (
+            '<tbody><tr class="ui-widget-content ui-datatable-empty-message">'
+            '<td colspan="13">No se encontraron Datos</td></tr></tbody>'
+        )
+        
+        assert parsear_filas_procesos(html) == []
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_extrae_y_escribe_todas_las_paginas(self, tmp_path):
+        """Test que verifica que el pipeline procesa cada página capturada en orden."""
+        config = BaseConfig()
+        config.DATA_OUTPUT_DIR = str(tmp_path)
+        scraper = RegionalScraper(departamento="AREQUIPA", anio="2026", config=config)
+        scraper._started = True
+        
+        paginas = [_tbody(_fila(p, f"NOM-{p}")) for p in range(1, 4)]
+        scraper._capturar_html_pagina_actual = AsyncMock(side_effect=paginas)
+        scraper.clickear_en_siguiente_pagina = AsyncMock(side_effect=[True, True, False])
+        
+        df = await scraper.obtener_todas_las_paginas_de_procesos("procesos.csv")
+        
+        assert list(df["Nomenclatura"]) == ["NOM-1", "NOM-2", "NOM-3"]
+        en_disco = pd.read_csv(tmp_path / "procesos.csv", encoding="utf-8-sig", dtype=str)
+        assert list(en_disco.columns) == COLUMNAS_ESPERADAS
+        assert list(en_disco["Nomenclatura"]) == ["NOM-1", "NOM-2", "NOM-3"]
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_devuelve_el_texto_tal_cual(self, tmp_path):
+        """Test que verifica que el rango leído del CSV conserva el texto de cada celda."""
+        scraper = RegionalScraper(departamento="AREQUIPA", anio="2026", config=BaseConfig())
+        scraper._started = True
+        
+        scraper._capturar_html_pagina_actual = AsyncMock(
+            side_effect=[_tbody(_fila(1, "NOM-1")), _tbody(_fila(2, "NOM-2"))]
+        )
+        scraper.clickear_en_siguiente_pagina = AsyncMock(side_effect=[True, False])
+        
+        df = await scraper._extraer_rango_de_paginas(1, None, tmp_path / "procesos.csv")
+        
+        assert df.values.tolist() == [_fila(1, "NOM-1"), _fila(2, "NOM-2")]
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_envia_cada_pagina_a_los_sinks(self, tmp_path):
+        """Test que verifica que los sinks reciben cada página parseada."""
+        config = BaseConfig()
+        config.DATA_OUTPUT_DIR = str(tmp_path)
+        sink = MagicMock()
+        scraper = RegionalScraper(departamento="AREQUIPA", anio="2026", config=config, sinks=[sink])
+        scraper._started = True
+        
+        scraper._capturar_html_pagina_actual = AsyncMock(
+            side_effect=[_tbody(_fila(1, "NOM-1")), _tbody(_fila(2, "NOM-2"))]
+        )
+        scraper.clickear_en_siguiente_pagina = AsyncMock(side_effect=[True, False])
+        
+        await scraper.obtener_todas_las_paginas_de_procesos("procesos.csv")
+        
+        paginas = [llamada.args[1] for llamada in sink.escribir_pagina.call_args_list]
+        assert paginas == [1, 2]
+        assert list(sink.escribir_pagina.call_args_list[1].args[0]["Nomenclatura"]) == ["NOM-2"]
+        assert str(sink.escribir_pagina.call_args_list[1].args[0]["N°"].dtype) == "Int64"
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_envia_accesos_a_ficha_a_los_sinks(self, tmp_path):
+        """Test que verifica que las acciones de ficha de cada fila llegan a los sinks."""
+        config = BaseConfig()
+        config.DATA_OUTPUT_DIR = str(tmp_path)
+        sink = MagicMock()
+        scraper = RegionalScraper(departamento="AREQUIPA", anio="2026", config=config, sinks=[sink])
+        scraper._started = True
+        
+        onclick = "PrimeFaces.addSubmitParam('f',{'nidConvocatoria':'X1','nidProceso':'9'}).submit('f');"
+        html = _tbody(_fila(1, "NOM-1")).replace(
+            "<td><a>acciones</a></td>",
+            f'<td><a onclick="{onclick}"><img src="img/fichaSeleccion.gif"/></a></td>',
+        )
+        scraper._capturar_html_pagina_actual = AsyncMock(return_value=html)
+        scraper.clickear_en_siguiente_pagina = AsyncMock(return_value=False)
+        
+        await scraper.obtener_todas_las_paginas_de_procesos("procesos.csv")
+        
+        fichas, numero_pagina = sink.escribir_fichas.call_args.args
+        assert numero_pagina == 1
+        assert fichas["NOM-1"]["accion"]["parametros"] == {"nidConvocatoria": "X1", "nidProceso": "9"}
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_respeta_pagina_fin(self, tmp_path):
+        """Test que verifica que un rango acotado no avanza más allá de pagina_fin."""
+        config = BaseConfig()
+        scraper = RegionalScraper(departamento="AREQUIPA", anio="2026", config=config)
+        scraper._started = True
+        
+        scraper._capturar_html_pagina_actual = AsyncMock(
+            side_effect=[_tbody(_fila(4, "NOM-4")), _tbody(_fila(5, "NOM-5"))]
+        )
+        scraper.clickear_en_siguiente_pagina = AsyncMock(return_value=True)
+        
+        df = await scraper._extraer_rango_de_paginas(4, 5, tmp_path / "segmento.csv")
+        
+        assert list(df["Nomenclatura"]) == ["NOM-4", "NOM-5"]
+        assert scraper.clickear_en_siguiente_pagina.await_count == 1
+
+
+class TestConteo:
+    """Tests para el modo conteo (solo paginador)."""
+    
+    @pytest.fixture
+    def scraper(self):
+        scraper = RegionalScraper(departamento="CUSCO", anio="2026")
+        scraper._started = True
+        scraper.preparar_busqueda = AsyncMock()
+        return scraper
+    
+    @pytest.mark.asyncio
+    async def test_contar_procesos_lee_paginador(self, scraper):
+        """Test que verifica que el conteo sale del page-report sin extraer filas."""
+        scraper.obtener_info_paginador = AsyncMock(return_value=parsear_reporte_paginador(
+            "[ Mostrando de 1 a 15 del total 1,032 - Página: 1/69 ]"
+        ))
+        scraper._extraer_datos_pagina_actual = AsyncMock()
+        
+        conteo = await scraper.contar_procesos()
+        
+        assert conteo == {"total_registros": 1032, "total_paginas": 69, "registros_por_pagina": 15}
+        scraper._extraer_datos_pagina_actual.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_contar_procesos_sin_resultados(self, scraper):
+        """Test que verifica que una búsqueda sin resultados cuenta 0."""
+        from src.utils.exceptions import TableNotFoundError
+        
+        error = ScrapingError("Error al hacer click en buscar")
+        error.__cause__ = TableNotFoundError("No hay resultados en la búsqueda")
+        scraper.preparar_busqueda.side_effect = error
+        
+        conteo = await scraper.contar_procesos()
+        
+        assert conteo["total_registros"] == 0
+
+
+class TestOpciones:
+    """Tests para la lectura de departamentos/años válidos."""
+    
+    PANEL = (
+        '<div id="tbBuscador:idFormBuscarProceso:departamento_panel"><ul>'
+        '<li data-label="[Seleccione]">[Seleccione]</li>'
+        '<li data-label="AMAZONAS">AMAZONAS</li>'
+        '<li data-label="LA LIBERTAD">LA LIBERTAD</li>'
+        '</ul></div>'
+    )
+    
+    def test_parsear_opciones_panel(self):
+        """Test que verifica que se omite el placeholder y se conserva el orden."""
+        assert parsear_opciones_panel(self.PANEL) == ["AMAZONAS", "LA LIBERTAD"]
+    
+    @pytest.mark.asyncio
+    async def test_obtener_opciones(self):
+        """Test que verifica que se leen ambos paneles tras abrir la búsqueda avanzada."""
+        scraper = RegionalScraper()
+        scraper._started = True
+        scraper.navigate_to_seace = AsyncMock()
+        scraper.select_search_type = AsyncMock()
+        scraper.click_busqueda_avanzada = AsyncMock()
+        panel_anios = '<div><ul><li data-label="[Seleccione]"></li><li data-label="2026"></li></ul></div>'
+        locator = MagicMock()
+        locator.evaluate = AsyncMock(side_effect=[self.PANEL, panel_anios])
+        scraper.page = MagicMock()
+        scraper.page.locator.return_value = locator
+        
+        opciones = await scraper.obtener_opciones()
+        
+        assert opciones == {"departamentos": ["AMAZONAS", "LA LIBERTAD"], "anios": ["2026"]}
+    
+    @pytest.mark.asyncio
+    async def test_obtener_opciones_vacias(self):
+        """Test que verifica error si los paneles no tienen opciones."""
+        scraper = RegionalScraper()
+        scraper._started = True
+        scraper.navigate_to_seace = AsyncMock()
+        scraper.select_search_type = AsyncMock()
+        scraper.click_busqueda_avanzada = AsyncMock()
+        scraper.page = MagicMock()
+        scraper.page.locator.return_value.evaluate = AsyncMock(return_value="<div></div>")
+        
+        with pytest.raises(ScrapingError):
+            await scraper.obtener_opciones()
+
+
+class TestIncremental:
+    """Tests para el scraping incremental con marca de agua."""
+    
+    def test_parsear_fecha_publicacion(self):
+        """Test que verifica el formato de fecha de SEACE."""
+        assert parsear_fecha_publicacion("28/01/2026 15:09") == datetime(2026, 1, 28, 15, 9)
+        assert parsear_fecha_publicacion("---") is None
+    
+    def test_filas_ya_vistas(self):
+        """Test que verifica la marca de agua por fecha y por nomenclatura."""
+        df = pd.DataFrame(
+            [
+                _fila(1, "NUEVA", "29/01/2026 09:00"),
+                _fila(2, "CONOCIDA", "29/01/2026 08:00"),
+                _fila(3, "VIEJA", "27/01/2026 08:00"),
+            ],
+            columns=COLUMNAS_ESPERADAS,
+        )
+        
+        vistas = filas_ya_vistas(df, since=datetime(2026, 1, 28), nomenclaturas_conocidas={"CONOCIDA"})
+        
+        assert list(vistas) == [False, True, True]
+    
+    def test_filas_ya_vistas_since_con_zona(self):
+        """Test que verifica que un `since` con zona (UTC) se compara en hora de Lima."""
+        df = pd.DataFrame(
+            [
+                _fila(1, "NUEVA", "31/12/2025 20:00"),
+                _fila(2, "VIEJA", "31/12/2025 18:00"),
+            ],
+            columns=COLUMNAS_ESPERADAS,
+        )
+        
+        # 2026-01-01T00:00:00Z son las 19:00 del 31/12/2025 en Lima
+        since = datetime.fromisoformat("2026-01-01T00:00:00+00:00")
+        vistas = filas_ya_vistas(df, since=since)
+        
+        assert list(vistas) == [False, True]
+    
+    @pytest.mark.asyncio
+    async def test_corta_en_pagina_conocida_y_combina(self, tmp_path):
+        """Test que verifica que se deja de paginar y se combina con el dataset existente."""
+        existente = tmp_path / "procesos.csv"
+        pd.DataFrame(
+            [_fila(1, "NOM-B", "27/01/2026 10:00"), _fila(2, "NOM-A", "26/01/2026 10:00")],
+            columns=COLUMNAS_ESPERADAS,
+        ).to_csv(existente, index=False, encoding="utf-8-sig")
+        
+        config = BaseConfig()
+        config.DATA_OUTPUT_DIR = str(tmp_path)
+        scraper = RegionalScraper(departamento="AREQUIPA", anio="2026", config=config)
+        scraper._started = True
+        scraper._capturar_html_pagina_actual = AsyncMock(side_effect=[
+            _tbody(_fila(1, "NOM-D", "29/01/2026 10:00")),
+            _tbody(_fila(2, "NOM-C", "28/01/2026 10:00"), _fila(3, "NOM-B", "27/01/2026 10:00")),
+            _tbody(_fila(4, "NOM-A", "26/01/2026 10:00")),
+        ] + [_tbody(_fila(p, f"NOM-VIEJA-{p}", "25/01/2026 10:00")) for p in range(5, 10)])
+        scraper.clickear_en_siguiente_pagina = AsyncMock(return_value=True)
+        
+        df = await scraper.obtener_paginas_nuevas_de_procesos("procesos.csv", dataset_existente=existente)
+        
+        assert list(df["Nomenclatura"]) == ["NOM-D", "NOM-C", "NOM-B", "NOM-A"]
+        assert list(df["N°"]) == ["1", "2", "3", "4"]
+        # La página 3 ya es toda conocida: el productor solo se adelanta lo que permite la cola
+        assert scraper._capturar_html_pagina_actual.await_count <= 3 + config.PIPELINE_QUEUE_SIZE + 1
+        assert not any(n.startswith("NOM-VIEJA") for n in df["Nomenclatura"])
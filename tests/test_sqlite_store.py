@@ -0,0 +1,316 @@
+"""
+Tests para el almacén SQLite de procesos.
+"""
+
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from src.selectors.regional import COLUMNAS_ESPERADAS
+from src.storage.sinks import MetricasSink, SqliteSink
+from src.storage.sqlite_store import ProcesoStore
+
+
+def _pagina(*filas):
+    """Crea una página a partir de tuplas (nomenclatura, entidad, fecha)."""
+    return pd.DataFrame(
+        [
+            [str(i), entidad, fecha, nomenclatura, "", "Obra", "DESC", "98,600.00", "Soles", "3"]
+            for i, (nomenclatura, entidad, fecha) in enumerate(filas, start=1)
+        ],
+        columns=COLUMNAS_ESPERADAS,
+    )
+
+
+class TestProcesoStore:
+    """Tests para ProcesoStore."""
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = ProcesoStore(str(tmp_path / "seace.db"))
+        yield store
+        store.close()
+    
+    def test_upsert_inserta_y_actualiza(self, store):
+        """Test que verifica el upsert por Nomenclatura."""
+        store.upsert_procesos(_pagina(("NOM-1", "MUNI A", "28/01/2026 15:09")), "arequipa", "2026")
+        id_original = store.obtener("NOM-1")["id"]
+        
+        store.upsert_procesos(_pagina(("NOM-1", "MUNI B", "28/01/2026 15:09")), "AREQUIPA", "2026")
+        
+        proceso = store.obtener("NOM-1")
+        assert store.contar() == 1
+        assert proceso["id"] == id_original
+        assert proceso["entidad"] == "MUNI B"
+        assert proceso["departamento"] == "AREQUIPA"
+        assert proceso["fecha_publicacion"] == "2026-01-28T15:09:00"
+        assert proceso["valor_referencial"] == 98600.0
+        assert proceso["version_seace"] == 3
+    
+    def test_ignora_filas_sin_nomenclatura(self, store):
+        """Test que verifica que filas sin clave no se guardan."""
+        escritas = store.upsert_procesos(_pagina(("", "MUNI", "28/01/2026 15:09")), "AREQUIPA", "2026")
+        
+        assert escritas == 0
+        assert store.contar() == 0
+    
+    def test_wal_e_indices(self, store):
+        """Test que verifica modo WAL e índices de consulta."""
+        conn = store._conexion()
+        indices = {fila[1] for fila in conn.execute("PRAGMA index_list(procesos)")}
+        
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert {"idx_procesos_entidad", "idx_procesos_fecha"} <= indices
+    
+    def test_sqlite_sink(self, store):
+        """Test que verifica que el sink escribe cada página con la misma marca de scraping."""
+        sink = SqliteSink(store, "CUSCO", "2026")
+        sink.escribir_pagina(_pagina(("NOM-1", "A", "28/01/2026 10:00")), 1)
+        sink.escribir_pagina(_pagina(("NOM-2", "B", "27/01/2026 10:00")), 2)
+        
+        assert sink.filas_escritas == 2
+        assert store.contar(departamento="cusco", anio="2026") == 2
+        assert store.obtener("NOM-1")["scraped_at"] == store.obtener("NOM-2")["scraped_at"]
+    
+    def test_sinks_no_cuentan_dos_veces_una_pagina_reintentada(self, store):
+        """Test que verifica que re-emitir una página (shard reintentado) no infla las cuentas."""
+        sink = SqliteSink(store, "CUSCO", "2026")
+        metricas = MetricasSink()
+        for pagina, filas in ((1, [("NOM-1", "A", "28/01/2026 10:00")]),
+                              (2, [("NOM-2", "B", "27/01/2026 10:00")]),
+                              (2, [("NOM-2", "B", "27/01/2026 10:00")])):
+            sink.escribir_pagina(_pagina(*filas), pagina)
+            metricas.escribir_pagina(_pagina(*filas), pagina)
+        
+        assert sink.filas_escritas == 2
+        assert (metricas.paginas, metricas.filas) == (2, 2)
+
+
+class TestIndiceFichas:
+    """Tests para el índice nomenclatura -> acceso directo a la ficha."""
+    
+    @pytest.fixture
+    def store(self):
+        store = ProcesoStore(":memory:")
+        yield store
+        store.close()
+    
+    def test_registrar_y_obtener(self, store):
+        accion = {"formulario": "f", "parametros": {"nidConvocatoria": "X"}}
+        store.registrar_fichas({"NOM-1": {"accion": accion, "url": None}})
+        
+        assert store.obtener_ficha("NOM-1") == {"accion": accion, "url": None}
+        assert store.obtener_ficha("NOM-2") is None
+    
+    def test_no_pierde_la_url_conocida(self, store):
+        accion = {"formulario": "f", "parametros": {"nidConvocatoria": "X"}}
+        store.registrar_fichas({"NOM-1": {"accion": None, "url": "https://seace/fichaSeleccion.xhtml?id=1"}})
+        store.registrar_fichas({"NOM-1": {"accion": accion, "url": None}})
+        
+        assert store.obtener_ficha("NOM-1") == {"accion": accion, "url": "https://seace/fichaSeleccion.xhtml?id=1"}
+    
+    def test_olvidar_ficha(self, store):
+        store.registrar_fichas({"NOM-1": {"accion": None, "url": "https://seace/fichaSeleccion.xhtml?id=1"}})
+        store.olvidar_ficha("NOM-1")
+        
+        assert store.obtener_ficha("NOM-1") is None
+    
+    def test_sink_registra_fichas_de_la_pagina(self, store):
+        sink = SqliteSink(store, "AREQUIPA", "2026")
+        sink.escribir_fichas({"NOM-1": {"accion": {"formulario": "f", "parametros": {}}, "url": None}}, 1)
+        
+        assert store.obtener_ficha("NOM-1")["accion"] == {"formulario": "f", "parametros": {}}
+
+
+class TestManifiestoDocumentos:
+    """Tests para el manifiesto documento -> blob."""
+    
+    @pytest.fixture
+    def store(self):
+        store = ProcesoStore(":memory:")
+        yield store
+        store.close()
+    
+    def test_registrar_y_consultar(self, store):
+        store.registrar_documentos_archivados("NOM-1", [
+            {"uuid": "u-1", "sha256": "a" * 64, "tamaño_bytes": 10, "nombre_archivo": "a.pdf"},
+            {"uuid": "u-2", "sha256": None, "status": "failed"},
+        ])
+        store.registrar_documentos_archivados("NOM-1", [{"uuid": "u-1", "sha256": "b" * 64}])
+        
+        assert store.documentos_archivados("NOM-1") == {"u-1": "b" * 64}
+        assert store.documentos_archivados("NOM-2") == {}
+
+
+class TestIndiceCronograma:
+    """Tests para el índice de etapas del cronograma."""
+    
+    @pytest.fixture
+    def store(self):
+        store = ProcesoStore(":memory:")
+        yield store
+        store.close()
+    
+    def test_reemplaza_las_etapas_de_la_ficha(self, store):
+        store.registrar_cronograma("NOM-1", [
+            {"etapa": "Convocatoria", "fecha_inicio": None, "fecha_fin": datetime(2026, 2, 1, 23, 59)},
+            {"etapa": "Propuestas", "fecha_inicio": None, "fecha_fin": datetime(2026, 2, 5, 17, 0)},
+        ])
+        store.registrar_cronograma("NOM-1", [
+            {"etapa": "Propuestas", "fecha_inicio": None, "fecha_fin": datetime(2026, 2, 8, 17, 0)},
+        ])
+        
+        filas = store.proximos_cierres(datetime(2026, 1, 1), datetime(2026, 12, 31))
+        assert [(fila["etapa"], fila["fecha_fin"]) for fila in filas] == [("Propuestas", "2026-02-08T17:00:00")]
+    
+    def test_cruza_nomenclaturas_no_canonicas(self, store):
+        """Test que verifica que el proceso guardado con el texto crudo se cruza con su cronograma."""
+        store.upsert_procesos(_pagina(("as-sm-3-2026  MUNI-1", "MUNI AREQUIPA", "28/01/2026 10:00")), "AREQUIPA", "2026")
+        store.registrar_cronograma("AS-SM-3-2026 MUNI-1", [
+            {"etapa": "Propuestas", "fecha_inicio": None, "fecha_fin": datetime(2026, 2, 5, 17, 0)},
+        ])
+        
+        filas = store.proximos_cierres(datetime(2026, 1, 1), datetime(2026, 12, 31), departamento="arequipa")
+        
+        assert [(fila["nomenclatura"], fila["entidad"]) for fila in filas] == [("AS-SM-3-2026 MUNI-1", "MUNI AREQUIPA")]
+    
+    def test_calcula_la_clave_en_bases_anteriores(self, tmp_path):
+        """Test que verifica que una base sin la columna `clave` la recibe al abrirse."""
+        ruta = tmp_path / "seace.db"
+        conn = sqlite3.connect(ruta)
+        conn.execute(
+            "CREATE TABLE procesos (id INTEGER PRIMARY KEY, nomenclatura TEXT NOT NULL UNIQUE, numero INTEGER, "
+            "entidad TEXT COLLATE NOCASE, fecha_publicacion TEXT, reiniciado_desde TEXT, objeto_contratacion TEXT, "
+            "descripcion_objeto TEXT, valor_referencial REAL, moneda TEXT, version_seace INTEGER, "
+            "departamento TEXT NOT NULL, anio TEXT NOT NULL, scraped_at TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO procesos (nomenclatura, entidad, departamento, anio, scraped_at) "
+            "VALUES ('as-sm-3-2026  MUNI-1', 'MUNI AREQUIPA', 'AREQUIPA', '2026', '2026-01-28T10:00:00Z')"
+        )
+        conn.commit()
+        conn.close()
+        
+        store = ProcesoStore(str(ruta))
+        store.registrar_cronograma("AS-SM-3-2026 MUNI-1", [
+            {"etapa": "Propuestas", "fecha_inicio": None, "fecha_fin": datetime(2026, 2, 5, 17, 0)},
+        ])
+        filas = store.proximos_cierres(datetime(2026, 1, 1), datetime(2026, 12, 31))
+        store.close()
+        
+        assert filas[0]["entidad"] == "MUNI AREQUIPA"
+    
+    def test_consulta_usa_el_indice(self, store):
+        plan = store._conexion().execute(
+            "EXPLAIN QUERY PLAN SELECT nomenclatura FROM cronograma WHERE fecha_fin >= ? AND fecha_fin <= ?",
+            ("2026", "2027"),
+        ).fetchall()
+        assert "idx_cronograma_fin_etapa" in " ".join(fila["detail"] for fila in plan)
+
+
+class TestConsultaProcesos:
+    """Tests para ProcesoStore.consultar."""
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = ProcesoStore(str(tmp_path / "seace.db"))
+        store.upsert_procesos(
+            _pagina(
+                ("NOM-1", "MUNI AREQUIPA", "28/01/2026 10:00"),
+                ("NOM-2", "MUNI AREQUIPA", "28/01/2026 10:00"),
+                ("NOM-3", "GORE AREQUIPA", "27/01/2026 09:00"),
+                ("NOM-4", "MUNI_X", "26/01/2026 09:00"),
+            ),
+            "AREQUIPA",
+            "2026",
+        )
+        yield store
+        store.close()
+    
+    def test_paginacion_por_cursor(self, store):
+        """Test que verifica que el keyset recorre todas las filas sin repetir (incluye empates de fecha)."""
+        vistas = []
+        cursor = None
+        while True:
+            filas, cursor = store.consultar(campos=["nomenclatura"], limit=1, cursor=cursor)
+            vistas.extend(fila["nomenclatura"] for fila in filas)
+            if cursor is None:
+                break
+        
+        assert vistas == ["NOM-2", "NOM-1", "NOM-3", "NOM-4"]
+    
+    def test_filtros_y_proyeccion(self, store):
+        """Test que verifica filtros por entidad (prefijo) y rango de fechas."""
+        filas, cursor = store.consultar(
+            entidad="muni",
+            fecha_desde=datetime(2026, 1, 27),
+            campos=["nomenclatura", "entidad"],
+        )
+        
+        assert cursor is None
+        assert filas == [
+            {"nomenclatura": "NOM-2", "entidad": "MUNI AREQUIPA"},
+            {"nomenclatura": "NOM-1", "entidad": "MUNI AREQUIPA"},
+        ]
+    
+    def test_entidad_escapa_comodines(self, store):
+        """Test que verifica que `_` en el filtro de entidad es literal."""
+        filas, _ = store.consultar(entidad="MUNI_", campos=["nomenclatura"])
+        assert filas == [{"nomenclatura": "NOM-4"}]
+    
+    def test_errores(self, store):
+        """Test que verifica errores por campo desconocido o cursor inválido."""
+        with pytest.raises(ValueError):
+            store.consultar(campos=["no_existe"])
+        with pytest.raises(ValueError):
+            store.consultar(cursor="%%%")
+
+
+class TestBusquedaTextoCompleto:
+    """Tests para ProcesoStore.buscar."""
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = ProcesoStore(str(tmp_path / "seace.db"))
+        pagina = _pagina(
+            ("NOM-1", "MUNI AREQUIPA", "28/01/2026 10:00"),
+            ("NOM-2", "SEDAPAR", "27/01/2026 09:00"),
+            ("NOM-3", "GORE CUSCO", "26/01/2026 09:00"),
+        )
+        pagina["Descripción de Objeto"] = [
+            "CONSTRUCCIÓN DE PISTAS",
+            "MANTENIMIENTO DEL SISTEMA DE AGUA POTABLE",
+            "ADQUISICIÓN DE AGUA DE MESA",
+        ]
+        store.upsert_procesos(pagina, "AREQUIPA", "2026")
+        yield store
+        store.close()
+    
+    def test_busqueda_sin_tildes_con_resaltado(self, store):
+        """Test que verifica plegado de tildes y resaltado."""
+        resultados = store.buscar("construccion")
+        
+        assert [r["nomenclatura"] for r in resultados] == ["NOM-1"]
+        assert resultados[0]["descripcion_resaltada"] == "<mark>CONSTRUCCIÓN</mark> DE PISTAS"
+    
+    def test_todas_las_palabras_y_prefijo(self, store):
+        """Test que verifica AND entre palabras y búsqueda por prefijo."""
+        assert [r["nomenclatura"] for r in store.buscar("agua potable")] == ["NOM-2"]
+        assert {r["nomenclatura"] for r in store.buscar("agu*")} == {"NOM-2", "NOM-3"}
+    
+    def test_indice_se_actualiza_con_upsert(self, store):
+        """Test que verifica que el índice refleja la descripción actualizada."""
+        pagina = _pagina(("NOM-1", "MUNI AREQUIPA", "28/01/2026 10:00"))
+        pagina["Descripción de Objeto"] = "MEJORAMIENTO DE VEREDAS"
+        store.upsert_procesos(pagina, "AREQUIPA", "2026")
+        
+        assert store.buscar("pistas") == []
+        assert [r["nomenclatura"] for r in store.buscar("veredas")] == ["NOM-1"]
+    
+    def test_sintaxis_fts_es_literal(self, store):
+        """Test que verifica que comillas u operadores no rompen la consulta."""
+        assert store.buscar('"agua" OR -') == []
+        with pytest.raises(ValueError):
+            store.buscar('" *')
@@ -3,9 +3,10 @@ Tests unitarios para las estrategias de espera.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.utils import wait_strategies
 from src.utils.wait_strategies import ProductionWaitStrategy, DevelopmentWaitStrategy
-from src.utils.exceptions import TableNotFoundError, InvalidTableStructureError
+from src.utils.exceptions import ScrapingError, TableNotFoundError, InvalidTableStructureError
 
 
 class TestProductionWaitStrategy:
@@ -78,6 +79,61 @@ class TestProductionWaitStrategy:
         mock_page.wait_for_selector.assert_called_once()
 
 
+class TestSenalesConcurrencia:
+    """Tests de las señales que las estrategias envían al controlador AIMD."""
+    
+    def _page(self, status, timing=None):
+        response = MagicMock(url="https://prod2.seace.gob.pe/buscadorPublico.xhtml", status=status)
+        # Tiempos en ms relativos a startTime; requestStart ya es posterior a la espera en el limitador
+        response.request.timing = timing or {"startTime": 0, "requestStart": 2500.0, "responseStart": 2750.0}
+        
+        class _ExpectResponse:
+            async def __aenter__(self):
+                info = MagicMock()
+                info.value = AsyncMock(return_value=response)()
+                return info
+            
+            async def __aexit__(self, *args):
+                return False
+        
+        page = MagicMock()
+        page.expect_response = MagicMock(return_value=_ExpectResponse())
+        page.wait_for_load_state = AsyncMock()
+        return page
+    
+    @pytest.mark.asyncio
+    async def test_respuesta_ok_informa_latencia(self):
+        controlador = MagicMock()
+        boton = AsyncMock()
+        with patch.object(wait_strategies, "controlador_seace", controlador):
+            await ProductionWaitStrategy().click_and_wait_for_response(self._page(200), boton, {})
+        
+        controlador.registrar_latencia.assert_called_once_with(0.25)
+        boton.click.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_sin_tiempos_no_informa_latencia(self):
+        controlador = MagicMock()
+        page = self._page(200, timing={"startTime": 0, "requestStart": -1, "responseStart": -1})
+        with patch.object(wait_strategies, "controlador_seace", controlador):
+            await ProductionWaitStrategy().click_and_wait_for_response(page, AsyncMock(), {})
+        
+        controlador.registrar_latencia.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_error_http_informa_error(self):
+        controlador = MagicMock()
+        boton = AsyncMock()
+        with patch.object(wait_strategies, "controlador_seace", controlador), \
+             pytest.raises(ScrapingError):
+            await ProductionWaitStrategy().click_and_wait_for_response(self._page(503), boton, {})
+        
+        controlador.registrar_error_http.assert_called_once_with(503)
+        controlador.registrar_latencia.assert_not_called()
+        controlador.registrar_timeout.assert_not_called()
+        boton.click.assert_awaited_once()
+
+
 class TestDevelopmentWaitStrategy:
     """Tests para DevelopmentWaitStrategy."""
     
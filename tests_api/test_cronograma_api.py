@@ -0,0 +1,74 @@
+"""
+Tests para GET /cronograma/proximos.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from src.scrapers.ficha import ZONA_SEACE
+from src.selectors.regional import COLUMNAS_ESPERADAS
+from src.storage.sqlite_store import ProcesoStore
+
+
+@pytest.fixture
+def client():
+    """Fixture que crea un cliente de prueba."""
+    return TestClient(create_app())
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Almacén aislado con dos procesos de departamentos distintos y sus cronogramas."""
+    store = ProcesoStore(str(tmp_path / "seace.db"))
+    for departamento, nomenclatura in (("CUSCO", "NOM-1"), ("PUNO", "NOM-2")):
+        store.upsert_procesos(
+            pd.DataFrame(
+                [["1", "MUNI", "28/01/2026 10:00", nomenclatura, "", "Obra", "D", "1,000.00", "Soles", "3"]],
+                columns=COLUMNAS_ESPERADAS,
+            ),
+            departamento,
+            "2026",
+        )
+    ahora = datetime.now(ZONA_SEACE)
+    store.registrar_cronograma("NOM-1", [
+        {"etapa": "Convocatoria", "fecha_inicio": ahora - timedelta(days=5), "fecha_fin": ahora - timedelta(days=1)},
+        {"etapa": "Presentación de propuestas", "fecha_inicio": ahora, "fecha_fin": ahora + timedelta(hours=48)},
+    ])
+    store.registrar_cronograma("NOM-2", [
+        {"etapa": "Presentación de propuestas", "fecha_inicio": ahora, "fecha_fin": ahora + timedelta(hours=10)},
+        {"etapa": "Buena pro", "fecha_inicio": None, "fecha_fin": ahora + timedelta(days=10)},
+    ])
+    with patch("app.routers.cronograma.proceso_store", store):
+        yield store
+    store.close()
+
+
+class TestCronogramaProximosAPI:
+    """Tests para los próximos cierres de etapa."""
+    
+    def test_ventana_ordenada_por_fecha_fin(self, client, store):
+        """Test que verifica que solo salen las etapas que terminan dentro de la ventana."""
+        body = client.get("/cronograma/proximos?horas=72").json()
+        
+        assert body["total"] == 2
+        assert [(item["nomenclatura"], item["departamento"]) for item in body["items"]] == [
+            ("NOM-2", "PUNO"),
+            ("NOM-1", "CUSCO"),
+        ]
+    
+    def test_filtros_departamento_y_etapa(self, client, store):
+        """Test que verifica los filtros por departamento y texto de la etapa."""
+        body = client.get("/cronograma/proximos?horas=720&departamento=cusco").json()
+        assert [item["etapa"] for item in body["items"]] == ["Presentación de propuestas"]
+        
+        body = client.get("/cronograma/proximos?horas=720&etapa=buena").json()
+        assert [item["nomenclatura"] for item in body["items"]] == ["NOM-2"]
+    
+    def test_horas_invalidas(self, client, store):
+        """Test que verifica la validación de la ventana."""
+        assert client.get("/cronograma/proximos?horas=0").status_code == 422
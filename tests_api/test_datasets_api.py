@@ -0,0 +1,146 @@
+"""
+Tests para los endpoints de /datasets.
+"""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from src.selectors.regional import COLUMNAS_ESPERADAS
+from src.storage.cdc import RegistroCambios
+from src.storage.parquet import ESQUEMA_PARQUET, escribir_parquet
+from src.storage.publicacion import PublicadorDatasets
+from src.storage.sqlite_store import ProcesoStore
+
+
+@pytest.fixture
+def client():
+    """Fixture que crea un cliente de prueba."""
+    return TestClient(create_app())
+
+
+@pytest.fixture
+def registro(tmp_path):
+    """Registro de cambios aislado en un directorio temporal."""
+    registro = RegistroCambios(str(tmp_path))
+    with patch("app.routers.datasets.registro_cambios", registro):
+        yield registro
+
+
+def _snapshot(*nomenclaturas):
+    return pd.DataFrame(
+        [[str(i), "E", "28/01/2026 10:00", n, "", "Bien", "D", "---", "Soles", "3"] for i, n in enumerate(nomenclaturas)],
+        columns=COLUMNAS_ESPERADAS,
+    )
+
+
+class TestDatasetChangesAPI:
+    """Tests para GET /datasets/{departamento}/{anio}/changes."""
+    
+    def test_changes_since(self, client, registro):
+        """Test que verifica que solo se devuelven cambios posteriores a `since`."""
+        registro.registrar_snapshot("AREQUIPA", "2026", _snapshot("A", "B"), snapshot_at="2026-01-28T10:00:00Z")
+        registro.registrar_snapshot("AREQUIPA", "2026", _snapshot("A", "C"), snapshot_at="2026-01-29T10:00:00Z")
+        
+        res = client.get("/datasets/arequipa/2026/changes", params={"since": "2026-01-28T10:00:00Z"})
+        
+        assert res.status_code == 200
+        body = res.json()
+        assert body["departamento"] == "AREQUIPA"
+        assert (body["inserts"], body["updates"], body["deletes"]) == (1, 0, 1)
+        assert {c["nomenclatura"] for c in body["cambios"]} == {"B", "C"}
+    
+    def test_changes_paginados_por_cursor(self, client, registro):
+        """Test que verifica que `limit` corta la respuesta y `next_cursor` sigue desde ahí."""
+        registro.registrar_snapshot("AREQUIPA", "2026", _snapshot("A", "B", "C"), snapshot_at="2026-01-28T10:00:00Z")
+        
+        primera = client.get("/datasets/AREQUIPA/2026/changes", params={"limit": 2}).json()
+        segunda = client.get(
+            "/datasets/AREQUIPA/2026/changes", params={"limit": 2, "cursor": primera["next_cursor"]}
+        ).json()
+        
+        assert [c["nomenclatura"] for c in primera["cambios"]] == ["A", "B"]
+        assert primera["total_cambios"] == 2
+        assert [c["nomenclatura"] for c in segunda["cambios"]] == ["C"]
+        assert segunda["next_cursor"] is None
+    
+    def test_changes_cursor_invalido(self, client, registro):
+        """Test que verifica 400 con un cursor que no salió de una respuesta anterior."""
+        registro.registrar_snapshot("AREQUIPA", "2026", _snapshot("A"), snapshot_at="2026-01-28T10:00:00Z")
+        
+        assert client.get("/datasets/AREQUIPA/2026/changes", params={"cursor": "abc"}).status_code == 400
+        assert client.get("/datasets/AREQUIPA/2026/changes", params={"cursor": "3"}).status_code == 400
+    
+    def test_changes_sin_snapshots(self, client, registro):
+        """Test que verifica 404 si no hay historial."""
+        res = client.get("/datasets/CUSCO/2026/changes")
+        assert res.status_code == 404
+
+
+class TestDatasetArrowAPI:
+    """Tests para GET /datasets/{departamento}/{anio}.arrow."""
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = ProcesoStore(str(tmp_path / "seace.db"))
+        with patch("app.routers.datasets.proceso_store", store), \
+             patch("app.routers.datasets.publicador_datasets", PublicadorDatasets(str(tmp_path))):
+            yield store
+        store.close()
+    
+    def test_arrow_desde_store(self, client, store):
+        """Test que verifica el stream IPC armado desde el almacén, en varios batches."""
+        store.upsert_procesos(_snapshot(*[f"N-{i}" for i in range(5)]), "AREQUIPA", "2026")
+        
+        with patch("src.storage.arrow_export.FILAS_POR_LOTE", 2):
+            res = client.get("/datasets/arequipa/2026.arrow")
+        
+        assert res.status_code == 200
+        assert res.headers["content-type"] == "application/vnd.apache.arrow.stream"
+        lotes = list(pa.ipc.open_stream(res.content))
+        tabla = pa.Table.from_batches(lotes)
+        assert len(lotes) == 3
+        assert tabla.schema == ESQUEMA_PARQUET
+        assert sorted(tabla.column("Nomenclatura").to_pylist()) == [f"N-{i}" for i in range(5)]
+    
+    def test_arrow_desde_parquet(self, client, store, tmp_path):
+        """Test que verifica el fallback al Parquet publicado cuando el almacén no tiene filas."""
+        publicador = PublicadorDatasets(str(tmp_path))
+        staging = publicador.preparar_staging()
+        escribir_parquet(_snapshot("A", "B"), staging / "procesos_CUSCO_2026.parquet", filas_por_grupo=1)
+        publicador.publicar("CUSCO", "2026", staging)
+        
+        res = client.get("/datasets/CUSCO/2026.arrow")
+        
+        assert res.status_code == 200
+        assert pa.ipc.open_stream(res.content).read_all().column("Nomenclatura").to_pylist() == ["A", "B"]
+    
+    def test_arrow_sin_datos(self, client, store):
+        """Test que verifica 404 si no hay datos."""
+        assert client.get("/datasets/PUNO/2026.arrow").status_code == 404
+
+
+class TestDatasetCatalogAPI:
+    """Tests para GET /datasets."""
+    
+    def test_lista_desde_catalogo(self, client, tmp_path):
+        """Test que verifica que el listado sale del catálogo, sin mirar el disco."""
+        store = ProcesoStore(str(tmp_path / "seace.db"))
+        entrada = {
+            "departamento": "AREQUIPA", "anio": "2026", "version": "v1", "formato": "csv",
+            "path": "/no/existe/procesos.csv", "filas": 10, "paginas": 1,
+            "iniciado_en": "2026-01-28T10:00:00Z", "finalizado_en": "2026-01-28T10:01:00Z",
+            "bytes": 123, "sha256": "abc",
+        }
+        store.registrar_archivos_dataset([entrada])
+        
+        with patch("app.routers.datasets.proceso_store", store):
+            res = client.get("/datasets", params={"departamento": "arequipa"})
+        store.close()
+        
+        assert res.status_code == 200
+        assert res.json() == {"total": 1, "datasets": [entrada]}
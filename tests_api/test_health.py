@@ -1,6 +1,7 @@
 from fastapi.testclient import TestClient
 
 from app.main import create_app
+from src.config.settings import BaseConfig
 
 
 def test_health_ok():
@@ -9,3 +10,20 @@ def test_health_ok():
     assert res.status_code == 200
     assert res.json() == {"status": "ok"}
 
+
+
+def test_metricas_limitador():
+    client = TestClient(create_app())
+    res = client.get("/health/limitador")
+    assert res.status_code == 200
+    body = res.json()
+    assert body["tasa"] == BaseConfig.HOST_RATE_LIMIT
+    assert isinstance(body["hosts"], dict)
+
+
+def test_metricas_concurrencia():
+    client = TestClient(create_app())
+    res = client.get("/health/concurrencia")
+    assert res.status_code == 200
+    body = res.json()
+    assert body["minimo"] <= body["limite"] <= body["maximo"]
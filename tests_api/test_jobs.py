@@ -3,7 +3,8 @@ import asyncio
 from fastapi.testclient import TestClient
 
 from app.main import create_app
-from app.services.job_manager import job_manager
+from app.services.job_manager import JobManager, job_manager
+from src.utils.concurrencia import ControladorAIMD
 
 
 def test_jobs_status_and_result_flow():
@@ -27,3 +28,32 @@ def test_jobs_status_and_result_flow():
     assert res_result.status_code == 200
     assert res_result.json()["job_id"] == rec.id
 
+
+
+def test_jobs_esperan_turno_del_controlador():
+    controlador = ControladorAIMD(minimo=1, maximo=4, inicial=1, latencia_objetivo=5.0)
+    manager = JobManager(controlador=controlador)
+    liberar_primero = None
+
+    async def primero():
+        await liberar_primero.wait()
+        return 1
+
+    async def segundo():
+        return 2
+
+    async def flujo():
+        nonlocal liberar_primero
+        liberar_primero = asyncio.Event()
+        a = await manager.create_job(job_type="test", fn=primero)
+        b = await manager.create_job(job_type="test", fn=segundo)
+        await asyncio.sleep(0.01)
+        estados = [(await manager.get(a.id)).status, (await manager.get(b.id)).status]
+        liberar_primero.set()
+        await asyncio.gather(a.task, b.task)
+        return estados, (await manager.get(b.id)).status
+
+    estados, final = asyncio.run(flujo())
+    assert estados == ["running", "queued"]
+    assert final == "succeeded"
+    assert controlador.metricas()["en_curso"] == 0
@@ -12,6 +12,7 @@ from fastapi.testclient import TestClient
 
 from app.main import create_app
 from app.services.job_manager import job_manager
+from src.storage.comprimidos import precomprimir
 
 
 def _set_job_succeeded_direct(job_manager, job_id, result_data):
@@ -298,6 +299,85 @@ class TestJobsDownloadAPI:
         
         assert response.status_code == 404
         assert "no existe" in response.json()["detail"].lower()
+    
+    def test_download_parquet(self, client, tmp_path):
+        """Test que verifica que un job solo-Parquet descarga el Parquet por defecto."""
+        parquet_path = tmp_path / "procesos_AREQUIPA_2026.parquet"
+        parquet_path.write_bytes(b"PAR1")
+        
+        async def fn():
+            return {
+                "departamento": "AREQUIPA",
+                "anio": "2026",
+                "total_registros": 1,
+                "output_format": "parquet",
+                "parquet_path": str(parquet_path),
+            }
+        
+        job = asyncio.run(job_manager.create_job(job_type="regional", fn=fn))
+        _set_job_succeeded_direct(job_manager, job.id, asyncio.run(fn()))
+        
+        response = client.get(f"/jobs/{job.id}/download")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.parquet"
+        assert response.content == b"PAR1"
+        
+        response = client.get(f"/jobs/{job.id}/download", params={"formato": "csv"})
+        assert response.status_code == 404
+
+
+class TestJobsDownloadNegotiationAPI:
+    """Tests para compresión, Range y ETag en /jobs/{job_id}/download."""
+    
+    @pytest.fixture
+    def job_csv(self, tmp_path):
+        csv_path = tmp_path / "procesos_CUSCO_2026.csv"
+        csv_path.write_text("N°,Nomenclatura\n" + "1,NOM-1\n" * 200, encoding="utf-8")
+        precomprimir(csv_path, ["gzip"])
+        result = {"departamento": "CUSCO", "anio": "2026", "total_registros": 200, "csv_path": str(csv_path)}
+        
+        async def fn():
+            return result
+        
+        job = asyncio.run(job_manager.create_job(job_type="regional", fn=fn))
+        _set_job_succeeded_direct(job_manager, job.id, result)
+        return job, csv_path
+    
+    def test_gzip_precomprimido(self, client, job_csv):
+        """Test que verifica que se sirve la variante gzip si el cliente la acepta."""
+        job, csv_path = job_csv
+        
+        response = client.get(f"/jobs/{job.id}/download", headers={"Accept-Encoding": "gzip"})
+        
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.content == csv_path.read_bytes()
+    
+    def test_range(self, client, job_csv):
+        """Test que verifica la reanudación con Range (206)."""
+        job, csv_path = job_csv
+        
+        response = client.get(
+            f"/jobs/{job.id}/download",
+            headers={"Accept-Encoding": "identity", "Range": "bytes=10-19"},
+        )
+        
+        assert response.status_code == 206
+        assert response.content == csv_path.read_bytes()[10:20]
+    
+    def test_if_none_match(self, client, job_csv):
+        """Test que verifica 304 cuando el ETag no cambió."""
+        job, _ = job_csv
+        headers = {"Accept-Encoding": "identity"}
+        
+        etag = client.get(f"/jobs/{job.id}/download", headers=headers).headers["etag"]
+        response = client.get(f"/jobs/{job.id}/download", headers={**headers, "If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
 
 
 class TestJobsCancelAPI:
@@ -0,0 +1,346 @@
+"""
+Tests para GET /nomenclatura/{nomenclatura}/documentos/{uuid}/link.
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.services import scraper_service
+from src.scrapers.nomenclatura import ResolvedorLinksDocumento
+from src.storage.sqlite_store import ProcesoStore
+from src.utils.concurrencia import ControladorAIMD
+from src.utils.exceptions import ElementNotFoundError
+
+NOMENCLATURA = "SIE-SIE-1-2026-SEDAPAR-1"
+
+
+@pytest.fixture
+def client():
+    """Fixture que crea un cliente de prueba."""
+    return TestClient(create_app())
+
+
+@pytest.fixture(autouse=True)
+def estado_links_limpio():
+    """Caches y plantilla de links son globales: se reinician en cada test."""
+    scraper_service._links_documentos_cache.invalidate()
+    scraper_service._descargas_documentos_cache.invalidate()
+    scraper_service._fichas_cache.invalidate()
+    store = ProcesoStore(":memory:")
+    with patch.object(scraper_service, "_resolvedor_links", ResolvedorLinksDocumento()), \
+         patch.object(scraper_service, "proceso_store", store):
+        yield
+    store.close()
+    scraper_service._links_documentos_cache.invalidate()
+    scraper_service._descargas_documentos_cache.invalidate()
+    scraper_service._fichas_cache.invalidate()
+
+
+def _scraper_falso(**metodos):
+    scraper = AsyncMock()
+    scraper.__aenter__.return_value = scraper
+    scraper.ficha_actual = None
+    scraper.fichas_resueltas = {}
+    for nombre, valor in metodos.items():
+        setattr(scraper, nombre, valor)
+    return scraper
+
+
+class TestDocumentoLinkAPI:
+    """Tests para la resolución de links bajo demanda."""
+    
+    def test_resuelve_con_navegador_y_cachea(self, client):
+        """Test que verifica que el segundo pedido sale de cache, sin navegador."""
+        scraper = _scraper_falso(obtener_link_documento=AsyncMock(return_value="https://seace/d?id=abc-1"))
+        with patch.object(scraper_service, "NomenclaturaScraper", return_value=scraper) as clase:
+            primera = client.get(f"/nomenclatura/{NOMENCLATURA}/documentos/abc-1/link")
+            segunda = client.get(f"/nomenclatura/{NOMENCLATURA}/documentos/abc-1/link")
+        
+        assert primera.status_code == 200
+        assert primera.json() == {
+            "nomenclatura": NOMENCLATURA,
+            "uuid": "abc-1",
+            "link_descarga": "https://seace/d?id=abc-1",
+            "desde_cache": False,
+        }
+        assert segunda.json()["desde_cache"] is True
+        assert clase.call_count == 1
+        scraper.obtener_link_documento.assert_awaited_once_with("abc-1")
+    
+    def test_navegador_toma_turno_del_controlador(self, client):
+        """Test que verifica que abrir la ficha ocupa un turno del controlador y lo devuelve."""
+        controlador = ControladorAIMD(minimo=1, maximo=1, inicial=1, latencia_objetivo=8.0)
+        en_curso = []
+        
+        async def obtener_link(uuid):
+            en_curso.append(controlador.metricas()["en_curso"])
+            return "https://seace/d?id=abc-1"
+        
+        scraper = _scraper_falso(obtener_link_documento=AsyncMock(side_effect=obtener_link))
+        with patch.object(scraper_service, "NomenclaturaScraper", return_value=scraper), \
+             patch.object(scraper_service, "controlador_seace", controlador):
+            res = client.get(f"/nomenclatura/{NOMENCLATURA}/documentos/abc-1/link")
+        
+        assert res.status_code == 200
+        assert en_curso == [1]
+        assert controlador.metricas()["en_curso"] == 0
+    
+    def test_construye_link_con_plantilla_verificada(self, client):
+        """Test que verifica que con la tupla conocida y la plantilla verificada no se abre el navegador."""
+        resolvedor = scraper_service._resolvedor_links
+        resolvedor.observar("https://seace/d?id=u-1&n=a.pdf", "u-1", "2", "a.pdf")
+        resolvedor.observar("https://seace/d?id=u-2&n=b.pdf", "u-2", "2", "b.pdf")
+        scraper_service._descargas_documentos_cache.set((NOMENCLATURA, "u-3"), ("u-3", "2", "c.pdf"))
+        
+        with patch.object(scraper_service, "NomenclaturaScraper") as clase:
+            res = client.get(f"/nomenclatura/{NOMENCLATURA}/documentos/u-3/link")
+        
+        assert res.status_code == 200
+        assert res.json()["link_descarga"] == "https://seace/d?id=u-3&n=c.pdf"
+        clase.assert_not_called()
+    
+    def test_documento_inexistente(self, client):
+        """Test que verifica 404 si la ficha no tiene el documento."""
+        scraper = _scraper_falso(
+            obtener_link_documento=AsyncMock(side_effect=ElementNotFoundError("No se encontró el documento x"))
+        )
+        with patch.object(scraper_service, "NomenclaturaScraper", return_value=scraper):
+            res = client.get(f"/nomenclatura/{NOMENCLATURA}/documentos/x/link")
+        
+        assert res.status_code == 404
+    
+    def test_uuid_invalido(self, client):
+        """Test que verifica que el uuid no admite caracteres fuera de un identificador."""
+        res = client.get(f"/nomenclatura/{NOMENCLATURA}/documentos/a'b/link")
+        
+        assert res.status_code == 422
+    
+    def test_job_registra_documentos_para_resolver_despues(self):
+        """Test que verifica que el scrape deja la tupla de cada documento disponible para el endpoint."""
+        documentos = {
+            "total_documentos": 1,
+            "documentos": [
+                {"uuid": "u-1", "tipo": "2", "nombre_archivo": "a.pdf", "link_descarga": None},
+            ],
+        }
+        scraper = _scraper_falso(
+            obtener_cronograma=AsyncMock(return_value=[]),
+            scrapear_documentos_con_links=AsyncMock(return_value=documentos),
+        )
+        with patch.object(scraper_service, "NomenclaturaScraper", return_value=scraper):
+            resultado = asyncio.run(scraper_service.run_nomenclatura_scrape(nomenclatura=NOMENCLATURA, debug=False))
+        
+        assert resultado["documentos"] == documentos
+        scraper.scrapear_documentos_con_links.assert_awaited_once_with(resolver_links=False)
+        assert scraper_service._descargas_documentos_cache.get((NOMENCLATURA, "u-1")) == ("u-1", "2", "a.pdf")
+
+
+
+class TestAccesoDirectoFicha:
+    """Tests del índice nomenclatura -> ficha en el servicio."""
+    
+    def _scraper(self):
+        return _scraper_falso(
+            obtener_cronograma=AsyncMock(return_value=[]),
+            scrapear_documentos_con_links=AsyncMock(return_value={"total_documentos": 0, "documentos": []}),
+        )
+    
+    def test_primera_busqueda_guarda_el_acceso_y_la_segunda_lo_usa(self):
+        """Test que verifica que la segunda consulta abre la ficha sin buscar."""
+        acceso = {"accion": {"formulario": "f", "parametros": {"nidConvocatoria": "X"}}, "url": None}
+        primero = self._scraper()
+        primero.ficha_actual = acceso
+        with patch.object(scraper_service, "NomenclaturaScraper", return_value=primero):
+            asyncio.run(scraper_service.run_nomenclatura_scrape(nomenclatura=NOMENCLATURA, debug=False))
+        primero.preparar_buscador.assert_awaited_once()
+        
+        segundo = self._scraper()
+        segundo.abrir_ficha_directa = AsyncMock(return_value=True)
+        with patch.object(scraper_service, "NomenclaturaScraper", return_value=segundo):
+            asyncio.run(scraper_service.run_nomenclatura_scrape(
+                nomenclatura=NOMENCLATURA.lower(), debug=False, usar_cache=False
+            ))
+        
+        segundo.abrir_ficha_directa.assert_awaited_once_with(acceso)
+        segundo.preparar_buscador.assert_not_awaited()
+        segundo.click_boton_de_buscar.assert_not_awaited()
+    
+    def test_acceso_que_no_sirve_se_descarta_y_se_busca(self):
+        """Test que verifica el fallback al buscador si el acceso guardado ya no abre la ficha."""
+        scraper_service.proceso_store.registrar_fichas(
+            {NOMENCLATURA: {"accion": None, "url": "https://seace/fichaSeleccion.xhtml?id=viejo"}}
+        )
+        scraper = self._scraper()
+        scraper.abrir_ficha_directa = AsyncMock(return_value=False)
+        with patch.object(scraper_service, "NomenclaturaScraper", return_value=scraper):
+            asyncio.run(scraper_service.run_nomenclatura_scrape(nomenclatura=NOMENCLATURA, debug=False))
+        
+        scraper.click_boton_de_buscar.assert_awaited_once()
+        assert scraper_service.proceso_store.obtener_ficha(NOMENCLATURA) is None
+
+
+class TestCacheFichas:
+    """Tests de la vigencia y revalidación de fichas extraídas."""
+    
+    DOCUMENTOS = {
+        "total_documentos": 1,
+        "documentos": [
+            {"uuid": "u-1", "tipo": "2", "nombre_archivo": "a.pdf", "fecha_publicacion": "28/01/2026 15:09",
+             "link_descarga": None},
+        ],
+    }
+    
+    def _scraper(self, firma=None, documentos=None):
+        return _scraper_falso(
+            obtener_cronograma=AsyncMock(return_value=[]),
+            scrapear_documentos_con_links=AsyncMock(return_value=documentos or self.DOCUMENTOS),
+            obtener_firma_documentos=AsyncMock(return_value=firma),
+        )
+    
+    def _scrapear(self, scraper, **kwargs):
+        with patch.object(scraper_service, "NomenclaturaScraper", return_value=scraper) as clase:
+            resultado = asyncio.run(
+                scraper_service.run_nomenclatura_scrape(nomenclatura=NOMENCLATURA, debug=False, **kwargs)
+            )
+        return resultado, clase
+    
+    def _vencer(self):
+        entrada = scraper_service._fichas_cache.get(NOMENCLATURA)
+        entrada["vigente_hasta"] = 0
+    
+    def test_ficha_vigente_no_abre_el_navegador(self):
+        """Test que verifica que una ficha recién extraída se sirve desde cache."""
+        primero, _ = self._scrapear(self._scraper())
+        assert primero["desde_cache"] is None
+        
+        segundo, clase = self._scrapear(self._scraper())
+        assert segundo["desde_cache"] == "vigente"
+        assert segundo["documentos"] == self.DOCUMENTOS
+        clase.assert_not_called()
+    
+    def test_ficha_vencida_con_misma_firma_se_revalida(self):
+        """Test que verifica que no se re-extrae si la firma de documentos no cambió."""
+        self._scrapear(self._scraper())
+        self._vencer()
+        
+        scraper = self._scraper(firma={"total": 1, "ultima_publicacion": "2026-01-28T15:09:00-05:00"})
+        resultado, _ = self._scrapear(scraper)
+        
+        assert resultado["desde_cache"] == "revalidada"
+        scraper.obtener_firma_documentos.assert_awaited_once()
+        scraper.scrapear_documentos_con_links.assert_not_awaited()
+        assert scraper_service._fichas_cache.get(NOMENCLATURA)["vigente_hasta"] > 0
+    
+    def test_ficha_vencida_con_firma_distinta_se_extrae(self):
+        """Test que verifica la re-extracción cuando hay documentos nuevos."""
+        self._scrapear(self._scraper())
+        self._vencer()
+        
+        scraper = self._scraper(firma={"total": 2, "ultima_publicacion": "2026-02-01T10:00:00-05:00"})
+        resultado, _ = self._scrapear(scraper)
+        
+        assert resultado["desde_cache"] is None
+        scraper.scrapear_documentos_con_links.assert_awaited_once()
+    
+    def test_extraccion_indexa_el_cronograma(self):
+        """Test que verifica que las etapas quedan en el índice con fechas ISO."""
+        scraper = self._scraper()
+        scraper.obtener_cronograma = AsyncMock(return_value=[
+            {"etapa": "Presentación de propuestas", "fecha_inicio": "10/02/2026 09:00", "fecha_fin": "12/02/2026"},
+        ])
+        self._scrapear(scraper)
+        
+        filas = scraper_service.proceso_store.proximos_cierres(datetime(2026, 2, 1), datetime(2026, 3, 1))
+        assert [(fila["nomenclatura"], fila["fecha_inicio"], fila["fecha_fin"]) for fila in filas] == [
+            (NOMENCLATURA, "2026-02-10T09:00:00", "2026-02-12T23:59:00"),
+        ]
+    
+    def test_pedir_links_no_usa_ficha_cacheada_sin_links(self):
+        """Test que verifica que resolver_links no se sirve con una entrada sin links resueltos."""
+        self._scrapear(self._scraper())
+        
+        scraper = self._scraper()
+        resultado, clase = self._scrapear(scraper, resolver_links=True)
+        
+        assert resultado["desde_cache"] is None
+        clase.assert_called_once()
+        scraper.scrapear_documentos_con_links.assert_awaited_once_with(resolver_links=True)
+    
+    def test_links_cacheados_vencen_antes_que_la_ficha(self):
+        """Test que verifica que la ficha cacheada no sirve links más viejos que DOCUMENT_LINK_CACHE_TTL."""
+        link = "https://prod2.seace.gob.pe/SeaceWeb-PRO/SdescargarArchivoAlfresco?fileCode=u-1"
+        documentos = {
+            "total_documentos": 1,
+            "documentos": [{**self.DOCUMENTOS["documentos"][0], "link_descarga": link}],
+        }
+        self._scrapear(self._scraper(documentos=documentos), resolver_links=True)
+        assert scraper_service._fichas_cache.get(NOMENCLATURA)["datos"]["documentos"] == self.DOCUMENTOS
+        
+        vigente, _ = self._scrapear(self._scraper(), resolver_links=True)
+        assert vigente["desde_cache"] == "vigente"
+        assert vigente["documentos"]["documentos"][0]["link_descarga"] == link
+        
+        # Vence el link pero no la ficha
+        scraper_service._links_documentos_cache.invalidate()
+        sin_links, clase = self._scrapear(self._scraper())
+        assert sin_links["desde_cache"] == "vigente"
+        assert sin_links["documentos"] == self.DOCUMENTOS
+        clase.assert_not_called()
+        
+        scraper = self._scraper(documentos=documentos)
+        con_links, _ = self._scrapear(scraper, resolver_links=True)
+        assert con_links["desde_cache"] is None
+        scraper.scrapear_documentos_con_links.assert_awaited_once_with(resolver_links=True)
+    
+    def test_lote_sirve_fichas_vigentes_sin_navegador(self):
+        """Test que verifica que el lote solo extrae las nomenclaturas que no están en cache."""
+        self._scrapear(self._scraper())
+        
+        scraper = self._scraper()
+        scraper.scrapear_lote = AsyncMock(return_value=[
+            {"nomenclatura": "OTRA-1", "status": "succeeded", "cronograma": [],
+             "documentos": self.DOCUMENTOS, "error": None},
+        ])
+        with patch.object(scraper_service, "NomenclaturaScraper", return_value=scraper):
+            resultados = asyncio.run(scraper_service.run_nomenclatura_batch(
+                nomenclaturas=[NOMENCLATURA, "OTRA-1"], debug=False
+            ))
+        
+        assert scraper.scrapear_lote.await_args.args[0] == ["OTRA-1"]
+        assert [resultado["desde_cache"] for resultado in resultados] == ["vigente", None]
+        assert scraper_service._fichas_cache.get("OTRA-1") is not None
+
+
+class TestArchivoDocumentosServicio:
+    """Tests de la etapa opcional de archivo de documentos."""
+    
+    def test_archivar_resuelve_links_y_actualiza_el_manifiesto(self):
+        """Test que verifica que archivar implica resolver links y deja el manifiesto en el store."""
+        documentos = {
+            "total_documentos": 1,
+            "documentos": [
+                {"uuid": "u-1", "tipo": "2", "nombre_archivo": "a.pdf", "link_descarga": "https://seace.test/a.pdf"},
+            ],
+        }
+        scraper = _scraper_falso(
+            obtener_cronograma=AsyncMock(return_value=[]),
+            scrapear_documentos_con_links=AsyncMock(return_value=documentos),
+        )
+        entradas = [{"uuid": "u-1", "sha256": "a" * 64, "tamaño_bytes": 3, "status": "archivado", "error": None}]
+        archivar = AsyncMock(return_value=entradas)
+        with patch.object(scraper_service, "NomenclaturaScraper", return_value=scraper), \
+             patch.object(scraper_service, "archivar_documentos", archivar):
+            resultado = asyncio.run(
+                scraper_service.run_nomenclatura_scrape(nomenclatura=NOMENCLATURA, debug=False, archivar=True)
+            )
+        
+        scraper.scrapear_documentos_con_links.assert_awaited_once_with(resolver_links=True)
+        assert archivar.await_args.args[0] == documentos["documentos"]
+        assert archivar.await_args.kwargs["ya_archivados"] == {}
+        assert resultado["archivo"] == entradas
+        assert scraper_service.proceso_store.documentos_archivados(NOMENCLATURA) == {"u-1": "a" * 64}
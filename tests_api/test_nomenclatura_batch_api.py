@@ -0,0 +1,66 @@
+"""
+Tests para POST /scrape/nomenclatura/batch.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.routers import scrape
+
+
+@pytest.fixture
+def client():
+    """Fixture que crea un cliente de prueba."""
+    return TestClient(create_app())
+
+
+def _esperar_job(client, job_id):
+    for _ in range(20):
+        body = client.get(f"/jobs/{job_id}").json()
+        if body["status"] in ("succeeded", "failed"):
+            return body
+        asyncio.run(asyncio.sleep(0.05))
+    return body
+
+
+class TestNomenclaturaBatchAPI:
+    """Tests para el lote de nomenclaturas."""
+    
+    def test_lote_devuelve_resultado_por_item(self, client):
+        """Test que verifica el resumen del job y que se eliminan nomenclaturas repetidas."""
+        resultados = [
+            {"nomenclatura": "A", "status": "succeeded", "cronograma": [], "documentos": {}, "error": None},
+            {"nomenclatura": "B", "status": "failed", "cronograma": None, "documentos": None, "error": "x"},
+        ]
+        run = AsyncMock(return_value=resultados)
+        with patch.object(scrape, "run_nomenclatura_batch", run):
+            res = client.post(
+                "/scrape/nomenclatura/batch",
+                json={"nomenclaturas": ["A", " B ", "A"], "concurrencia": 2},
+            )
+            assert res.status_code == 200
+            job_id = res.json()["job_id"]
+            assert _esperar_job(client, job_id)["status"] == "succeeded"
+        
+        assert run.await_args.kwargs["nomenclaturas"] == ["A", "B"]
+        assert run.await_args.kwargs["concurrencia"] == 2
+        result = client.get(f"/jobs/{job_id}/result").json()["result"]
+        assert result["total"] == 2
+        assert result["exitosos"] == 1
+        assert result["fallidos"] == 1
+        assert result["resultados"] == resultados
+    
+    def test_lote_vacio(self, client):
+        """Test que verifica 422 sin nomenclaturas válidas."""
+        assert client.post("/scrape/nomenclatura/batch", json={"nomenclaturas": []}).status_code == 422
+        assert client.post("/scrape/nomenclatura/batch", json={"nomenclaturas": ["  "]}).status_code == 422
+    
+    def test_concurrencia_acotada(self, client):
+        """Test que verifica el límite de contextos por lote."""
+        res = client.post("/scrape/nomenclatura/batch", json={"nomenclaturas": ["A"], "concurrencia": 50})
+        
+        assert res.status_code == 422
@@ -0,0 +1,143 @@
+"""
+Tests para /options y la validación previa de /scrape/regional.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.services import scraper_service
+
+OPCIONES = {
+    "departamentos": ["AREQUIPA", "CUSCO"],
+    "anios": ["2026", "2025"],
+    "actualizado_en": "2026-01-28T10:00:00Z",
+}
+
+
+@pytest.fixture
+def client():
+    """Fixture que crea un cliente de prueba."""
+    return TestClient(create_app())
+
+
+@pytest.fixture(autouse=True)
+def cache_opciones_limpia():
+    """La cache de opciones es global: se limpia antes y después de cada test."""
+    scraper_service._opciones_cache.invalidate()
+    yield
+    scraper_service._opciones_cache.invalidate()
+
+
+def _scraper_opciones(*errores):
+    """Scraper falso cuya lectura de opciones falla con `errores` antes de responder."""
+    scraper = AsyncMock()
+    scraper.__aenter__.return_value = scraper
+    scraper.obtener_opciones = AsyncMock(
+        side_effect=[*errores, {"departamentos": OPCIONES["departamentos"], "anios": OPCIONES["anios"]}]
+    )
+    return scraper
+
+
+class TestOptionsAPI:
+    """Tests para GET /options y POST /options/refresh."""
+    
+    def test_sin_opciones(self, client):
+        """Test que verifica 404 si la cache está vacía."""
+        assert client.get("/options").status_code == 404
+    
+    def test_refresh_carga_cache(self, client):
+        """Test que verifica que el job de refresh deja las opciones en cache."""
+        scraper = _scraper_opciones()
+        with patch.object(scraper_service, "RegionalScraper", return_value=scraper):
+            res = client.post("/options/refresh")
+            assert res.status_code == 200
+            job_id = res.json()["job_id"]
+            for _ in range(20):
+                asyncio.run(asyncio.sleep(0.05))
+                if client.get(f"/jobs/{job_id}").json()["status"] == "succeeded":
+                    break
+        
+        body = client.get("/options").json()
+        assert body["departamentos"] == ["AREQUIPA", "CUSCO"]
+        assert body["anios"] == ["2026", "2025"]
+
+
+class TestRefrescoAutomatico:
+    """Tests para la lectura de opciones al iniciar la API."""
+    
+    def test_se_cargan_al_iniciar(self):
+        """Test que verifica que las opciones quedan en cache sin llamar a /options/refresh."""
+        with patch.object(scraper_service, "RegionalScraper", return_value=_scraper_opciones()), \
+             TestClient(create_app()) as client:
+            for _ in range(50):
+                res = client.get("/options")
+                if res.status_code == 200:
+                    break
+                time.sleep(0.05)
+        
+        assert res.status_code == 200
+        assert res.json()["departamentos"] == ["AREQUIPA", "CUSCO"]
+    
+    async def test_reintenta_tras_un_fallo(self):
+        """Test que verifica que una lectura fallida se reintenta a los OPTIONS_REFRESH_RETRY segundos."""
+        scraper = _scraper_opciones(RuntimeError("SEACE no responde"))
+        with patch.object(scraper_service, "RegionalScraper", return_value=scraper), \
+             patch.object(scraper_service.BaseConfig, "OPTIONS_REFRESH_RETRY", 0):
+            tarea = asyncio.create_task(scraper_service.mantener_opciones_actualizadas())
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+                if scraper_service.obtener_opciones_cacheadas() is not None:
+                    break
+            tarea.cancel()
+        
+        assert scraper.obtener_opciones.await_count == 2
+        assert scraper_service.obtener_opciones_cacheadas()["anios"] == ["2026", "2025"]
+
+
+class TestValidacionRegional:
+    """Tests para la validación de /scrape/regional contra la cache."""
+    
+    @pytest.fixture
+    def run_regional(self):
+        with patch("app.routers.scrape.run_regional_scrape", new=AsyncMock(return_value=(0, None))) as mock:
+            yield mock
+    
+    def test_departamento_invalido(self, client, run_regional):
+        """Test que verifica 422 inmediato sin lanzar el job."""
+        scraper_service._opciones_cache.set(scraper_service._CLAVE_OPCIONES, OPCIONES)
+        
+        res = client.post("/scrape/regional", json={"departamento": "arequipa", "anio": "2026"})
+        
+        assert res.status_code == 422
+        assert "AREQUIPA" in res.json()["detail"]
+        run_regional.assert_not_called()
+    
+    def test_anio_invalido(self, client, run_regional):
+        """Test que verifica 422 con un año fuera de las opciones."""
+        scraper_service._opciones_cache.set(scraper_service._CLAVE_OPCIONES, OPCIONES)
+        
+        res = client.post("/scrape/regional", json={"departamento": "CUSCO", "anio": "1999"})
+        
+        assert res.status_code == 422
+        assert "2025-2026" in res.json()["detail"]
+    
+    def test_opciones_viejas_siguen_validando(self, client, run_regional):
+        """Test que verifica que pasado SEACE_OPTIONS_CACHE_TTL se valida con las últimas opciones."""
+        scraper_service._opciones_cache.set(scraper_service._CLAVE_OPCIONES, OPCIONES)
+        
+        despues_del_ttl = time.monotonic() + scraper_service.BaseConfig.OPTIONS_CACHE_TTL + 1
+        with patch("src.utils.cache.time.monotonic", return_value=despues_del_ttl):
+            res = client.post("/scrape/regional", json={"departamento": "NARNIA", "anio": "2026"})
+        
+        assert res.status_code == 422
+        run_regional.assert_not_called()
+    
+    def test_sin_cache_no_valida(self, client, run_regional):
+        """Test que verifica que sin opciones en cache el job se crea igual."""
+        res = client.post("/scrape/regional", json={"departamento": "NARNIA", "anio": "2026"})
+        assert res.status_code == 200
@@ -0,0 +1,92 @@
+"""
+Tests para los endpoints de /procesos.
+"""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from src.selectors.regional import COLUMNAS_ESPERADAS
+from src.storage.sqlite_store import ProcesoStore
+
+
+@pytest.fixture
+def client():
+    """Fixture que crea un cliente de prueba."""
+    return TestClient(create_app())
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Almacén aislado con tres procesos."""
+    store = ProcesoStore(str(tmp_path / "seace.db"))
+    store.upsert_procesos(
+        pd.DataFrame(
+            [
+                ["1", "MUNI A", "28/01/2026 10:00", "NOM-1", "", "Obra", "D1", "1,000.00", "Soles", "3"],
+                ["2", "MUNI B", "27/01/2026 10:00", "NOM-2", "", "Bien", "D2", "2,000.00", "Soles", "3"],
+                ["3", "MUNI C", "26/01/2026 10:00", "NOM-3", "", "Obra", "D3", "3,000.00", "Dólares", "3"],
+            ],
+            columns=COLUMNAS_ESPERADAS,
+        ),
+        "CUSCO",
+        "2026",
+    )
+    with patch("app.routers.procesos.proceso_store", store):
+        yield store
+    store.close()
+
+
+class TestProcesosAPI:
+    """Tests para GET /procesos."""
+    
+    def test_filtros_y_fields(self, client, store):
+        """Test que verifica filtros y proyección de columnas."""
+        res = client.get("/procesos", params={"departamento": "cusco", "objeto": "Obra", "fields": "nomenclatura,moneda"})
+        
+        assert res.status_code == 200
+        body = res.json()
+        assert body["total"] == 2
+        assert body["next_cursor"] is None
+        assert body["items"] == [
+            {"nomenclatura": "NOM-1", "moneda": "Soles"},
+            {"nomenclatura": "NOM-3", "moneda": "Dólares"},
+        ]
+    
+    def test_paginacion_con_cursor(self, client, store):
+        """Test que verifica que el cursor continúa donde terminó la página anterior."""
+        primera = client.get("/procesos", params={"limit": 2, "fields": "nomenclatura"}).json()
+        segunda = client.get(
+            "/procesos", params={"limit": 2, "fields": "nomenclatura", "cursor": primera["next_cursor"]}
+        ).json()
+        
+        assert [item["nomenclatura"] for item in primera["items"]] == ["NOM-1", "NOM-2"]
+        assert [item["nomenclatura"] for item in segunda["items"]] == ["NOM-3"]
+        assert segunda["next_cursor"] is None
+    
+    def test_campo_desconocido(self, client, store):
+        """Test que verifica 400 con un campo inexistente."""
+        res = client.get("/procesos", params={"fields": "nomenclatura,password"})
+        assert res.status_code == 400
+
+
+class TestProcesosSearchAPI:
+    """Tests para GET /procesos/search."""
+    
+    def test_search(self, client, store):
+        """Test que verifica resultados rankeados con resaltado."""
+        res = client.get("/procesos/search", params={"q": "d2"})
+        
+        assert res.status_code == 200
+        body = res.json()
+        assert body["total"] == 1
+        assert body["items"][0]["nomenclatura"] == "NOM-2"
+        assert body["items"][0]["descripcion_resaltada"] == "<mark>D2</mark>"
+    
+    def test_search_vacio(self, client, store):
+        """Test que verifica 400 si la consulta no tiene palabras."""
+        res = client.get("/procesos/search", params={"q": '"'})
+        assert res.status_code == 400
@@ -0,0 +1,87 @@
+"""
+Tests para el modo conteo de /scrape/regional.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.services import scraper_service
+
+
+@pytest.fixture
+def client():
+    """Fixture que crea un cliente de prueba."""
+    return TestClient(create_app())
+
+
+def _esperar_job(client, job_id):
+    for _ in range(20):
+        asyncio.run(asyncio.sleep(0.05))
+        data = client.get(f"/jobs/{job_id}/result").json()
+        if data["status"] in {"succeeded", "failed"}:
+            return data
+    return data
+
+
+class TestRegionalCountAPI:
+    """Tests para POST /scrape/regional con modo=count."""
+    
+    def test_modo_count_devuelve_totales(self, client):
+        """Test que verifica que el job de conteo devuelve totales sin csv_path."""
+        conteo = {
+            "total_registros": 1032,
+            "total_paginas": 69,
+            "registros_por_pagina": 15,
+            "consultado_en": "2026-01-28T10:00:00Z",
+            "desde_cache": False,
+        }
+        with patch("app.routers.scrape.run_regional_count", new=AsyncMock(return_value=conteo)), \
+             patch("app.routers.scrape.run_regional_scrape", new=AsyncMock()) as full:
+            res = client.post(
+                "/scrape/regional",
+                json={"departamento": "CUSCO", "anio": "2026", "modo": "count"},
+            )
+            data = _esperar_job(client, res.json()["job_id"])
+        
+        assert data["status"] == "succeeded"
+        assert data["result"]["modo"] == "count"
+        assert data["result"]["total_registros"] == 1032
+        assert "csv_path" not in data["result"]
+        full.assert_not_called()
+    
+    def test_modo_invalido(self, client):
+        """Test que verifica la validación del campo modo."""
+        res = client.post(
+            "/scrape/regional",
+            json={"departamento": "CUSCO", "anio": "2026", "modo": "otro"},
+        )
+        assert res.status_code == 422
+
+
+class TestRegionalCountCache:
+    """Tests para la cache de conteos por departamento/año."""
+    
+    def test_segunda_consulta_sale_de_cache(self):
+        """Test que verifica que el conteo se cachea por (departamento, anio)."""
+        scraper = MagicMock()
+        scraper.contar_procesos = AsyncMock(
+            return_value={"total_registros": 32, "total_paginas": 3, "registros_por_pagina": 15}
+        )
+        contexto = MagicMock()
+        contexto.__aenter__ = AsyncMock(return_value=scraper)
+        contexto.__aexit__ = AsyncMock(return_value=False)
+        
+        scraper_service._conteos_cache.invalidate()
+        with patch("app.services.scraper_service.RegionalScraper", return_value=contexto) as clase:
+            primero = asyncio.run(scraper_service.run_regional_count(departamento="arequipa", anio="2026", debug=False))
+            segundo = asyncio.run(scraper_service.run_regional_count(departamento="AREQUIPA", anio="2026", debug=False))
+        
+        assert primero["desde_cache"] is False
+        assert segundo["desde_cache"] is True
+        assert segundo["total_registros"] == 32
+        assert clase.call_count == 1
+        scraper_service._conteos_cache.invalidate()
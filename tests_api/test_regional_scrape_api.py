@@ -4,14 +4,23 @@ Incluye flujo completo: crear job, verificar status, obtener result y descargar
 """
 
 import asyncio
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
+import pandas as pd
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import create_app
+from app.services import scraper_service
 from app.services.job_manager import job_manager
+from src.scrapers.regional import RegionalScraper
+from src.selectors.regional import COLUMNAS_ESPERADAS
+from src.storage.cdc import RegistroCambios
+from src.storage.publicacion import PublicadorDatasets
+from src.storage.sqlite_store import ProcesoStore
 
 
 @pytest.fixture
@@ -181,6 +190,25 @@ class TestRegionalScrapeAPI:
         assert result_data["result"]["total_registros"] == 2
         assert result_data["result"]["csv_path"] == str(csv_path)
     
+    def test_regional_scrape_output_format_parquet(self, client, mock_regional_scrape):
+        """Test que verifica que output_format=parquet expone parquet_path y no csv_path."""
+        mock, csv_path = mock_regional_scrape
+        
+        job_id = client.post(
+            "/scrape/regional",
+            json={"departamento": "AREQUIPA", "anio": "2026", "output_format": "parquet"},
+        ).json()["job_id"]
+        
+        for _ in range(10):
+            asyncio.run(asyncio.sleep(0.1))
+            if client.get(f"/jobs/{job_id}").json()["status"] == "succeeded":
+                break
+        
+        result = client.get(f"/jobs/{job_id}/result").json()["result"]
+        assert mock.call_args.kwargs["output_format"] == "parquet"
+        assert result["parquet_path"] == str(csv_path.with_suffix(".parquet"))
+        assert "csv_path" not in result
+    
     def test_regional_scrape_download_csv(self, client, mock_regional_scrape):
         """Test que verifica la descarga del CSV generado."""
         mock, csv_path = mock_regional_scrape
@@ -295,3 +323,193 @@ class TestRegionalScrapeAPI:
             assert result_data["status"] == "failed"
             assert result_data["error"] is not None
             assert "Error de scraping" in result_data["error"]
+
+
+class _ScraperFalso:
+    """RegionalScraper mínimo que escribe un CSV de una fila en DATA_OUTPUT_DIR."""
+    
+    def __init__(self, *, config, **kwargs):
+        self.config = config
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *args):
+        return False
+    
+    async def preparar_busqueda(self, departamento, anio):
+        pass
+    
+    async def obtener_todas_las_paginas_por_shards(self, nombre_archivo_csv, concurrencia=None):
+        df = pd.DataFrame(
+            [["1", "MUNI", "28/01/2026 10:00", "NOM-1", "", "Obra", "D", "1.00", "Soles", "3"]],
+            columns=COLUMNAS_ESPERADAS,
+        )
+        df.to_csv(Path(self.config.DATA_OUTPUT_DIR) / nombre_archivo_csv, index=False)
+        return df
+
+
+class TestRunRegionalScrapePublicacion:
+    """Tests para la publicación versionada de run_regional_scrape."""
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = ProcesoStore(str(tmp_path / "seace.db"))
+        yield store
+        store.close()
+    
+    @pytest.fixture
+    def publicador(self, tmp_path, store):
+        publicador = PublicadorDatasets(str(tmp_path))
+        with patch.object(scraper_service, "RegionalScraper", _ScraperFalso), \
+             patch.object(scraper_service, "publicador_datasets", publicador), \
+             patch.object(scraper_service, "proceso_store", store), \
+             patch.object(scraper_service, "registro_cambios"), \
+             patch.object(scraper_service.BaseConfig, "STORE_ENABLED", False):
+            yield publicador
+    
+    def test_publica_version_completa(self, publicador):
+        """Test que verifica que el CSV devuelto está en la versión publicada (LATEST)."""
+        total, csv_path = asyncio.run(
+            scraper_service.run_regional_scrape(
+                departamento="CUSCO", anio="2026", output_csv=None, debug=False, output_format="both"
+            )
+        )
+        
+        csv_path = Path(csv_path)
+        assert total == 1
+        assert csv_path.parent == publicador.dir_latest("CUSCO", "2026")
+        assert {p.name for p in csv_path.parent.iterdir()} >= {
+            "procesos_CUSCO_2026.csv",
+            "procesos_CUSCO_2026.parquet",
+        }
+        assert list(publicador.dir_staging.iterdir()) == []
+    
+    def test_registra_version_en_catalogo(self, publicador, store):
+        """Test que verifica que la versión publicada queda en el catálogo con checksum."""
+        _, csv_path = asyncio.run(
+            scraper_service.run_regional_scrape(
+                departamento="CUSCO", anio="2026", output_csv=None, debug=False, output_format="both"
+            )
+        )
+        
+        entradas = {entrada["formato"]: entrada for entrada in store.listar_datasets(departamento="CUSCO")}
+        assert set(entradas) == {"csv", "csv+gzip", "csv+zstd", "parquet"}
+        assert entradas["csv"]["path"] == csv_path
+        assert entradas["csv"]["filas"] == 1
+        assert entradas["csv"]["bytes"] == Path(csv_path).stat().st_size
+        assert entradas["csv"]["iniciado_en"] <= entradas["csv"]["finalizado_en"]
+    
+    def test_jobs_concurrentes_no_se_pisan(self, publicador):
+        """Test que verifica que dos jobs del mismo dataset publican versiones distintas."""
+        async def dos_jobs():
+            return await asyncio.gather(*[
+                scraper_service.run_regional_scrape(
+                    departamento="CUSCO", anio="2026", output_csv=None, debug=False
+                )
+                for _ in range(2)
+            ])
+        
+        (_, primera), (_, segunda) = asyncio.run(dos_jobs())
+        
+        assert primera != segunda
+        assert Path(primera).exists() and Path(segunda).exists()
+        assert len(publicador.versiones("CUSCO", "2026")) == 2
+
+
+def _procesos(*filas):
+    return pd.DataFrame(
+        [[str(i), "MUNI", fecha, nomenclatura, "", "Obra", "D", "1.00", "Soles", "3"]
+         for i, (nomenclatura, fecha) in enumerate(filas, start=1)],
+        columns=COLUMNAS_ESPERADAS,
+    )
+
+
+class _ScraperIncrementalFalso(RegionalScraper):
+    """RegionalScraper sin navegador: la primera página de SEACE trae un proceso nuevo."""
+    
+    async def __aenter__(self):
+        self._started = True
+        return self
+    
+    async def __aexit__(self, *args):
+        return False
+    
+    async def preparar_busqueda(self, departamento=None, anio=None):
+        pass
+    
+    async def obtener_todas_las_paginas_por_shards(self, nombre_archivo_csv, concurrencia=None):
+        df = _procesos(("NOM-2", "28/01/2026 10:00"), ("NOM-1", "27/01/2026 10:00"))
+        df.to_csv(Path(self.config.DATA_OUTPUT_DIR) / nombre_archivo_csv, index=False, encoding="utf-8-sig")
+        return df
+    
+    async def _extraer_rango_de_paginas(self, pagina_inicio, pagina_fin, csv_path, es_pagina_final=None):
+        pagina = _procesos(("NOM-3", "29/01/2026 10:00"), ("NOM-2", "28/01/2026 10:00"))
+        assert es_pagina_final is not None and not es_pagina_final(pagina)
+        return pagina
+
+
+class TestScrapeRegionalSince:
+    """Tests para /scrape/regional con solo `since` (sin `incremental`)."""
+    
+    @pytest.fixture
+    def entorno(self, tmp_path):
+        store = ProcesoStore(str(tmp_path / "seace.db"))
+        publicador = PublicadorDatasets(str(tmp_path))
+        registro = RegistroCambios(str(tmp_path))
+        with patch.object(scraper_service, "RegionalScraper", _ScraperIncrementalFalso), \
+             patch.object(scraper_service, "proceso_store", store), \
+             patch.object(scraper_service, "publicador_datasets", publicador), \
+             patch.object(scraper_service, "registro_cambios", registro), \
+             patch("app.routers.datasets.registro_cambios", registro), \
+             patch.object(scraper_service.BaseConfig, "STORE_ENABLED", False), \
+             patch.object(scraper_service.BaseConfig, "OPTIONS_AUTO_REFRESH", False), \
+             patch.object(scraper_service.BaseConfig, "DATA_OUTPUT_DIR", str(tmp_path)):
+            yield publicador
+        store.close()
+    
+    def _esperar_job(self, client, job_id):
+        for _ in range(50):
+            body = client.get(f"/jobs/{job_id}/result").json()
+            if body["status"] in {"succeeded", "failed"}:
+                return body
+            time.sleep(0.1)
+        raise AssertionError(f"El job {job_id} no terminó")
+    
+    def test_since_combina_con_la_ultima_version(self, entorno):
+        """Test que verifica que las filas anteriores a `since` se conservan y no aparecen como bajas."""
+        asyncio.run(
+            scraper_service.run_regional_scrape(
+                departamento="CUSCO", anio="2026", output_csv=None, debug=False
+            )
+        )
+        
+        # Con el cliente abierto el loop sigue vivo entre requests y el job puede terminar
+        with TestClient(create_app()) as client:
+            res = client.post(
+                "/scrape/regional",
+                json={"departamento": "CUSCO", "anio": "2026", "since": "2026-01-29T00:00:00Z"},
+            )
+            assert res.status_code == 200
+            body = self._esperar_job(client, res.json()["job_id"])
+            cambios = client.get("/datasets/CUSCO/2026/changes").json()
+        
+        assert body["status"] == "succeeded", body["error"]
+        df = pd.read_csv(body["result"]["csv_path"], encoding="utf-8-sig", dtype=str)
+        assert list(df["Nomenclatura"]) == ["NOM-3", "NOM-2", "NOM-1"]
+        
+        assert cambios["deletes"] == 0
+        assert {c["nomenclatura"] for c in cambios["cambios"]} == {"NOM-1", "NOM-2", "NOM-3"}
+    
+    @pytest.mark.parametrize("modo", [{"since": datetime(2026, 1, 29, tzinfo=timezone.utc)}, {"incremental": True}])
+    def test_sin_dataset_previo_hace_scraping_completo(self, entorno, modo):
+        """Test que verifica que sin versión previa no se publica solo la ventana nueva."""
+        total, csv_path = asyncio.run(
+            scraper_service.run_regional_scrape(
+                departamento="CUSCO", anio="2026", output_csv=None, debug=False, **modo
+            )
+        )
+        
+        df = pd.read_csv(csv_path, encoding="utf-8-sig", dtype=str)
+        assert total == 2
+        assert list(df["Nomenclatura"]) == ["NOM-2", "NOM-1"]